@@ -16,11 +16,10 @@
 
 """Main entrypoint of Vigenere-API."""
 
-from asyncio import new_event_loop
+import sys
 
-from .server import start
+from .cli import main
 
 
 if __name__ == "__main__":
-    loop = new_event_loop()
-    loop.run_until_complete(start())
+    sys.exit(main())
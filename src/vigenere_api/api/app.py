@@ -16,12 +16,28 @@
 
 """Create the application Vigenere-API."""
 
-from blacksheep import Application, Response
+from http import HTTPStatus
+
+from blacksheep import Application, Content, Response
 from blacksheep.server.env import is_development
 from blacksheep.server.responses import redirect
 
+from vigenere_api.models.helpers import shutdown_process_pool
 from vigenere_api.version import get_version, Version
 
+from .helpers import (
+    CompressionMiddleware,
+    job_executor,
+    metrics_registry,
+    MetricsMiddleware,
+    render_metrics,
+)
+from .helpers.compression import (
+    COMPRESSION_LEVEL,
+    COMPRESSION_MIN_SIZE,
+    DECOMPRESSED_MAX_SIZE,
+)
+from .helpers.metrics import METRICS_CONTENT_TYPE
 from .v1.controllers import CaesarController as V1CaesarController
 from .v1.openapi_docs import docs as v1_docs
 from .v2.controllers import CaesarController as V2CaesarController, VigenereController
@@ -34,7 +50,7 @@ application.show_error_details = False
 application.use_cors(
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_origins=["http://127.0.0.1:8080"],
-    allow_headers=["Authorization"],
+    allow_headers=["Authorization", "Content-Encoding"],
     max_age=300,
 )
 # Exclude from coverage because this depends on the env
@@ -42,12 +58,37 @@ if is_development():  # pragma: no cover
     application.debug = True
     application.show_error_details = True
 
+application.middlewares.append(
+    MetricsMiddleware(metrics_registry, application.router),
+)
+application.middlewares.append(
+    CompressionMiddleware(
+        COMPRESSION_MIN_SIZE,
+        COMPRESSION_LEVEL,
+        DECOMPRESSED_MAX_SIZE,
+    ),
+)
 application.register_controllers(
     [V1CaesarController, V2CaesarController, VigenereController],
 )
 v1_docs.bind_app(application)
 v2_docs.bind_app(application)
 
+
+@application.on_stop
+async def stop_workers(_application: Application) -> None:
+    """
+    Stop the workers of the job executor and of the parallel engine.
+
+    Parameters
+    ----------
+    _application : Application
+        The stopped application.
+    """
+    job_executor.shutdown()
+    shutdown_process_pool()
+
+
 get = application.router.get
 
 app_version: Version = get_version()
@@ -69,6 +110,26 @@ async def index() -> Response:
     return redirect(f"/api/v{app_version.major}")
 
 
+@get("/metrics")
+async def metrics() -> Response:
+    """
+    Route handle for the Prometheus metrics.
+
+    The route is not exposed in the OpenAPI documentations,
+    they only show the routes under /api/vX.
+
+    Returns
+    -------
+    metrics
+        Response
+    """
+    return Response(
+        HTTPStatus.OK,
+        None,
+        Content(METRICS_CONTENT_TYPE, render_metrics(metrics_registry)),
+    )
+
+
 def __fallback() -> str:
     """
     Process all requests to bad routes.
@@ -18,4 +18,6 @@ from blacksheep import Application, Response
 
 application: Application
 
+async def stop_workers(_application: Application) -> None: ...
 async def index() -> Response: ...
+async def metrics() -> Response: ...
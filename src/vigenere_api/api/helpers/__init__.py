@@ -16,9 +16,33 @@
 #  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+from .batch import BatchItem, get_batch_size, process_batch
+from .batch_docs import BatchControllerDocs
+from .cache import (
+    get_request_digest,
+    response_cache,
+    ResponseCache,
+    ResponseCacheStatistics,
+    run_cached_operation,
+)
+from .compression import compress, CompressionMiddleware, Encoding, select_encoding
+from .conditional import etag_matches, make_etag, run_conditional_operation
 from .controller import Controller
+from .decrypt_docs import DecryptControllerDocs
+from .executor import ExecutorStatistics, job_executor, JobExecutor, PoolStatistics
+from .fast_json import use_default_json, use_fast_json
+from .metrics import (
+    Histogram,
+    metrics_registry,
+    MetricsMiddleware,
+    MetricsRegistry,
+    render_metrics,
+)
 from .open_api_handler import VigenereAPIOpenAPIHandler
 from .operation_docs import Algorithm, ControllerDocs, Operation
+from .query import get_query_data
+from .query_docs import QueryControllerDocs
+from .stream import stream_vigenere
 
 
 __all__ = [
@@ -27,4 +51,35 @@ __all__ = [
     "ControllerDocs",
     "Operation",
     "Algorithm",
+    "BatchControllerDocs",
+    "QueryControllerDocs",
+    "DecryptControllerDocs",
+    "BatchItem",
+    "process_batch",
+    "get_batch_size",
+    "JobExecutor",
+    "ExecutorStatistics",
+    "PoolStatistics",
+    "job_executor",
+    "use_fast_json",
+    "use_default_json",
+    "ResponseCache",
+    "ResponseCacheStatistics",
+    "response_cache",
+    "run_cached_operation",
+    "get_request_digest",
+    "make_etag",
+    "etag_matches",
+    "run_conditional_operation",
+    "get_query_data",
+    "Encoding",
+    "compress",
+    "select_encoding",
+    "CompressionMiddleware",
+    "Histogram",
+    "MetricsRegistry",
+    "metrics_registry",
+    "MetricsMiddleware",
+    "render_metrics",
+    "stream_vigenere",
 ]
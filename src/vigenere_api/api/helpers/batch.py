@@ -0,0 +1,166 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Process a batch of Caesar or Vigenere items in one request."""
+
+from collections.abc import Sequence
+from typing import Any, final, Final, Optional, Union
+
+from pydantic import StrictInt, StrictStr, ValidationError
+
+from vigenere_api.helpers import get_int_env, Model
+from vigenere_api.models import CaesarData, VigenereData
+
+from .errors import TooLargeBatchError
+from .operation_docs import Operation
+
+
+MAX_BATCH_SIZE: Final = get_int_env("VIGENERE_API_BATCH_MAX_SIZE", 1000)
+"""Maximal number of items in a batch."""
+
+
+BatchItem = dict[str, Any]
+BatchResult = dict[str, Any]
+
+
+@final
+class BatchOperation(Model):
+    """The operation requested by an item of a batch."""
+
+    operation: Operation
+    """The operation to apply on the item."""
+
+
+@final
+class BatchItemResult(Model):
+    """
+    Result of an item of a batch.
+
+    Contains the content and the key if the operation succeeds, else the errors.
+    """
+
+    content: Optional[StrictStr] = None
+    """The ciphered or deciphered content."""
+
+    key: Optional[Union[StrictInt, StrictStr]] = None
+    """The key used to cipher or decipher the content."""
+
+    errors: Optional[list[dict[str, Any]]] = None
+    """The validation errors of the item."""
+
+
+def process_batch(
+    items: Sequence[BatchItem],
+    data_type: Union[type[CaesarData], type[VigenereData]],
+) -> list[BatchResult]:
+    """
+    Apply the operation of each item, an invalid item does not stop the batch.
+
+    Parameters
+    ----------
+    items : Sequence[BatchItem]
+        The items with the keys 'operation', 'content' and 'key'.
+    data_type : Union[type[CaesarData], type[VigenereData]]
+        The model of the algorithm.
+
+    Raises
+    ------
+    TooLargeBatchError
+        Thrown if the batch contains more than MAX_BATCH_SIZE items.
+
+    Returns
+    -------
+    results
+        list[BatchResult]
+        The results in the same order as the items.
+    """
+    if len(items) > MAX_BATCH_SIZE:
+        raise TooLargeBatchError(len(items), MAX_BATCH_SIZE)
+
+    return [_process_item(item, data_type) for item in items]
+
+
+def get_batch_size(items: Sequence[BatchItem]) -> int:
+    """
+    Get the size of the batch job, the total length of the string contents.
+
+    The number of items is checked here, before the batch is sent to a worker.
+
+    Parameters
+    ----------
+    items : Sequence[BatchItem]
+        The items with the keys 'operation', 'content' and 'key'.
+
+    Raises
+    ------
+    TooLargeBatchError
+        Thrown if the batch contains more than MAX_BATCH_SIZE items.
+
+    Returns
+    -------
+    size
+        int
+    """
+    if len(items) > MAX_BATCH_SIZE:
+        raise TooLargeBatchError(len(items), MAX_BATCH_SIZE)
+
+    return sum(
+        len(content)
+        for item in items
+        if isinstance(content := item.get("content"), str)
+    )
+
+
+def _process_item(
+    item: BatchItem,
+    data_type: Union[type[CaesarData], type[VigenereData]],
+) -> BatchResult:
+    """
+    Apply the operation of the item.
+
+    Parameters
+    ----------
+    item : BatchItem
+        The item with the keys 'operation', 'content' and 'key'.
+    data_type : Union[type[CaesarData], type[VigenereData]]
+        The model of the algorithm.
+
+    Returns
+    -------
+    result
+        BatchResult
+        The content and the key, or the validation errors.
+    """
+    fields = dict(item)
+    errors = []
+    operation: Optional[Operation] = None
+    data: Optional[Union[CaesarData, VigenereData]] = None
+
+    try:
+        operation = BatchOperation(operation=fields.pop("operation", None)).operation
+    except ValidationError as error:
+        errors.extend(error.errors())
+
+    try:
+        data = data_type.parse_obj(fields)
+    except ValidationError as error:
+        errors.extend(error.errors())
+
+    if operation is None or data is None:
+        return {"errors": errors}
+
+    result = data.cipher() if operation == Operation.CIPHER else data.decipher()
+    return {"content": result.content, "key": result.key}
@@ -0,0 +1,123 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""The documentation of a batch route."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import final, Union
+
+from blacksheep.server.openapi.common import (
+    ContentInfo,
+    EndpointDocs,
+    RequestBodyInfo,
+    ResponseExample,
+    ResponseInfo,
+)
+
+from vigenere_api.models import CaesarData, VigenereData
+
+from .batch import BatchItemResult, MAX_BATCH_SIZE, process_batch
+from .errors import AlgorithmTypeError, ExamplesTypeError, ExampleTypeError
+from .operation_docs import Algorithm, Operation
+
+
+@final
+@dataclass
+class BatchControllerDocs(EndpointDocs):
+    """Create the documentation of the batch route of an algorithm."""
+
+    def __init__(
+        self,
+        algorithm: Algorithm,
+        data1_examples: Sequence[Union[CaesarData, VigenereData]],
+        data2_examples: Sequence[Union[CaesarData, VigenereData]],
+    ) -> None:
+        """
+        Create a BatchControllerDocs.
+
+        Parameters
+        ----------
+        algorithm : Algorithm
+            The algorithm type.
+        data1_examples : Sequence[Union[CaesarData, VigenereData]]
+            The examples to decipher.
+        data2_examples : Sequence[Union[CaesarData, VigenereData]]
+            The examples to cipher.
+
+        Raises
+        ------
+        AlgorithmTypeError
+            Thrown if 'algorithm' is not an Algorithm object.
+        ExamplesTypeError
+            Thrown if 'data1_examples' or 'data2_examples' is not a Sequence object.
+        ExampleTypeError
+            Thrown if an example is not a CaesarData or VigenereData object.
+        """
+        if not isinstance(algorithm, Algorithm):
+            raise AlgorithmTypeError(algorithm)
+
+        for name, examples in (
+            ("data1_examples", data1_examples),
+            ("data2_examples", data2_examples),
+        ):
+            if not isinstance(examples, Sequence):
+                raise ExamplesTypeError(examples, name)
+
+            for example in examples:
+                if not isinstance(example, (CaesarData, VigenereData)):
+                    raise ExampleTypeError(example, name)
+
+        data_type = VigenereData if algorithm == Algorithm.VIGENERE else CaesarData
+
+        items = [
+            {"operation": Operation.DECIPHER, **data.dict()} for data in data1_examples
+        ]
+        items += [
+            {"operation": Operation.CIPHER, **data.dict()} for data in data2_examples
+        ]
+
+        super().__init__(
+            summary=f"Apply the {algorithm} algorithm to a batch of contents.",
+            description=(
+                "Cipher or decipher each item with its own operation and key."
+                + f" A batch contains at most {MAX_BATCH_SIZE} items."
+                + " The results are in the same order as the items,"
+                + " an invalid item gets its errors without stopping the batch."
+            ),
+            tags=[f"{algorithm}"],
+            request_body=RequestBodyInfo(
+                description="Example of request body.",
+                examples={"example 0": items},
+            ),
+            responses={
+                HTTPStatus.OK: ResponseInfo(
+                    description=f"Success batch with {algorithm} algorithm.",
+                    content=[
+                        ContentInfo(
+                            type=list[BatchItemResult],
+                            examples=[
+                                ResponseExample(
+                                    value=process_batch(items, data_type),
+                                ),
+                            ],
+                        ),
+                    ],
+                ),
+                HTTPStatus.BAD_REQUEST: "Bad request.",
+            },
+        )
@@ -0,0 +1,320 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Cache of the serialized responses of the cipher and decipher routes."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+from http import HTTPStatus
+from threading import Lock
+from time import monotonic
+from typing import final, Final, Optional, Union
+
+from blacksheep import Content, Response
+from blacksheep.server.responses import json
+
+from vigenere_api.helpers import get_int_env
+from vigenere_api.models import CaesarData, VigenereData
+
+from .executor import job_executor
+from .operation_docs import Algorithm, Operation
+
+
+RESPONSE_CACHE_SIZE: Final = get_int_env("VIGENERE_API_RESPONSE_CACHE_SIZE", 67_108_864)
+"""Maximal size, in bytes, of the cached responses, 0 disables the cache."""
+
+RESPONSE_CACHE_TTL: Final = get_int_env("VIGENERE_API_RESPONSE_CACHE_TTL", 300)
+"""Lifetime, in seconds, of a cached response, 0 keeps it until its eviction."""
+
+RESPONSE_CACHE_MAX_CONTENT: Final = get_int_env(
+    "VIGENERE_API_RESPONSE_CACHE_MAX_CONTENT",
+    65_536,
+)
+"""Maximal length of a content to cache its response."""
+
+
+@final
+@dataclass(frozen=True)
+class ResponseCacheStatistics:
+    """Counters of a ResponseCache."""
+
+    hits: int
+    """Number of responses found in the cache."""
+
+    misses: int
+    """Number of cacheable responses not found in the cache."""
+
+    expirations: int
+    """Number of responses removed because they were too old."""
+
+    evictions: int
+    """Number of responses removed to respect the maximal size."""
+
+    entries: int
+    """Number of responses in the cache."""
+
+    size: int
+    """Size, in bytes, of the responses in the cache."""
+
+    max_size: int
+    """Maximal size, in bytes, of the responses in the cache."""
+
+
+def get_request_digest(
+    algorithm: Algorithm,
+    operation: Operation,
+    key: Union[int, str],
+    content: str,
+) -> bytes:
+    """
+    Get the 128 bits hash of the algorithm, the operation, the key and the content.
+
+    Parameters
+    ----------
+    algorithm : Algorithm
+        The algorithm of the route.
+    operation : Operation
+        The operation of the route.
+    key : Union[int, str]
+        The key of the request.
+    content : str
+        The content of the request.
+
+    Returns
+    -------
+    digest
+        bytes
+    """
+    request_hash = blake2b(digest_size=16)
+    request_hash.update(f"{algorithm}\0{operation}\0{key!r}\0".encode())
+    request_hash.update(content.encode("utf-8", "surrogatepass"))
+    return request_hash.digest()
+
+
+@final
+class ResponseCache:
+    """
+    Thread-safe LRU cache of the serialized responses, bounded in bytes.
+
+    The responses are found by the digest of the request.
+
+    Exemples
+    --------
+    >>> cache = ResponseCache(max_size=1024, ttl=60, max_content_size=100)
+    >>> cache_key = get_request_digest(Algorithm.CAESAR, Operation.CIPHER, 1, "Test")
+    >>> cache.put(cache_key, b'{"content":"Uftu","key":1}')
+    >>> cache.get(cache_key)
+    b'{"content":"Uftu","key":1}'
+    >>> cache.statistics.hits
+    1
+    """
+
+    def __init__(self, max_size: int, ttl: int, max_content_size: int) -> None:
+        """
+        Create an empty cache.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximal size, in bytes, of the responses. Zero disables the cache.
+        ttl : int
+            The lifetime, in seconds, of a response. Zero disables the expiration.
+        max_content_size : int
+            The maximal length of a content to cache its response.
+        """
+        self.__max_size: Final = max_size
+        self.__ttl: Final = ttl
+        self.__max_content_size: Final = max_content_size
+        self.__responses: Final[OrderedDict[bytes, tuple[float, bytes]]] = OrderedDict()
+        self.__lock: Final = Lock()
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__expirations = 0
+        self.__evictions = 0
+
+    def accepts(self, content: str) -> bool:
+        """
+        Check if the response of the content can be cached.
+
+        Parameters
+        ----------
+        content : str
+            The content of the request.
+
+        Returns
+        -------
+        accepted
+            bool
+            False if the cache is disabled or if the content is too large.
+        """
+        return self.__max_size > 0 and len(content) <= self.__max_content_size
+
+    def get(self, cache_key: bytes) -> Optional[bytes]:
+        """
+        Get the response, if it is in the cache and not expired.
+
+        Parameters
+        ----------
+        cache_key : bytes
+            The digest of the request.
+
+        Returns
+        -------
+        body
+            Optional[bytes]
+        """
+        with self.__lock:
+            entry = self.__responses.get(cache_key)
+            if entry is None:
+                self.__misses += 1
+                return None
+
+            expiration, body = entry
+            if self.__ttl > 0 and expiration <= monotonic():
+                del self.__responses[cache_key]
+                self.__size -= len(body)
+                self.__expirations += 1
+                self.__misses += 1
+                return None
+
+            self.__responses.move_to_end(cache_key)
+            self.__hits += 1
+            return body
+
+    def put(self, cache_key: bytes, body: bytes) -> None:
+        """
+        Store the response, the least recently used ones are evicted.
+
+        A response larger than the cache is not stored.
+
+        Parameters
+        ----------
+        cache_key : bytes
+            The digest of the request.
+        body : bytes
+            The serialized response.
+        """
+        if len(body) > self.__max_size:
+            return
+
+        with self.__lock:
+            previous_entry = self.__responses.pop(cache_key, None)
+            if previous_entry is not None:
+                self.__size -= len(previous_entry[1])
+
+            self.__responses[cache_key] = (monotonic() + self.__ttl, body)
+            self.__size += len(body)
+
+            while self.__size > self.__max_size:
+                _evicted_key, (_expiration, evicted_body) = self.__responses.popitem(
+                    last=False,
+                )
+                self.__size -= len(evicted_body)
+                self.__evictions += 1
+
+    def clear(self) -> None:
+        """Remove all responses and reset the counters."""
+        with self.__lock:
+            self.__responses.clear()
+            self.__size = 0
+            self.__hits = 0
+            self.__misses = 0
+            self.__expirations = 0
+            self.__evictions = 0
+
+    @property
+    def statistics(self) -> ResponseCacheStatistics:
+        """
+        Get the counters of the cache.
+
+        Returns
+        -------
+        statistics
+            ResponseCacheStatistics
+        """
+        with self.__lock:
+            return ResponseCacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                expirations=self.__expirations,
+                evictions=self.__evictions,
+                entries=len(self.__responses),
+                size=self.__size,
+                max_size=self.__max_size,
+            )
+
+
+response_cache: Final = ResponseCache(
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_MAX_CONTENT,
+)
+"""The cache shared by the cipher and decipher routes."""
+
+
+async def run_cached_operation(
+    algorithm: Algorithm,
+    operation: Operation,
+    data: Union[CaesarData, VigenereData],
+    digest: Optional[bytes] = None,
+) -> Response:
+    """
+    Get the JSON response of the operation, from the cache if possible.
+
+    A response missing from the cache is computed by the job executor,
+    then its serialized body is stored.
+
+    Parameters
+    ----------
+    algorithm : Algorithm
+        The algorithm of the route.
+    operation : Operation
+        The operation of the route.
+    data : Union[CaesarData, VigenereData]
+        The validated request.
+    digest : Optional[bytes]
+        The digest of the request, if it is already computed.
+
+    Returns
+    -------
+    response
+        Response
+    """
+    cache_key: Optional[bytes] = None
+    if response_cache.accepts(data.content):
+        cache_key = digest or get_request_digest(
+            algorithm,
+            operation,
+            data.key,
+            data.content,
+        )
+        if (body := response_cache.get(cache_key)) is not None:
+            return Response(HTTPStatus.OK, None, Content(b"application/json", body))
+
+    result = await job_executor.run(
+        data.cipher if operation == Operation.CIPHER else data.decipher,
+        size=len(data.content),
+        parallel=algorithm == Algorithm.VIGENERE,
+    )
+    response = json(result)
+
+    if cache_key is not None and response.content is not None:
+        response_cache.put(cache_key, response.content.body)
+
+    return response
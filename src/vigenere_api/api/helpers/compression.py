@@ -0,0 +1,639 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Compress the responses and decompress the request bodies."""
+
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterator
+from enum import auto, unique
+from importlib import import_module
+from typing import cast, final, Final, Optional, Protocol
+
+from blacksheep import Content, Request, Response, StreamedContent
+from blacksheep.contents import ASGIContent
+
+from strenum import LowercaseStrEnum
+from vigenere_api.helpers import get_int_env
+
+from .conditional import WEAK_PREFIX
+from .errors import (
+    CorruptedRequestBodyError,
+    TooLargeRequestBodyError,
+    UnsupportedContentEncodingError,
+)
+from .executor import job_executor
+
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    HAS_ZSTANDARD = False
+else:
+    HAS_ZSTANDARD = True
+
+try:
+    # brotli is imported by name, the package does not provide type hints.
+    brotli = import_module("brotli")
+except ImportError:  # pragma: no cover
+    HAS_BROTLI = False
+else:  # pragma: no cover
+    HAS_BROTLI = True
+
+
+COMPRESSION_MIN_SIZE: Final = get_int_env("VIGENERE_API_COMPRESSION_MIN_SIZE", 1024)
+"""Minimal size, in bytes, of a response body to compress it."""
+
+COMPRESSION_LEVEL: Final = get_int_env("VIGENERE_API_COMPRESSION_LEVEL", 6)
+"""Compression level, limited to the maximal level of each encoding, 0 disables it."""
+
+DECOMPRESSED_MAX_SIZE: Final = get_int_env(
+    "VIGENERE_API_DECOMPRESSED_MAX_SIZE",
+    1_073_741_824,
+)
+"""Maximal size, in bytes, of a decompressed request body, 0 disables the limit."""
+
+DECOMPRESSION_CHUNK_SIZE: Final = 65_536
+"""Maximal size of each decompressed chunk of a request body."""
+
+COMPRESSIBLE_TYPES: Final = (b"application/json", b"text/plain")
+"""Types of the compressed responses."""
+
+GZIP_WBITS: Final = 16 + zlib.MAX_WBITS
+"""Window of zlib for the gzip format."""
+
+ANY_ENCODING: Final = b"*"
+"""Accept-Encoding value matching every encoding."""
+
+IDENTITY: Final = b"identity"
+"""Content-Encoding of an uncompressed body."""
+
+QUALITY: Final = b"q"
+"""Name of the quality parameter in Accept-Encoding."""
+
+
+@final
+@unique
+class Encoding(LowercaseStrEnum):
+    """All content encodings of the responses."""
+
+    GZIP = auto()
+    BR = auto()
+    ZSTD = auto()
+
+
+MAX_LEVELS: Final = {Encoding.GZIP: 9, Encoding.BR: 11, Encoding.ZSTD: 22}
+"""Maximal compression level of each encoding."""
+
+AVAILABLE_ENCODINGS: Final = tuple(
+    encoding
+    for encoding, available in (
+        (Encoding.ZSTD, HAS_ZSTANDARD),
+        (Encoding.BR, HAS_BROTLI),
+        (Encoding.GZIP, True),
+    )
+    if available
+)
+"""The installed encodings, from the preferred one."""
+
+
+class _Compressor(Protocol):
+    """Incremental compressor."""
+
+    def compress(self, data: bytes, /) -> bytes:
+        """Compress the next part of the body."""
+
+    def flush(self) -> bytes:
+        """End the compressed body."""
+
+
+@final
+class _BrotliCompressor:  # pragma: no cover
+    """Incremental brotli compressor, with the interface of zlib."""
+
+    def __init__(self, level: int) -> None:
+        """
+        Create the compressor.
+
+        Parameters
+        ----------
+        level : int
+            The quality of brotli.
+        """
+        self.__compressor: Final = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes, /) -> bytes:
+        """
+        Compress the next part of the body.
+
+        Parameters
+        ----------
+        data : bytes
+            The next part of the body.
+
+        Returns
+        -------
+        compressed_data
+            bytes
+        """
+        return bytes(self.__compressor.process(data))
+
+    def flush(self) -> bytes:
+        """
+        End the compressed body.
+
+        Returns
+        -------
+        compressed_data
+            bytes
+        """
+        return bytes(self.__compressor.finish())
+
+
+@final
+class _GzipDecompressor:
+    """Incremental decompressor of a multi-member gzip stream, with a size limit."""
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Create the decompressor.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximal size, in bytes, of the decompressed body, 0 disables the limit.
+        """
+        self.__decompressor = zlib.decompressobj(GZIP_WBITS)
+        self.__max_size: Final = max_size
+        self.__size = 0
+
+    def decompress(self, data: bytes) -> Iterator[bytes]:
+        """
+        Decompress the next part of the body, by chunks.
+
+        Parameters
+        ----------
+        data : bytes
+            The next part of the compressed body.
+
+        Raises
+        ------
+        CorruptedRequestBodyError
+            Thrown if the body is not a gzip stream.
+        TooLargeRequestBodyError
+            Thrown if the decompressed body is larger than the maximal size.
+
+        Yields
+        ------
+        chunk
+            bytes
+        """
+        pending = data
+        while pending:
+            if self.__decompressor.eof:
+                # The next member of a multi-member gzip stream.
+                self.__decompressor = zlib.decompressobj(GZIP_WBITS)
+
+            chunk = self.__decompress_chunk(pending)
+            pending = (
+                self.__decompressor.unused_data
+                if self.__decompressor.eof
+                else self.__decompressor.unconsumed_tail
+            )
+
+            if chunk:
+                yield chunk
+
+    def flush(self) -> Iterator[bytes]:
+        """
+        Get the end of the output kept by the decompressor after the last input.
+
+        Raises
+        ------
+        CorruptedRequestBodyError
+            Thrown if the body is not a complete gzip stream.
+        TooLargeRequestBodyError
+            Thrown if the decompressed body is larger than the maximal size.
+
+        Yields
+        ------
+        chunk
+            bytes
+        """
+        while not self.__decompressor.eof:
+            chunk = self.__decompress_chunk(b"")
+            if not chunk:
+                raise CorruptedRequestBodyError
+
+            yield chunk
+
+    def __decompress_chunk(self, data: bytes) -> bytes:
+        """
+        Decompress at most DECOMPRESSION_CHUNK_SIZE bytes and check the size.
+
+        Parameters
+        ----------
+        data : bytes
+            The compressed data not consumed yet.
+
+        Raises
+        ------
+        CorruptedRequestBodyError
+            Thrown if the body is not a gzip stream.
+        TooLargeRequestBodyError
+            Thrown if the decompressed body is larger than the maximal size.
+
+        Returns
+        -------
+        chunk
+            bytes
+        """
+        try:
+            chunk = self.__decompressor.decompress(data, DECOMPRESSION_CHUNK_SIZE)
+        except zlib.error as error:
+            raise CorruptedRequestBodyError from error
+
+        self.__size += len(chunk)
+        if self.__max_size > 0 and self.__size > self.__max_size:
+            raise TooLargeRequestBodyError(self.__max_size)
+
+        return chunk
+
+
+def _create_compressor(encoding: Encoding, level: int) -> _Compressor:
+    """
+    Create an incremental compressor.
+
+    Parameters
+    ----------
+    encoding : Encoding
+        The content encoding.
+    level : int
+        The compression level, limited to the maximal level of the encoding.
+
+    Returns
+    -------
+    compressor
+        _Compressor
+    """
+    level = min(level, MAX_LEVELS[encoding])
+
+    if encoding == Encoding.ZSTD:
+        return zstandard.ZstdCompressor(level=level).compressobj()
+
+    if encoding == Encoding.BR:  # pragma: no cover
+        return _BrotliCompressor(level)
+
+    return zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+
+
+def compress(body: bytes, encoding: Encoding, level: int) -> bytes:
+    """
+    Compress the body.
+
+    Parameters
+    ----------
+    body : bytes
+        The body to compress.
+    encoding : Encoding
+        The content encoding.
+    level : int
+        The compression level, limited to the maximal level of the encoding.
+
+    Returns
+    -------
+    compressed_body
+        bytes
+    """
+    compressor = _create_compressor(encoding, level)
+    return compressor.compress(body) + compressor.flush()
+
+
+def select_encoding(accept_encoding: bytes) -> Optional[Encoding]:
+    """
+    Select the installed encoding with the best quality in Accept-Encoding.
+
+    At the same quality, zstd is preferred to brotli, and brotli to gzip.
+
+    Parameters
+    ----------
+    accept_encoding : bytes
+        The value of the Accept-Encoding header.
+
+    Returns
+    -------
+    encoding
+        Optional[Encoding]
+        None if the client accepts none of the installed encodings.
+    """
+    qualities: dict[bytes, float] = {}
+    for item in accept_encoding.split(b","):
+        name, *parameters = item.split(b";")
+        quality = 1.0
+        for parameter in parameters:
+            key, _, value = parameter.partition(b"=")
+            if key.strip().lower() == QUALITY:
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[name.strip().lower()] = quality
+
+    default_quality = qualities.get(ANY_ENCODING, 0.0)
+    selected_encoding = None
+    selected_quality = 0.0
+    for encoding in AVAILABLE_ENCODINGS:
+        quality = qualities.get(encoding.encode(), default_quality)
+        if quality > selected_quality:
+            selected_encoding, selected_quality = encoding, quality
+
+    return selected_encoding
+
+
+@final
+class CompressionMiddleware:
+    """
+    Compress the responses and decompress the gzip request bodies.
+
+    The JSON and text responses larger than the minimal size are compressed
+    with the encoding negotiated with Accept-Encoding. The streamed responses
+    are compressed by chunks. A compressed response has a weak ETag,
+    its bytes are not the ones of the strong ETag.
+    """
+
+    def __init__(self, min_size: int, level: int, max_request_size: int) -> None:
+        """
+        Create the middleware.
+
+        Parameters
+        ----------
+        min_size : int
+            The minimal size, in bytes, of a response body to compress it.
+        level : int
+            The compression level, 0 disables the compression of the responses.
+        max_request_size : int
+            The maximal size, in bytes, of a decompressed request body,
+            0 disables the limit.
+        """
+        self.__min_size: Final = min_size
+        self.__level: Final = level
+        self.__max_request_size: Final = max_request_size
+
+    async def __call__(
+        self,
+        request: Request,
+        handler: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        """
+        Decompress the request body, call the handler and compress its response.
+
+        Parameters
+        ----------
+        request : Request
+            The request.
+        handler : Callable[[Request], Awaitable[Response]]
+            The next middleware or the route.
+
+        Raises
+        ------
+        UnsupportedContentEncodingError
+            Thrown if the request body is compressed with another encoding than gzip.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        await self.__decompress_request(request)
+        response = await handler(request)
+        await self.__compress_response(request, response)
+        return response
+
+    async def __decompress_request(self, request: Request) -> None:
+        """
+        Replace the gzip request body with a body decompressed by chunks.
+
+        The compressed body is not read here, each received chunk is decompressed
+        when the handler reads the request body.
+
+        Parameters
+        ----------
+        request : Request
+            The request.
+
+        Raises
+        ------
+        UnsupportedContentEncodingError
+            Thrown if the request body is compressed with another encoding than gzip.
+        """
+        content_encoding = request.get_first_header(b"Content-Encoding")
+        if content_encoding is None:
+            return
+
+        content_encoding = content_encoding.strip().lower()
+        if content_encoding == IDENTITY:
+            request.remove_header(b"Content-Encoding")
+            return
+
+        if content_encoding != Encoding.GZIP.encode():
+            raise UnsupportedContentEncodingError(content_encoding.decode("latin-1"))
+
+        content_type = request.content_type() or b"application/octet-stream"
+        compressed_content = request.content
+
+        request.remove_header(b"Content-Encoding")
+        request.remove_header(b"Content-Length")
+        request.with_content(
+            StreamedContent(
+                content_type,
+                _decompress_chunks(compressed_content, self.__max_request_size),
+            ),
+        )
+
+    async def __compress_response(self, request: Request, response: Response) -> None:
+        """
+        Compress the response body with the encoding accepted by the client.
+
+        Parameters
+        ----------
+        request : Request
+            The request, with the Accept-Encoding headers.
+        response : Response
+            The response to compress.
+        """
+        content = response.content
+        if (
+            content is None
+            or content.type is None
+            or not content.type.startswith(COMPRESSIBLE_TYPES)
+            or response.has_header(b"Content-Encoding")
+            or (
+                not isinstance(content, StreamedContent)
+                and len(content.body) < self.__min_size
+            )
+        ):
+            return
+
+        response.add_header(b"Vary", b"Accept-Encoding")
+
+        encoding = select_encoding(b",".join(request.get_headers(b"Accept-Encoding")))
+        if encoding is None or self.__level == 0:
+            return
+
+        if isinstance(content, StreamedContent):
+            response.with_content(
+                StreamedContent(
+                    content.type,
+                    _compress_chunks(content, encoding, self.__level),
+                ),
+            )
+        else:
+            # zlib, zstandard and brotli release the GIL while compressing,
+            # a thread avoids pickling the body to a process and back.
+            compressed_body = await job_executor.run_in_thread(
+                compress,
+                content.body,
+                encoding,
+                self.__level,
+            )
+            response.with_content(Content(content.type, compressed_body))
+
+        response.set_header(b"Content-Encoding", encoding.encode())
+
+        etag = response.get_first_header(b"ETag")
+        if etag is not None and not etag.startswith(WEAK_PREFIX):
+            response.set_header(b"ETag", WEAK_PREFIX + etag)
+
+
+def _decompress_chunks(
+    compressed_content: Optional[Content],
+    max_size: int,
+) -> Callable[[], AsyncIterator[bytes]]:
+    """
+    Create the provider of the decompressed chunks of a gzip request body.
+
+    Parameters
+    ----------
+    compressed_content : Optional[Content]
+        The gzip request body, streamed from the client.
+    max_size : int
+        The maximal size, in bytes, of the decompressed body, 0 disables the limit.
+
+    Returns
+    -------
+    data_provider
+        Callable[[], AsyncIterator[bytes]]
+    """
+
+    async def _decompressed_chunks() -> AsyncIterator[bytes]:
+        """
+        Decompress each received chunk, to check the size while the body grows.
+
+        Raises
+        ------
+        CorruptedRequestBodyError
+            Thrown if the body is not a complete gzip stream.
+        TooLargeRequestBodyError
+            Thrown if the decompressed body is larger than the maximal size.
+
+        Yields
+        ------
+        chunk
+            bytes
+        """
+        decompressor = _GzipDecompressor(max_size)
+        async for compressed_chunk in _stream_body(compressed_content):
+            for chunk in decompressor.decompress(compressed_chunk):
+                yield chunk
+
+        for chunk in decompressor.flush():
+            yield chunk
+
+    return _decompressed_chunks
+
+
+async def _stream_body(content: Optional[Content]) -> AsyncIterator[bytes]:
+    """
+    Stream the received chunks of a request body, or its body if already read.
+
+    Parameters
+    ----------
+    content : Optional[Content]
+        The request body.
+
+    Yields
+    ------
+    chunk
+        bytes
+    """
+    if content is None:
+        return
+
+    if isinstance(content, StreamedContent):
+        chunks: AsyncIterable[bytes] = content.generator()
+    elif isinstance(content, ASGIContent) and content.length < 0:
+        # A received body not read yet has no length.
+        chunks = cast(AsyncIterable[bytes], content.stream())
+    else:
+        yield content.body
+        return
+
+    async for chunk in chunks:
+        yield chunk
+
+
+def _compress_chunks(
+    content: StreamedContent,
+    encoding: Encoding,
+    level: int,
+) -> Callable[[], AsyncIterator[bytes]]:
+    """
+    Create the provider of the compressed chunks of a streamed content.
+
+    Parameters
+    ----------
+    content : StreamedContent
+        The streamed content to compress.
+    encoding : Encoding
+        The content encoding.
+    level : int
+        The compression level.
+
+    Returns
+    -------
+    data_provider
+        Callable[[], AsyncIterator[bytes]]
+    """
+
+    async def _compressed_chunks() -> AsyncIterator[bytes]:
+        """
+        Compress each chunk of the content.
+
+        Yields
+        ------
+        compressed_chunk
+            bytes
+        """
+        compressor = _create_compressor(encoding, level)
+        async for chunk in content.generator():
+            compressed_chunk = compressor.compress(chunk)
+            if compressed_chunk:
+                yield compressed_chunk
+
+        yield compressor.flush()
+
+    return _compressed_chunks
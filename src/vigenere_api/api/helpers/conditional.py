@@ -0,0 +1,131 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Conditional requests, with ETag and If-None-Match, on the cipher routes."""
+
+from http import HTTPStatus
+from typing import Final, Union
+
+from blacksheep import Request, Response
+
+from vigenere_api.helpers import get_int_env
+from vigenere_api.models import CaesarData, VigenereData
+
+from .cache import get_request_digest, run_cached_operation
+from .operation_docs import Algorithm, Operation
+
+
+CACHE_MAX_AGE: Final = get_int_env("VIGENERE_API_CACHE_MAX_AGE", 86_400)
+"""Number of seconds a client or a proxy can reuse a response."""
+
+CACHE_CONTROL: Final = f"public, max-age={CACHE_MAX_AGE}".encode()
+"""Value of the Cache-Control header of the cipher and decipher responses."""
+
+ANY_ETAG: Final = b"*"
+"""If-None-Match value matching every ETag."""
+
+WEAK_PREFIX: Final = b"W/"
+"""Prefix of a weak ETag."""
+
+
+def make_etag(digest: bytes) -> bytes:
+    """
+    Get the strong ETag of the response from the digest of the request.
+
+    Parameters
+    ----------
+    digest : bytes
+        The digest of the request.
+
+    Returns
+    -------
+    etag
+        bytes
+    """
+    return b'"' + digest.hex().encode() + b'"'
+
+
+def etag_matches(if_none_match: bytes, etag: bytes) -> bool:
+    """
+    Check if the If-None-Match header contains the ETag.
+
+    The ETags are compared with the weak comparison, like HTTP requires
+    for If-None-Match.
+
+    Parameters
+    ----------
+    if_none_match : bytes
+        The value of the If-None-Match header, a list of ETags or '*'.
+    etag : bytes
+        The ETag of the response.
+
+    Returns
+    -------
+    matches
+        bool
+    """
+    if if_none_match.strip() == ANY_ETAG:
+        return True
+
+    return any(
+        candidate.strip().removeprefix(WEAK_PREFIX) == etag
+        for candidate in if_none_match.split(b",")
+    )
+
+
+async def run_conditional_operation(
+    request: Request,
+    algorithm: Algorithm,
+    operation: Operation,
+    data: Union[CaesarData, VigenereData],
+) -> Response:
+    """
+    Get the JSON response of the operation with its ETag and Cache-Control.
+
+    The operation is not applied if the client already has the response,
+    the response is then '304 Not Modified' without body.
+
+    Parameters
+    ----------
+    request : Request
+        The request, with the If-None-Match headers.
+    algorithm : Algorithm
+        The algorithm of the route.
+    operation : Operation
+        The operation of the route.
+    data : Union[CaesarData, VigenereData]
+        The validated request.
+
+    Returns
+    -------
+    response
+        Response
+    """
+    digest = get_request_digest(algorithm, operation, data.key, data.content)
+    etag = make_etag(digest)
+
+    if any(
+        etag_matches(if_none_match, etag)
+        for if_none_match in request.get_headers(b"If-None-Match")
+    ):
+        response = Response(HTTPStatus.NOT_MODIFIED, None, None)
+    else:
+        response = await run_cached_operation(algorithm, operation, data, digest)
+
+    response.set_header(b"ETag", etag)
+    response.set_header(b"Cache-Control", CACHE_CONTROL)
+    return response
@@ -0,0 +1,131 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""The documentation of a decrypt route."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import final, Final, Union
+
+from blacksheep.server.openapi.common import (
+    ContentInfo,
+    EndpointDocs,
+    RequestBodyInfo,
+    ResponseExample,
+    ResponseInfo,
+)
+
+from vigenere_api.models import (
+    CaesarDecryptData,
+    CaesarDecryptResult,
+    VigenereDecryptData,
+    VigenereDecryptResult,
+)
+
+from .errors import AlgorithmTypeError
+from .operation_docs import Algorithm
+
+
+LANGUAGE_DESCRIPTION: Final = (
+    " The optional 'language' of the content, 'en' (default), 'fr' or 'de',"
+    + " sets the letter frequencies."
+)
+"""Description of the language of a content to decrypt."""
+
+DECRYPT_DESCRIPTIONS: Final = {
+    Algorithm.CAESAR: (
+        "Find the key without knowing it, with the frequencies of the letters."
+        + " The keys are ranked by the chi-squared statistic between"
+        + " the deciphered letters and the English letters, lower is better."
+        + " A large content is analysed on a sample."
+        + LANGUAGE_DESCRIPTION
+    ),
+    Algorithm.VIGENERE: (
+        "Find the key without knowing it, and decipher the content."
+        + " The lengths are ranked by the index of coincidence of the letters"
+        + " of each key position, higher is better."
+        + " Among the close indexes, the lengths dividing the distances between"
+        + " the repeated trigrams and tetragrams (Kasiski examination) come first."
+        + " Each key position is solved as a Caesar content, and the keys are ranked"
+        + " by the chi-squared statistic of the deciphered letters plus a penalty"
+        + " by key letter, lower is better."
+        + " A large content is analysed on its beginning."
+        + LANGUAGE_DESCRIPTION
+    ),
+}
+"""Description of the decrypt route of each algorithm."""
+
+
+@final
+@dataclass
+class DecryptControllerDocs(EndpointDocs):
+    """Create the documentation of the decrypt route of an algorithm."""
+
+    def __init__(
+        self,
+        algorithm: Algorithm,
+        examples: Sequence[Union[CaesarDecryptData, VigenereDecryptData]],
+    ) -> None:
+        """
+        Create a DecryptControllerDocs.
+
+        Parameters
+        ----------
+        algorithm : Algorithm
+            The algorithm type.
+        examples : Sequence[Union[CaesarDecryptData, VigenereDecryptData]]
+            The ciphered contents to decrypt.
+
+        Raises
+        ------
+        AlgorithmTypeError
+            Thrown if 'algorithm' is not an Algorithm object.
+        """
+        if not isinstance(algorithm, Algorithm):
+            raise AlgorithmTypeError(algorithm)
+
+        response_type = (
+            VigenereDecryptResult
+            if algorithm == Algorithm.VIGENERE
+            else CaesarDecryptResult
+        )
+
+        super().__init__(
+            summary=f"Decrypt a content ciphered with the {algorithm} algorithm.",
+            description=DECRYPT_DESCRIPTIONS[algorithm],
+            tags=[f"{algorithm}"],
+            request_body=RequestBodyInfo(
+                description="Examples of requests body.",
+                examples={f"example {i}": data for i, data in enumerate(examples)},
+            ),
+            responses={
+                HTTPStatus.OK: ResponseInfo(
+                    description=f"Success decrypt with {algorithm} algorithm.",
+                    content=[
+                        ContentInfo(
+                            type=response_type,
+                            examples=[
+                                ResponseExample(value=data.decrypt())
+                                for data in examples
+                            ],
+                        ),
+                    ],
+                ),
+                HTTPStatus.BAD_REQUEST: "Bad request.",
+            },
+        )
@@ -17,8 +17,11 @@
 """All errors used by utils."""
 
 from collections.abc import Collection
+from http import HTTPStatus
 from typing import Any, final
 
+from blacksheep.exceptions import BadRequest, HTTPException
+
 from vigenere_api.helpers import VigenereAPITypeError
 
 
@@ -114,3 +117,62 @@ class ExampleTypeError(TypeError):
             f"An example is a '{cls_name}' in {name}."
             + " Please give a Sequence of CaesarData or VigenereData.",
         )
+
+
+@final
+class TooLargeBatchError(BadRequest):
+    """Thrown if a batch contains too many items."""
+
+    def __init__(self, size: int, max_size: int) -> None:
+        """Create a new TooLargeBatchError."""
+        super().__init__(
+            f"The batch contains '{size}' items."
+            + f" Please give at most '{max_size}' items.",
+        )
+
+
+@final
+class TooLongQueryContentError(BadRequest):
+    """Thrown if the content of a query string is too long."""
+
+    def __init__(self, length: int, max_length: int) -> None:
+        """Create a new TooLongQueryContentError."""
+        super().__init__(
+            f"The content contains '{length}' characters."
+            + f" Please give at most '{max_length}' characters,"
+            + " or use the POST method.",
+        )
+
+
+@final
+class UnsupportedContentEncodingError(HTTPException):
+    """Thrown if a request body is compressed with an unsupported encoding."""
+
+    def __init__(self, encoding: str) -> None:
+        """Create a new UnsupportedContentEncodingError."""
+        super().__init__(
+            HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+            f"The request body is encoded with '{encoding}'."
+            + " Please send it uncompressed or compressed with 'gzip'.",
+        )
+
+
+@final
+class CorruptedRequestBodyError(BadRequest):
+    """Thrown if a gzip request body can not be decompressed."""
+
+    def __init__(self) -> None:
+        """Create a new CorruptedRequestBodyError."""
+        super().__init__("The request body is not a valid gzip stream.")
+
+
+@final
+class TooLargeRequestBodyError(HTTPException):
+    """Thrown if a decompressed request body is too large."""
+
+    def __init__(self, max_size: int) -> None:
+        """Create a new TooLargeRequestBodyError."""
+        super().__init__(
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            f"The decompressed request body is larger than '{max_size}' bytes.",
+        )
@@ -0,0 +1,372 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Run the CPU-bound jobs of the controllers outside of the event loop."""
+
+import os
+from asyncio import get_running_loop
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from threading import Lock
+from time import perf_counter
+from typing import Any, final, Final, Optional, TypeVar
+
+from vigenere_api.helpers import get_int_env, get_process_context
+from vigenere_api.models.helpers import disable_parallel_engine, uses_parallel_engine
+
+
+PROCESS_THRESHOLD: Final = get_int_env("VIGENERE_API_PROCESS_THRESHOLD", 1_048_576)
+"""Minimal size of a job to run it in the process pool."""
+
+THREAD_WORKERS: Final = get_int_env(
+    "VIGENERE_API_THREAD_WORKERS",
+    min(32, (os.cpu_count() or 1) + 4),
+)
+"""Number of threads running the small jobs, 0 runs them in the event loop."""
+
+PROCESS_WORKERS: Final = get_int_env(
+    "VIGENERE_API_PROCESS_WORKERS",
+    os.cpu_count() or 1,
+)
+"""Number of processes running the large jobs, 0 runs them in the threads."""
+
+
+Result = TypeVar("Result")
+
+
+@final
+@dataclass(frozen=True)
+class PoolStatistics:
+    """Counters of a pool of workers."""
+
+    queue_depth: int
+    """Number of jobs submitted and not finished."""
+
+    submitted: int
+    """Number of jobs submitted since the start."""
+
+    completed: int
+    """Number of jobs finished since the start."""
+
+    total_wait_time: float
+    """Sum of the times, in seconds, the finished jobs waited for a worker."""
+
+    max_wait_time: float
+    """Longest time, in seconds, a finished job waited for a worker."""
+
+    total_run_time: float
+    """Sum of the times, in seconds, the finished jobs ran in a worker."""
+
+    @property
+    def mean_wait_time(self) -> float:
+        """
+        Get the mean time, in seconds, a finished job waited for a worker.
+
+        Returns
+        -------
+        mean_wait_time
+            float
+        """
+        if self.completed == 0:
+            return 0.0
+
+        return self.total_wait_time / self.completed
+
+
+@final
+@dataclass(frozen=True)
+class ExecutorStatistics:
+    """Counters of a JobExecutor."""
+
+    thread: PoolStatistics
+    """Counters of the thread pool, running the small jobs."""
+
+    process: PoolStatistics
+    """Counters of the process pool, running the large jobs."""
+
+
+def _timed_call(
+    function: Callable[..., Result],
+    *args: Any,
+) -> tuple[float, Result]:
+    """
+    Call the function and measure its duration, in the worker.
+
+    Parameters
+    ----------
+    function : Callable[..., Result]
+        The job.
+    *args : Any
+        The arguments of the job.
+
+    Returns
+    -------
+    duration_and_result
+        tuple[float, Result]
+    """
+    start = perf_counter()
+    result = function(*args)
+
+    return perf_counter() - start, result
+
+
+@final
+class _Pool:
+    """A pool of workers with its counters."""
+
+    def __init__(self, executor: Optional[Executor]) -> None:
+        """
+        Create a pool around the executor.
+
+        Parameters
+        ----------
+        executor : Optional[Executor]
+            The executor, None runs the jobs in the event loop.
+        """
+        self.__executor: Final = executor
+        self.__lock: Final = Lock()
+        self.__queue_depth = 0
+        self.__submitted = 0
+        self.__completed = 0
+        self.__total_wait_time = 0.0
+        self.__max_wait_time = 0.0
+        self.__total_run_time = 0.0
+
+    @property
+    def statistics(self) -> PoolStatistics:
+        """
+        Get a snapshot of the counters.
+
+        Returns
+        -------
+        statistics
+            PoolStatistics
+        """
+        with self.__lock:
+            return PoolStatistics(
+                queue_depth=self.__queue_depth,
+                submitted=self.__submitted,
+                completed=self.__completed,
+                total_wait_time=self.__total_wait_time,
+                max_wait_time=self.__max_wait_time,
+                total_run_time=self.__total_run_time,
+            )
+
+    async def run(
+        self,
+        function: Callable[..., Result],
+        *args: Any,
+    ) -> Result:
+        """
+        Run the job in a worker and wait for its result.
+
+        The wait time is the time to get the result minus the duration of the job.
+
+        Parameters
+        ----------
+        function : Callable[..., Result]
+            The job.
+        *args : Any
+            The arguments of the job.
+
+        Returns
+        -------
+        result
+            Result
+        """
+        with self.__lock:
+            self.__queue_depth += 1
+            self.__submitted += 1
+
+        start = perf_counter()
+        try:
+            if self.__executor is None:
+                duration, result = _timed_call(function, *args)
+            else:
+                duration, result = await get_running_loop().run_in_executor(
+                    self.__executor,
+                    partial(_timed_call, function, *args),
+                )
+        finally:
+            wait_time = max(perf_counter() - start, 0.0)
+            with self.__lock:
+                self.__queue_depth -= 1
+
+        wait_time = max(wait_time - duration, 0.0)
+        with self.__lock:
+            self.__completed += 1
+            self.__total_wait_time += wait_time
+            self.__max_wait_time = max(self.__max_wait_time, wait_time)
+            self.__total_run_time += duration
+
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the workers, without waiting for the running jobs."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+
+
+@final
+class JobExecutor:
+    """
+    Run the jobs in a thread pool or in a process pool, chosen by their size.
+
+    Small jobs run in threads, the event loop stays free to accept requests.
+    Large jobs run in processes, they do not hold the GIL of the event loop.
+    A job in the process pool and its result must be picklable.
+    The processes disable the parallel engine, they do not start their own processes.
+    So a job using the parallel engine on a text of at least PARALLEL_THRESHOLD
+    runs in a thread, the engine splits the text between its own processes.
+
+    Exemples
+    --------
+    >>> import asyncio
+    >>> executor = JobExecutor(100, thread_workers=1, process_workers=0)
+    >>> asyncio.run(executor.run(sum, [1, 2, 3], size=3))
+    6
+    >>> executor.statistics.thread.completed
+    1
+    >>> executor.shutdown()
+    """
+
+    def __init__(
+        self,
+        process_threshold: int,
+        thread_workers: int,
+        process_workers: int,
+    ) -> None:
+        """
+        Create the executor, the workers are started with the first jobs.
+
+        Parameters
+        ----------
+        process_threshold : int
+            The minimal size of a job to run it in the process pool.
+        thread_workers : int
+            The number of threads, 0 runs the small jobs in the event loop.
+        process_workers : int
+            The number of processes, 0 runs the large jobs like the small jobs.
+        """
+        self.__process_threshold: Final = process_threshold
+        self.__thread_pool: Final = _Pool(
+            (
+                ThreadPoolExecutor(thread_workers, "vigenere-api-job")
+                if thread_workers > 0
+                else None
+            ),
+        )
+        self.__process_pool: Final = (
+            _Pool(
+                ProcessPoolExecutor(
+                    process_workers,
+                    mp_context=get_process_context(),
+                    initializer=disable_parallel_engine,
+                ),
+            )
+            if process_workers > 0
+            else None
+        )
+
+    @property
+    def statistics(self) -> ExecutorStatistics:
+        """
+        Get a snapshot of the counters of both pools.
+
+        Returns
+        -------
+        statistics
+            ExecutorStatistics
+        """
+        thread_statistics = self.__thread_pool.statistics
+        process_statistics = PoolStatistics(0, 0, 0, 0.0, 0.0, 0.0)
+        if self.__process_pool is not None:
+            process_statistics = self.__process_pool.statistics
+
+        return ExecutorStatistics(thread=thread_statistics, process=process_statistics)
+
+    async def run(
+        self,
+        function: Callable[..., Result],
+        *args: Any,
+        size: int,
+        parallel: bool = False,
+    ) -> Result:
+        """
+        Run the job in the pool chosen by its size and wait for its result.
+
+        Parameters
+        ----------
+        function : Callable[..., Result]
+            The job.
+        *args : Any
+            The arguments of the job.
+        size : int
+            The size of the job, like the length of the content.
+        parallel : bool, default False
+            True if the job moves the content with the Vigenere engines,
+            which split a large content between their own processes.
+
+        Returns
+        -------
+        result
+            Result
+        """
+        if (
+            self.__process_pool is not None
+            and size >= self.__process_threshold
+            and not (parallel and uses_parallel_engine(size))
+        ):
+            return await self.__process_pool.run(function, *args)
+
+        return await self.__thread_pool.run(function, *args)
+
+    async def run_in_thread(
+        self,
+        function: Callable[..., Result],
+        *args: Any,
+    ) -> Result:
+        """
+        Run the job in the thread pool, whatever its size, and wait for its result.
+
+        It is meant for jobs releasing the GIL, like the compression of a body,
+        which would only pay for the pickling of their data in a process.
+
+        Parameters
+        ----------
+        function : Callable[..., Result]
+            The job.
+        *args : Any
+            The arguments of the job.
+
+        Returns
+        -------
+        result
+            Result
+        """
+        return await self.__thread_pool.run(function, *args)
+
+    def shutdown(self) -> None:
+        """Stop the workers of both pools, without waiting for the running jobs."""
+        self.__thread_pool.shutdown()
+        if self.__process_pool is not None:
+            self.__process_pool.shutdown()
+
+
+job_executor: Final = JobExecutor(PROCESS_THRESHOLD, THREAD_WORKERS, PROCESS_WORKERS)
+"""The executor shared by the controllers."""
@@ -0,0 +1,129 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Plug the fast JSON codec orjson into blacksheep, if it is installed."""
+
+import json
+from collections.abc import Callable
+from typing import Any, cast, Final
+
+from blacksheep.plugins import json as json_plugin
+from blacksheep.plugins.json import default_json_dumps
+from pydantic import BaseModel
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+
+# The JSON plugin of blacksheep is not annotated.
+_use_json_codec: Final = cast(Callable[..., None], json_plugin.use)
+_default_dumps: Final = cast(Callable[[Any], str], default_json_dumps)
+
+
+def _default(obj: Any) -> Any:
+    """
+    Convert the objects unknown by orjson.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialize.
+
+    Raises
+    ------
+    TypeError
+        Thrown if the object is not a pydantic model.
+
+    Returns
+    -------
+    serializable_obj
+        Any
+    """
+    if isinstance(obj, BaseModel):
+        return obj.dict()
+
+    raise TypeError
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize the object with orjson, or with the default serializer if it fails.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialize.
+
+    Returns
+    -------
+    text
+        str
+    """
+    try:
+        return orjson.dumps(obj, default=_default).decode("utf-8")
+    except orjson.JSONEncodeError:
+        return _default_dumps(obj)
+
+
+def _loads(text: str) -> Any:
+    """
+    Deserialize the text with orjson, or with the json module if it fails.
+
+    The json module accepts lone surrogates and raises the usual errors.
+
+    Parameters
+    ----------
+    text : str
+        The JSON text.
+
+    Returns
+    -------
+    obj
+        Any
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+def use_fast_json() -> bool:
+    """
+    Use orjson to parse the JSON bodies and to serialize the JSON responses.
+
+    Without orjson, the default codec of blacksheep is kept.
+
+    Returns
+    -------
+    enabled
+        bool
+        True if orjson is used.
+    """
+    if not HAS_ORJSON:  # pragma: no cover
+        return False
+
+    _use_json_codec(loads=_loads, dumps=_dumps)
+    return True
+
+
+def use_default_json() -> None:
+    """Use the default JSON codec of blacksheep."""
+    _use_json_codec()
@@ -0,0 +1,766 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Measure the requests and expose the counters in the Prometheus text format."""
+
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from http import HTTPStatus
+from time import perf_counter
+from typing import final, Final, Optional, Union
+
+from blacksheep import Request, Response
+from blacksheep.server.routing import Router
+
+from vigenere_api.models.helpers import engine_timer, vigenere_key_cache
+
+from .cache import response_cache
+from .executor import job_executor
+
+
+METRICS_CONTENT_TYPE: Final = b"text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the Prometheus text format."""
+
+LATENCY_BUCKETS: Final = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Upper bounds, in seconds, of the latency histograms."""
+
+SIZE_BUCKETS: Final = (
+    64,
+    256,
+    1024,
+    4096,
+    16_384,
+    65_536,
+    262_144,
+    1_048_576,
+    4_194_304,
+    16_777_216,
+    67_108_864,
+)
+"""Upper bounds, in bytes, of the payload size histograms."""
+
+ROUTE_LABELS: Final = ("version", "algorithm", "operation")
+"""Names of the labels of the route metrics."""
+
+MIN_ROUTE_PARTS: Final = 5
+"""Number of parts of the shortest route path: /api/version/algorithm/operation."""
+
+API_PREFIX: Final = "api"
+"""First part of the algorithm route paths."""
+
+MIN_ERROR_STATUS: Final = 400
+"""First status of the error responses."""
+
+OTHER_ROUTE_LABELS: Final = ("other", "other", "other")
+"""Labels of the requests to paths without registered route, like the 404 errors."""
+
+EXECUTOR_FAMILIES: Final = (
+    (
+        "vigenere_api_jobs_queue_depth",
+        "gauge",
+        "queue_depth",
+        "Number of jobs submitted and not finished.",
+    ),
+    (
+        "vigenere_api_jobs_submitted_total",
+        "counter",
+        "submitted",
+        "Number of jobs submitted.",
+    ),
+    (
+        "vigenere_api_jobs_completed_total",
+        "counter",
+        "completed",
+        "Number of jobs finished.",
+    ),
+    (
+        "vigenere_api_jobs_wait_seconds_total",
+        "counter",
+        "total_wait_time",
+        "Time the finished jobs waited for a worker.",
+    ),
+    (
+        "vigenere_api_jobs_wait_seconds_max",
+        "gauge",
+        "max_wait_time",
+        "Longest time a finished job waited for a worker.",
+    ),
+    (
+        "vigenere_api_jobs_run_seconds_total",
+        "counter",
+        "total_run_time",
+        "Time the finished jobs ran in a worker.",
+    ),
+)
+"""Name, type, statistic and help of the families of each pool of the job executor."""
+
+RESPONSE_CACHE_FAMILIES: Final = (
+    ("vigenere_api_response_cache_hits_total", "counter", "hits", "Responses found."),
+    (
+        "vigenere_api_response_cache_misses_total",
+        "counter",
+        "misses",
+        "Responses not found.",
+    ),
+    (
+        "vigenere_api_response_cache_expirations_total",
+        "counter",
+        "expirations",
+        "Responses removed because they were too old.",
+    ),
+    (
+        "vigenere_api_response_cache_evictions_total",
+        "counter",
+        "evictions",
+        "Responses removed to respect the maximal size.",
+    ),
+    (
+        "vigenere_api_response_cache_entries",
+        "gauge",
+        "entries",
+        "Responses in the cache.",
+    ),
+    (
+        "vigenere_api_response_cache_size_bytes",
+        "gauge",
+        "size",
+        "Size of the responses.",
+    ),
+    (
+        "vigenere_api_response_cache_max_size_bytes",
+        "gauge",
+        "max_size",
+        "Maximal size of the responses.",
+    ),
+)
+"""Name, type, statistic and help of the families of the response cache."""
+
+KEY_CACHE_FAMILIES: Final = (
+    ("vigenere_api_key_cache_hits_total", "counter", "hits", "Vigenere keys found."),
+    (
+        "vigenere_api_key_cache_misses_total",
+        "counter",
+        "misses",
+        "Vigenere keys compiled.",
+    ),
+    (
+        "vigenere_api_key_cache_evictions_total",
+        "counter",
+        "evictions",
+        "Vigenere keys removed to respect the maximal size.",
+    ),
+    ("vigenere_api_key_cache_size", "gauge", "size", "Vigenere keys in the cache."),
+    ("vigenere_api_key_cache_max_size", "gauge", "max_size", "Maximal number of keys."),
+)
+"""Name, type, statistic and help of the families of the Vigenere key cache."""
+
+ENGINE_FAMILIES: Final = (
+    (
+        "vigenere_api_engine_calls_total",
+        "counter",
+        "calls",
+        "Number of texts moved by the engine in the main process.",
+    ),
+    (
+        "vigenere_api_engine_characters_total",
+        "counter",
+        "characters",
+        "Number of characters or bytes moved by the engine in the main process.",
+    ),
+    (
+        "vigenere_api_engine_seconds_total",
+        "counter",
+        "total_time",
+        "Time spent in the engine in the main process.",
+    ),
+)
+"""Name, type, statistic and help of the families of each engine."""
+
+RouteLabels = tuple[str, str, str]
+"""Values of the version, the algorithm and the operation of a route."""
+
+Number = Union[int, float]
+
+
+@final
+class Histogram:
+    """
+    Cumulative histogram with fixed bucket upper bounds.
+
+    Exemples
+    --------
+    >>> histogram = Histogram((1, 10))
+    >>> histogram.observe(5)
+    >>> histogram.observe(50)
+    >>> histogram.cumulative_counts
+    (0, 1, 2)
+    >>> histogram.total
+    55
+    """
+
+    def __init__(self, buckets: Sequence[Number]) -> None:
+        """
+        Create an empty histogram.
+
+        Parameters
+        ----------
+        buckets : Sequence[Number]
+            The sorted upper bounds of the buckets, the +Inf bucket is added.
+        """
+        self.__buckets: Final = tuple(buckets)
+        self.__counts: Final = [0] * (len(self.__buckets) + 1)
+        self.__sum: Number = 0
+
+    @property
+    def buckets(self) -> tuple[Number, ...]:
+        """
+        Get the upper bounds of the buckets, without the +Inf bucket.
+
+        Returns
+        -------
+        buckets
+            tuple[Number, ...]
+        """
+        return self.__buckets
+
+    @property
+    def cumulative_counts(self) -> tuple[int, ...]:
+        """
+        Get the number of observations lower or equal to each upper bound.
+
+        The last count is the one of the +Inf bucket, the number of observations.
+
+        Returns
+        -------
+        cumulative_counts
+            tuple[int, ...]
+        """
+        counts = []
+        total = 0
+        for count in self.__counts:
+            total += count
+            counts.append(total)
+
+        return tuple(counts)
+
+    @property
+    def total(self) -> Number:
+        """
+        Get the sum of the observations.
+
+        Returns
+        -------
+        total
+            Number
+        """
+        return self.__sum
+
+    def observe(self, value: Number) -> None:
+        """
+        Add an observation.
+
+        Parameters
+        ----------
+        value : Number
+            The observed value.
+        """
+        self.__counts[bisect_left(self.__buckets, value)] += 1
+        self.__sum += value
+
+
+@final
+class RouteMetrics:
+    """Counters and histograms of a route."""
+
+    def __init__(self) -> None:
+        """Create the empty metrics of a route."""
+        self.requests = 0
+        self.errors: Final[dict[str, int]] = {}
+        self.latency: Final = Histogram(LATENCY_BUCKETS)
+        self.request_size: Final = Histogram(SIZE_BUCKETS)
+        self.response_size: Final = Histogram(SIZE_BUCKETS)
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    """
+    Format the labels of a sample.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        The names of the labels.
+    values : Iterable[str]
+        The values of the labels.
+
+    Returns
+    -------
+    labels
+        str
+    """
+    formatted_labels = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{formatted_labels}}}"
+
+
+def _escape(value: str) -> str:
+    """
+    Escape a label value.
+
+    Parameters
+    ----------
+    value : str
+        The label value.
+
+    Returns
+    -------
+    escaped_value
+        str
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _add_family(
+    lines: list[str],
+    name: str,
+    kind: str,
+    description: str,
+    samples: Iterable[tuple[str, Number]],
+) -> None:
+    """
+    Add a metric family in the Prometheus text format.
+
+    Parameters
+    ----------
+    lines : list[str]
+        The lines of the exposition.
+    name : str
+        The name of the family.
+    kind : str
+        The type of the family: counter, gauge or histogram.
+    description : str
+        The help text of the family.
+    samples : Iterable[tuple[str, Number]]
+        The formatted labels and the value of each sample.
+    """
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} {kind}")
+    lines.extend(f"{name}{labels} {value}" for labels, value in samples)
+
+
+def _add_histogram(
+    lines: list[str],
+    name: str,
+    description: str,
+    histograms: Iterable[tuple[RouteLabels, Histogram]],
+) -> None:
+    """
+    Add a histogram family in the Prometheus text format.
+
+    Parameters
+    ----------
+    lines : list[str]
+        The lines of the exposition.
+    name : str
+        The name of the family.
+    description : str
+        The help text of the family.
+    histograms : Iterable[tuple[RouteLabels, Histogram]]
+        The histogram of each route.
+    """
+    samples: list[tuple[str, Number]] = []
+    for route_labels, histogram in histograms:
+        labels = _format_labels(ROUTE_LABELS, route_labels)
+        bounds = [str(bound) for bound in histogram.buckets]
+        bounds.append("+Inf")
+        for bound, count in zip(bounds, histogram.cumulative_counts):
+            bucket_labels = _format_labels(
+                (*ROUTE_LABELS, "le"),
+                (*route_labels, bound),
+            )
+            samples.append((f"_bucket{bucket_labels}", count))
+
+        samples.append((f"_sum{labels}", histogram.total))
+        samples.append((f"_count{labels}", histogram.cumulative_counts[-1]))
+
+    _add_family(lines, name, "histogram", description, samples)
+
+
+@final
+class MetricsRegistry:
+    """
+    Metrics of the routes, labelled by API version, algorithm and operation.
+
+    The metrics are updated by the event loop, without lock.
+
+    Exemples
+    --------
+    >>> registry = MetricsRegistry()
+    >>> registry.observe(("v2", "vigenere", "cipher"), 0.001, 30, 35, None)
+    >>> registry.get(("v2", "vigenere", "cipher")).requests
+    1
+    """
+
+    def __init__(self) -> None:
+        """Create a registry without route."""
+        self.__routes: Final[dict[RouteLabels, RouteMetrics]] = {}
+
+    def get(self, labels: RouteLabels) -> Optional[RouteMetrics]:
+        """
+        Get the metrics of a route.
+
+        Parameters
+        ----------
+        labels : RouteLabels
+            The version, the algorithm and the operation of the route.
+
+        Returns
+        -------
+        route_metrics
+            Optional[RouteMetrics]
+            None if the route was never requested.
+        """
+        return self.__routes.get(labels)
+
+    def observe(
+        self,
+        labels: RouteLabels,
+        duration: float,
+        request_size: Optional[int],
+        response_size: Optional[int],
+        error: Optional[str],
+    ) -> None:
+        """
+        Add a request of a route.
+
+        Parameters
+        ----------
+        labels : RouteLabels
+            The version, the algorithm and the operation of the route.
+        duration : float
+            The time, in seconds, to get the response.
+        request_size : Optional[int]
+            The size, in bytes, of the request body, None if it is unknown.
+        response_size : Optional[int]
+            The size, in bytes, of the response body, None if it is unknown.
+        error : Optional[str]
+            The class of the error, None if the request succeeded.
+        """
+        route_metrics = self.__routes.get(labels)
+        if route_metrics is None:
+            route_metrics = self.__routes[labels] = RouteMetrics()
+
+        route_metrics.requests += 1
+        route_metrics.latency.observe(duration)
+        if request_size is not None:
+            route_metrics.request_size.observe(request_size)
+
+        if response_size is not None:
+            route_metrics.response_size.observe(response_size)
+
+        if error is not None:
+            route_metrics.errors[error] = route_metrics.errors.get(error, 0) + 1
+
+    def clear(self) -> None:
+        """Remove the metrics of all routes."""
+        self.__routes.clear()
+
+    def render(self, lines: list[str]) -> None:
+        """
+        Add the metric families of the routes in the Prometheus text format.
+
+        Parameters
+        ----------
+        lines : list[str]
+            The lines of the exposition.
+        """
+        routes = sorted(self.__routes.items())
+        _add_family(
+            lines,
+            "vigenere_api_requests_total",
+            "counter",
+            "Number of requests.",
+            (
+                (_format_labels(ROUTE_LABELS, labels), route_metrics.requests)
+                for labels, route_metrics in routes
+            ),
+        )
+        _add_family(
+            lines,
+            "vigenere_api_errors_total",
+            "counter",
+            "Number of failed requests, by error class.",
+            (
+                (_format_labels((*ROUTE_LABELS, "error"), (*labels, error)), count)
+                for labels, route_metrics in routes
+                for error, count in sorted(route_metrics.errors.items())
+            ),
+        )
+        _add_histogram(
+            lines,
+            "vigenere_api_request_duration_seconds",
+            "Time to get the response, without the body of a streamed response.",
+            ((labels, route_metrics.latency) for labels, route_metrics in routes),
+        )
+        _add_histogram(
+            lines,
+            "vigenere_api_request_size_bytes",
+            "Size of the request bodies with a Content-Length.",
+            ((labels, route_metrics.request_size) for labels, route_metrics in routes),
+        )
+        _add_histogram(
+            lines,
+            "vigenere_api_response_size_bytes",
+            "Size of the response bodies, the streamed bodies are not included.",
+            ((labels, route_metrics.response_size) for labels, route_metrics in routes),
+        )
+
+
+metrics_registry: Final = MetricsRegistry()
+"""The registry updated by the MetricsMiddleware of the application."""
+
+
+def get_route_labels(path: str) -> Optional[RouteLabels]:
+    """
+    Get the labels of a route path like /api/v2/vigenere/cipher/stream.
+
+    Parameters
+    ----------
+    path : str
+        The path of the request.
+
+    Returns
+    -------
+    labels
+        Optional[RouteLabels]
+        None if the path is not an algorithm route.
+    """
+    parts = path.rstrip("/").split("/")
+    if len(parts) < MIN_ROUTE_PARTS or parts[1] != API_PREFIX:
+        return None
+
+    return parts[2], parts[3], "/".join(parts[4:])
+
+
+def get_registered_labels(router: Router) -> dict[str, Optional[RouteLabels]]:
+    """
+    Get the labels of the path of each registered route.
+
+    The routes with parameters in their pattern are not included.
+
+    Parameters
+    ----------
+    router : Router
+        The router of the application.
+
+    Returns
+    -------
+    labels
+        dict[str, Optional[RouteLabels]]
+        The labels of each path, None if the path is not an algorithm route.
+    """
+    labels: dict[str, Optional[RouteLabels]] = {}
+    for routes in router.routes.values():
+        for route in routes:
+            path = route.pattern.decode()
+            if not any(char in path for char in "{}<>:*"):
+                labels[path.rstrip("/")] = get_route_labels(path)
+
+    return labels
+
+
+def get_error_name(status: int) -> str:
+    """
+    Get the error class of an error response, like BadRequest for 400.
+
+    Parameters
+    ----------
+    status : int
+        The status of the response.
+
+    Returns
+    -------
+    error_name
+        str
+    """
+    try:
+        return HTTPStatus(status).phrase.replace(" ", "").replace("-", "")
+    except ValueError:
+        return str(status)
+
+
+@final
+class MetricsMiddleware:
+    """
+    Measure the requests of the algorithm routes.
+
+    The labels come from the registered routes, read on the first request,
+    so their number is bounded. The requests to the other paths,
+    like the 404 errors, share the OTHER_ROUTE_LABELS.
+    """
+
+    def __init__(self, registry: MetricsRegistry, router: Router) -> None:
+        """
+        Create the middleware.
+
+        Parameters
+        ----------
+        registry : MetricsRegistry
+            The registry of the metrics.
+        router : Router
+            The router of the application, with the registered routes.
+        """
+        self.__registry: Final = registry
+        self.__router: Final = router
+        self.__labels: Optional[dict[str, Optional[RouteLabels]]] = None
+
+    async def __call__(
+        self,
+        request: Request,
+        handler: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        """
+        Call the handler and add the request in the registry.
+
+        Parameters
+        ----------
+        request : Request
+            The request.
+        handler : Callable[[Request], Awaitable[Response]]
+            The next middleware or the route.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        if self.__labels is None:
+            self.__labels = get_registered_labels(self.__router)
+
+        labels = self.__labels.get(request.path.rstrip("/"), OTHER_ROUTE_LABELS)
+        if labels is None:
+            return await handler(request)
+
+        content_length = request.get_first_header(b"Content-Length")
+        request_size = int(content_length) if content_length is not None else None
+
+        start = perf_counter()
+        try:
+            response = await handler(request)
+        except Exception as error:
+            self.__registry.observe(
+                labels,
+                perf_counter() - start,
+                request_size,
+                None,
+                type(error).__name__,
+            )
+            raise
+
+        duration = perf_counter() - start
+        content = response.content
+        response_size = (
+            content.length if content is not None and content.length >= 0 else None
+        )
+        self.__registry.observe(
+            labels,
+            duration,
+            request_size,
+            response_size,
+            (
+                get_error_name(response.status)
+                if response.status >= MIN_ERROR_STATUS
+                else None
+            ),
+        )
+        return response
+
+
+def render_metrics(registry: MetricsRegistry) -> bytes:
+    """
+    Get the metrics of the routes, the job executor, the engines and the caches.
+
+    Parameters
+    ----------
+    registry : MetricsRegistry
+        The registry of the route metrics.
+
+    Returns
+    -------
+    exposition
+        bytes
+        The metrics in the Prometheus text format.
+    """
+    lines: list[str] = []
+    registry.render(lines)
+
+    executor_statistics = job_executor.statistics
+    for name, kind, field, description in EXECUTOR_FAMILIES:
+        _add_family(
+            lines,
+            name,
+            kind,
+            description,
+            (
+                ('{pool="thread"}', getattr(executor_statistics.thread, field)),
+                ('{pool="process"}', getattr(executor_statistics.process, field)),
+            ),
+        )
+
+    engine_statistics = sorted(engine_timer.statistics.items())
+    for name, kind, field, description in ENGINE_FAMILIES:
+        _add_family(
+            lines,
+            name,
+            kind,
+            description,
+            (
+                (_format_labels(("engine",), (engine,)), getattr(statistics, field))
+                for engine, statistics in engine_statistics
+            ),
+        )
+
+    for statistics, families in (
+        (response_cache.statistics, RESPONSE_CACHE_FAMILIES),
+        (vigenere_key_cache.statistics, KEY_CACHE_FAMILIES),
+    ):
+        for name, kind, field, description in families:
+            _add_family(
+                lines,
+                name,
+                kind,
+                description,
+                (("", getattr(statistics, field)),),
+            )
+
+    lines.append("")
+    return "\n".join(lines).encode()
@@ -25,6 +25,9 @@ from typing import final, Union
 from blacksheep.server.openapi.common import (
     ContentInfo,
     EndpointDocs,
+    HeaderInfo,
+    ParameterInfo,
+    ParameterSource,
     RequestBodyInfo,
     ResponseExample,
     ResponseInfo,
@@ -59,6 +62,49 @@ class Algorithm(PascalCaseStrEnum):
     VIGENERE = auto()
 
 
+def _add_conditional_docs(
+    ok_res: ResponseInfo,
+    responses: dict[Union[int, str, HTTPStatus], Union[str, ResponseInfo]],
+) -> dict[str, ParameterInfo]:
+    """
+    Document the ETag, Cache-Control and If-None-Match headers of a route.
+
+    Parameters
+    ----------
+    ok_res : ResponseInfo
+        The documentation of the successful response, its headers are added.
+    responses : dict[Union[int, str, HTTPStatus], Union[str, ResponseInfo]]
+        The documentation of the responses, '304 Not Modified' is added.
+
+    Returns
+    -------
+    parameters_docs
+        dict[str, ParameterInfo]
+        The documentation of the If-None-Match header.
+    """
+    ok_res.headers = {
+        "ETag": HeaderInfo(
+            type=str,
+            description="Strong ETag of the algorithm, the operation,"
+            + " the key and the content.",
+        ),
+        "Cache-Control": HeaderInfo(
+            type=str,
+            description="Lifetime of the response in the caches.",
+        ),
+    }
+    responses[HTTPStatus.NOT_MODIFIED] = "The client already has the response."
+
+    return {
+        "If-None-Match": ParameterInfo(
+            description="ETags of the responses already known by the client.",
+            value_type=str,
+            source=ParameterSource.HEADER,
+            required=False,
+        ),
+    }
+
+
 @dataclass
 class ControllerDocs(EndpointDocs):
     """Create the documentation for Caesar algorithm."""
@@ -69,6 +115,8 @@ class ControllerDocs(EndpointDocs):
         algorithm: Algorithm,
         data1_examples: Sequence[Union[CaesarData, VigenereData]],
         data2_examples: Sequence[Union[CaesarData, VigenereData]],
+        *,
+        conditional: bool = False,
     ) -> None:
         """
         Create a ControllerDocs.
@@ -83,6 +131,8 @@ class ControllerDocs(EndpointDocs):
             The first set of examples.
         data2_examples : Sequence[Union[CaesarData, VigenereData]]
             The second set of examples.
+        conditional : bool
+            True if the route sends an ETag and handles If-None-Match.
 
         Raises
         ------
@@ -142,6 +192,12 @@ class ControllerDocs(EndpointDocs):
             ],
         )
 
+        responses: dict[Union[int, str, HTTPStatus], Union[str, ResponseInfo]] = {
+            HTTPStatus.OK: ok_res,
+            HTTPStatus.BAD_REQUEST: "Bad request.",
+        }
+        parameters = _add_conditional_docs(ok_res, responses) if conditional else None
+
         summary_str = (
             f"Apply the {algorithm} algorithm to {operation.value} the content."
         )
@@ -153,12 +209,10 @@ class ControllerDocs(EndpointDocs):
                 + f" to {operation.value} the content."
             ),
             tags=[f"{algorithm}"],
+            parameters=parameters,
             request_body=RequestBodyInfo(
                 description="Examples of requests body.",
                 examples=request_examples,
             ),
-            responses={
-                HTTPStatus.OK: ok_res,
-                HTTPStatus.BAD_REQUEST: "Bad request.",
-            },
+            responses=responses,
         )
@@ -0,0 +1,83 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Read the Caesar or Vigenere data from the query string of a GET route."""
+
+from re import compile as compile_regex
+from typing import Final, Union
+
+from blacksheep.exceptions import BadRequest
+from pydantic import ValidationError
+
+from vigenere_api.helpers import get_int_env
+from vigenere_api.models import CaesarData, VigenereData
+
+from .errors import TooLongQueryContentError
+
+
+MAX_QUERY_CONTENT: Final = get_int_env("VIGENERE_API_QUERY_MAX_CONTENT", 2048)
+"""Maximal length of a content in the query string."""
+
+MAX_KEY_DIGITS: Final = 4300
+"""Maximal number of digits of an integer key, the limit of the int conversion."""
+
+INTEGER_KEY: Final = compile_regex(rf"[+-]?[0-9]{{1,{MAX_KEY_DIGITS}}}")
+"""An integer Caesar key in the query string, a longer number is a bad string key."""
+
+
+def get_query_data(
+    data_type: Union[type[CaesarData], type[VigenereData]],
+    content: str,
+    key: str,
+) -> Union[CaesarData, VigenereData]:
+    """
+    Create the data from the content and the key of the query string.
+
+    An integer key is converted to an int for the Caesar algorithm,
+    if it has at most MAX_KEY_DIGITS digits.
+
+    Parameters
+    ----------
+    data_type : Union[type[CaesarData], type[VigenereData]]
+        The model of the algorithm.
+    content : str
+        The content from the query string.
+    key : str
+        The key from the query string.
+
+    Raises
+    ------
+    TooLongQueryContentError
+        Thrown if the content is longer than MAX_QUERY_CONTENT.
+    BadRequest
+        Thrown if the content or the key is not valid.
+
+    Returns
+    -------
+    data
+        Union[CaesarData, VigenereData]
+    """
+    if len(content) > MAX_QUERY_CONTENT:
+        raise TooLongQueryContentError(len(content), MAX_QUERY_CONTENT)
+
+    try:
+        if data_type is CaesarData and INTEGER_KEY.fullmatch(key) is not None:
+            return CaesarData(content=content, key=int(key))
+
+        return data_type(content=content, key=key)
+    except ValidationError as error:
+        raise BadRequest(str(error)) from error
@@ -0,0 +1,109 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""The documentation of a GET route reading the query string."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import final, Union
+
+from blacksheep.server.openapi.common import ParameterInfo, ParameterSource
+
+from vigenere_api.models import CaesarData, VigenereData
+
+from .operation_docs import Algorithm, ControllerDocs, Operation
+from .query import MAX_QUERY_CONTENT
+
+
+@final
+@dataclass
+class QueryControllerDocs(ControllerDocs):
+    """Create the documentation of the GET route of an operation."""
+
+    def __init__(
+        self,
+        operation: Operation,
+        algorithm: Algorithm,
+        data1_examples: Sequence[Union[CaesarData, VigenereData]],
+        data2_examples: Sequence[Union[CaesarData, VigenereData]],
+    ) -> None:
+        """
+        Create a QueryControllerDocs.
+
+        Parameters
+        ----------
+        operation : Operation
+            The operation type.
+        algorithm : Algorithm
+            The algorithm type.
+        data1_examples : Sequence[Union[CaesarData, VigenereData]]
+            The first set of examples.
+        data2_examples : Sequence[Union[CaesarData, VigenereData]]
+            The second set of examples.
+
+        Raises
+        ------
+        OperationTypeError
+            Thrown if 'operation' is not an Operation object.
+        AlgorithmTypeError
+            Thrown if 'algorithm' is not an Algorithm object.
+        ExamplesTypeError
+            Thrown if 'data1_examples' or 'data2_examples' is not a Sequence object.
+        ExampleTypeError
+            Thrown if an example is not a CaesarData or VigenereData object.
+        """
+        super().__init__(
+            operation,
+            algorithm,
+            data1_examples,
+            data2_examples,
+            conditional=True,
+        )
+
+        request_data = data2_examples[0]
+        if operation == Operation.DECIPHER:
+            request_data = data1_examples[0]
+
+        self.summary = (
+            f"Apply the {algorithm} algorithm to {operation.value}"
+            + " the content of the query string."
+        )
+        self.description = (
+            f"Use the key with the {algorithm} algorithm"
+            + f" to {operation.value} the content."
+            + f" The content contains at most {MAX_QUERY_CONTENT} characters."
+            + " The response can be stored by the caches between the client"
+            + " and the API."
+        )
+        self.request_body = None
+        self.parameters = {
+            "content": ParameterInfo(
+                description=f"The content to {operation.value}.",
+                value_type=str,
+                source=ParameterSource.QUERY,
+                required=True,
+                example=request_data.content,
+            ),
+            "key": ParameterInfo(
+                description=f"The key of the {algorithm} algorithm.",
+                value_type=str,
+                source=ParameterSource.QUERY,
+                required=True,
+                example=str(request_data.key),
+            ),
+            **(self.parameters or {}),
+        }
@@ -0,0 +1,93 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Apply the Vigenere algorithm on a text body streamed by chunks."""
+
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+from typing import cast, Final, Optional
+
+from blacksheep import Request, Response, StreamedContent
+from blacksheep.exceptions import BadRequest
+
+from vigenere_api.models import VigenereStream
+
+from .operation_docs import Operation
+
+
+TEXT_CONTENT_TYPE: Final = b"text/plain; charset=utf-8"
+
+
+def stream_vigenere(request: Request, key: str, operation: Operation) -> Response:
+    """
+    Create the response applying the Vigenere algorithm on each chunk of the body.
+
+    The body is read and written by chunks, the memory does not depend on its size.
+    The position in the key continues between chunks.
+    Invalid UTF-8 bytes are not alphabetic characters, they are written unchanged.
+
+    Parameters
+    ----------
+    request : Request
+        The request with the text to cipher or decipher in the body.
+    key : str
+        The key of the Vigenere algorithm.
+    operation : Operation
+        The operation to apply on the body.
+
+    Raises
+    ------
+    BadRequest
+        Thrown if 'key' is not a valid Vigenere key.
+
+    Returns
+    -------
+    response
+        Response
+        The streamed response, sent with the chunked transfer encoding.
+    """
+    try:
+        stream = VigenereStream(key, decipher=operation == Operation.DECIPHER)
+    except (TypeError, ValueError) as error:
+        raise BadRequest(str(error)) from error
+
+    async def _moved_chunks() -> AsyncIterator[bytes]:
+        """
+        Apply the Vigenere algorithm on each chunk of the body.
+
+        Yields
+        ------
+        moved_chunk
+            bytes
+        """
+        # The stub of blacksheep declares a coroutine, it is an async generator.
+        # It yields None if the request has no body.
+        chunks = cast(AsyncIterator[Optional[bytes]], request.stream())
+        async for chunk in chunks:
+            moved_chunk = stream.update_bytes(chunk or b"")
+            if moved_chunk:
+                # The body of an ASGI message is a byte string.
+                yield bytes(moved_chunk)
+
+        moved_rest = stream.finalize_bytes()
+        if moved_rest:
+            yield moved_rest
+
+    return Response(
+        HTTPStatus.OK,
+        None,
+        StreamedContent(TEXT_CONTENT_TYPE, _moved_chunks),
+    )
@@ -19,7 +19,12 @@
 from blacksheep import FromJSON, Response
 from blacksheep.server.controllers import post
 
-from vigenere_api.api.helpers import Controller
+from vigenere_api.api.helpers import (
+    Algorithm,
+    Controller,
+    Operation,
+    run_cached_operation,
+)
 from vigenere_api.api.v1.openapi_docs import docs
 from vigenere_api.models import CaesarData
 
@@ -63,7 +68,11 @@ class CaesarController(Controller):
         response
             Response
         """
-        return self.json(data.value.cipher())
+        return await run_cached_operation(
+            Algorithm.CAESAR,
+            Operation.CIPHER,
+            data.value,
+        )
 
     @docs(post_caesar_decipher_docs)
     @post("decipher")
@@ -81,4 +90,8 @@ class CaesarController(Controller):
         response
             Response
         """
-        return self.json(data.value.decipher())
+        return await run_cached_operation(
+            Algorithm.CAESAR,
+            Operation.DECIPHER,
+            data.value,
+        )
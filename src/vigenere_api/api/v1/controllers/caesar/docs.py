@@ -41,15 +41,23 @@ CAESAR_DATA2 = (
 class CaesarControllerDocs(ControllerDocs):
     """Create the documentation for Caesar algorithm."""
 
-    def __init__(self, operation: Operation) -> None:
+    def __init__(self, operation: Operation, *, conditional: bool = False) -> None:
         """
         Create a CaesarControllerDocs.
 
         Parameters
         ----------
         operation : Operation
+        conditional : bool
+            True if the route sends an ETag and handles If-None-Match.
         """
-        super().__init__(operation, Algorithm.CAESAR, CAESAR_DATA1, CAESAR_DATA2)
+        super().__init__(
+            operation,
+            Algorithm.CAESAR,
+            CAESAR_DATA1,
+            CAESAR_DATA2,
+            conditional=conditional,
+        )
 
 
 post_caesar_cipher_docs = CaesarControllerDocs(operation=Operation.CIPHER)
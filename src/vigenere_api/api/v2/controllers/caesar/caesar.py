@@ -17,17 +17,32 @@
 """The caesar controller."""
 from typing import final
 
-from blacksheep import FromJSON, Response
-from blacksheep.server.controllers import post
+from blacksheep import FromJSON, FromQuery, Request, Response
+from blacksheep.server.controllers import get, post
 
-from vigenere_api.api.helpers import Controller
-from vigenere_api.api.v1.controllers import CaesarController as V1CaesarController
-from vigenere_api.api.v1.controllers.caesar.docs import (
+from vigenere_api.api.helpers import (
+    Algorithm,
+    BatchItem,
+    Controller,
+    get_batch_size,
+    get_query_data,
+    job_executor,
+    Operation,
+    process_batch,
+    run_conditional_operation,
+)
+from vigenere_api.api.v2.openapi_docs import docs
+from vigenere_api.models import CaesarData, CaesarDecryptData
+from vigenere_api.models.cryptanalysis import DECRYPT_SAMPLE_SIZE, get_analysed_length
+
+from .docs import (
+    get_caesar_cipher_docs,
+    get_caesar_decipher_docs,
+    post_caesar_batch_docs,
     post_caesar_cipher_docs,
     post_caesar_decipher_docs,
+    post_caesar_decrypt_docs,
 )
-from vigenere_api.api.v2.openapi_docs import docs
-from vigenere_api.models import CaesarData
 
 
 @final
@@ -35,11 +50,15 @@ class CaesarController(Controller):
     """
     The caesar controller.
 
-    This controller calls functions of V1 controller.
+    The cipher and decipher routes send an ETag and handle If-None-Match.
 
     Provides routes:
     - POST /api/v2/caesar/cipher
     - POST /api/v2/caesar/decipher
+    - GET /api/v2/caesar/cipher?content=...&key=...
+    - GET /api/v2/caesar/decipher?content=...&key=...
+    - POST /api/v2/caesar/batch
+    - POST /api/v2/caesar/decrypt
     """
 
     @classmethod
@@ -56,12 +75,18 @@ class CaesarController(Controller):
 
     @docs(post_caesar_cipher_docs)
     @post("cipher")
-    async def cipher(self, data: FromJSON[CaesarData]) -> Response:
+    async def cipher(
+        self,
+        request: Request,
+        data: FromJSON[CaesarData],
+    ) -> Response:
         """
         Cipher the input request with Caesar algorithm.
 
         Parameters
         ----------
+        request : Request
+            The request, with the If-None-Match headers.
         data : CaesarData
             A CaesarData from JSON from the request body.
 
@@ -70,16 +95,27 @@ class CaesarController(Controller):
         response
             Response
         """
-        return await V1CaesarController.cipher(self, data)
+        return await run_conditional_operation(
+            request,
+            Algorithm.CAESAR,
+            Operation.CIPHER,
+            data.value,
+        )
 
     @docs(post_caesar_decipher_docs)
     @post("decipher")
-    async def decipher(self, data: FromJSON[CaesarData]) -> Response:
+    async def decipher(
+        self,
+        request: Request,
+        data: FromJSON[CaesarData],
+    ) -> Response:
         """
         Decipher the input request with Caesar algorithm.
 
         Parameters
         ----------
+        request : Request
+            The request, with the If-None-Match headers.
         data : CaesarData
             A CaesarData from JSON from the request body.
 
@@ -88,4 +124,122 @@ class CaesarController(Controller):
         response
             Response
         """
-        return await V1CaesarController.decipher(self, data)
+        return await run_conditional_operation(
+            request,
+            Algorithm.CAESAR,
+            Operation.DECIPHER,
+            data.value,
+        )
+
+    @docs(get_caesar_cipher_docs)
+    @get("cipher")
+    async def get_cipher(
+        self,
+        request: Request,
+        content: FromQuery[str],
+        key: FromQuery[str],
+    ) -> Response:
+        """
+        Cipher the content of the query string with Caesar algorithm.
+
+        Parameters
+        ----------
+        request : Request
+            The request, with the If-None-Match headers.
+        content : str
+            The content from the query string.
+        key : str
+            The key from the query string.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        return await run_conditional_operation(
+            request,
+            Algorithm.CAESAR,
+            Operation.CIPHER,
+            get_query_data(CaesarData, content.value, key.value),
+        )
+
+    @docs(get_caesar_decipher_docs)
+    @get("decipher")
+    async def get_decipher(
+        self,
+        request: Request,
+        content: FromQuery[str],
+        key: FromQuery[str],
+    ) -> Response:
+        """
+        Decipher the content of the query string with Caesar algorithm.
+
+        Parameters
+        ----------
+        request : Request
+            The request, with the If-None-Match headers.
+        content : str
+            The content from the query string.
+        key : str
+            The key from the query string.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        return await run_conditional_operation(
+            request,
+            Algorithm.CAESAR,
+            Operation.DECIPHER,
+            get_query_data(CaesarData, content.value, key.value),
+        )
+
+    @docs(post_caesar_batch_docs)
+    @post("batch")
+    async def batch(self, items: FromJSON[list[BatchItem]]) -> Response:
+        """
+        Cipher or decipher each item of the batch with Caesar algorithm.
+
+        Parameters
+        ----------
+        items : list[BatchItem]
+            The items from JSON from the request body.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        results = await job_executor.run(
+            process_batch,
+            items.value,
+            CaesarData,
+            size=get_batch_size(items.value),
+        )
+        return self.json(results)
+
+    @docs(post_caesar_decrypt_docs)
+    @post("decrypt")
+    async def decrypt(self, data: FromJSON[CaesarDecryptData]) -> Response:
+        """
+        Find the key of the content ciphered with Caesar algorithm.
+
+        Only a sample of a large content is analysed,
+        the size of the job is the length of the sample.
+
+        Parameters
+        ----------
+        data : CaesarDecryptData
+            A CaesarDecryptData from JSON from the request body.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        result = await job_executor.run(
+            data.value.decrypt,
+            size=get_analysed_length(len(data.value.content), DECRYPT_SAMPLE_SIZE),
+        )
+        return self.json(result)
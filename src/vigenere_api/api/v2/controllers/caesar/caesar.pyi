@@ -14,11 +14,34 @@
 #  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-from blacksheep import FromJSON, Response
+from blacksheep import FromJSON, FromQuery, Request, Response
 from blacksheep.server.controllers import APIController
 
-from vigenere_api.models import CaesarData
+from vigenere_api.api.helpers import BatchItem
+from vigenere_api.models import CaesarData, CaesarDecryptData
 
 class CaesarController(APIController):
-    async def cipher(self, data: FromJSON[CaesarData]) -> Response: ...
-    async def decipher(self, data: FromJSON[CaesarData]) -> Response: ...
+    async def cipher(
+        self,
+        request: Request,
+        data: FromJSON[CaesarData],
+    ) -> Response: ...
+    async def decipher(
+        self,
+        request: Request,
+        data: FromJSON[CaesarData],
+    ) -> Response: ...
+    async def get_cipher(
+        self,
+        request: Request,
+        content: FromQuery[str],
+        key: FromQuery[str],
+    ) -> Response: ...
+    async def get_decipher(
+        self,
+        request: Request,
+        content: FromQuery[str],
+        key: FromQuery[str],
+    ) -> Response: ...
+    async def batch(self, items: FromJSON[list[BatchItem]]) -> Response: ...
+    async def decrypt(self, data: FromJSON[CaesarDecryptData]) -> Response: ...
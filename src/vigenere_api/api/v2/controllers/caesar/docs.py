@@ -0,0 +1,61 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""The caesar controller's documentation."""
+
+from vigenere_api.api.helpers import (
+    Algorithm,
+    BatchControllerDocs,
+    DecryptControllerDocs,
+    Operation,
+    QueryControllerDocs,
+)
+from vigenere_api.api.v1.controllers.caesar.docs import (
+    CAESAR_DATA1,
+    CAESAR_DATA2,
+    CaesarControllerDocs,
+)
+from vigenere_api.models import CaesarDecryptData
+
+
+CAESAR_DECRYPT_DATA = (
+    CaesarDecryptData(content="Khoor Zruog, wklv lv d vhfuhw phvvdjh."),
+    CaesarDecryptData(content="Dwwdfn dw gdzq, wkh hqhpb lv qrw uhdgb."),
+)
+
+
+post_caesar_cipher_docs = CaesarControllerDocs(Operation.CIPHER, conditional=True)
+post_caesar_decipher_docs = CaesarControllerDocs(Operation.DECIPHER, conditional=True)
+
+post_caesar_batch_docs = BatchControllerDocs(
+    Algorithm.CAESAR,
+    CAESAR_DATA1,
+    CAESAR_DATA2,
+)
+get_caesar_cipher_docs = QueryControllerDocs(
+    Operation.CIPHER,
+    Algorithm.CAESAR,
+    CAESAR_DATA1,
+    CAESAR_DATA2,
+)
+get_caesar_decipher_docs = QueryControllerDocs(
+    Operation.DECIPHER,
+    Algorithm.CAESAR,
+    CAESAR_DATA1,
+    CAESAR_DATA2,
+)
+post_caesar_decrypt_docs = DecryptControllerDocs(Algorithm.CAESAR, CAESAR_DECRYPT_DATA)
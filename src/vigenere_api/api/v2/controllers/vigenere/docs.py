@@ -18,10 +18,28 @@
 """The caesar controller's documentation."""
 
 from dataclasses import dataclass
+from http import HTTPStatus
 from typing import final
 
-from vigenere_api.api.helpers import Algorithm, ControllerDocs, Operation
-from vigenere_api.models import VigenereData
+from blacksheep.server.openapi.common import (
+    ContentInfo,
+    EndpointDocs,
+    ParameterInfo,
+    RequestBodyInfo,
+    ResponseExample,
+    ResponseInfo,
+)
+
+from vigenere_api.api.helpers import (
+    Algorithm,
+    BatchControllerDocs,
+    ControllerDocs,
+    DecryptControllerDocs,
+    Operation,
+    QueryControllerDocs,
+)
+from vigenere_api.api.helpers.errors import OperationTypeError
+from vigenere_api.models import VigenereData, VigenereDecryptData
 
 
 VIGENERE_DATA1 = (
@@ -36,6 +54,16 @@ VIGENERE_DATA2 = (
     VigenereData(content="Ca va etre tout noir!", key="piErrE"),
     VigenereData(content="AaA aaa AAA aAa aaa aAA", key="aBCd"),
 )
+VIGENERE_DECRYPT_DATA = (
+    VigenereDecryptData(
+        content=(
+            "Qsgf fnsds nyh esipr ksncw mub zyd tnelqff mvaitsx rceel ab gsme"
+            + " qbyxubryx m brh rmhvzr, ocaniujro mz Zvmidhl, lrp rromoogph fc gsi"
+            + " bfbasewgtsz hulx mzy xiz oep gdsneip sdfex. Bbh aq oep izunrip wa l"
+            + " kdsne gujvw amf, gpwfwar atsgsid hulx zogtsz qny pabt prpiep."
+        ),
+    ),
+)
 
 
 @final
@@ -51,8 +79,102 @@ class VigenereControllerDocs(ControllerDocs):
         ----------
         operation : Operation
         """
-        super().__init__(operation, Algorithm.VIGENERE, VIGENERE_DATA1, VIGENERE_DATA2)
+        super().__init__(
+            operation,
+            Algorithm.VIGENERE,
+            VIGENERE_DATA1,
+            VIGENERE_DATA2,
+            conditional=True,
+        )
+
+
+@final
+@dataclass
+class VigenereStreamControllerDocs(EndpointDocs):
+    """Create the documentation for Vigenere algorithm on a streamed text."""
+
+    def __init__(self, operation: Operation) -> None:
+        """
+        Create a VigenereStreamControllerDocs.
+
+        Parameters
+        ----------
+        operation : Operation
+
+        Raises
+        ------
+        OperationTypeError
+            Thrown if 'operation' is not an Operation object.
+        """
+        if not isinstance(operation, Operation):
+            raise OperationTypeError(operation)
+
+        request_data, response_data = VIGENERE_DATA2[0], VIGENERE_DATA1[0]
+        if operation == Operation.DECIPHER:
+            request_data, response_data = response_data, request_data
+
+        super().__init__(
+            summary=(
+                f"Apply the Vigenere algorithm to {operation.value} a streamed text."
+            ),
+            description=(
+                f"Use the key with the Vigenere algorithm to {operation.value}"
+                + " the text body, read and written by chunks."
+                + " The size of the text is not limited."
+            ),
+            tags=["Vigenere"],
+            parameters={
+                "key": ParameterInfo(
+                    description="The key of the Vigenere algorithm.",
+                    example=request_data.key,
+                ),
+            },
+            request_body=RequestBodyInfo(
+                description="The text in UTF-8.",
+                examples={"example 0": request_data.content},
+            ),
+            responses={
+                HTTPStatus.OK: ResponseInfo(
+                    description=f"Success {operation.value} with Vigenere algorithm.",
+                    content=[
+                        ContentInfo(
+                            type=str,
+                            examples=[ResponseExample(value=response_data.content)],
+                            content_type="text/plain",
+                        ),
+                    ],
+                ),
+                HTTPStatus.BAD_REQUEST: "Bad request.",
+            },
+        )
 
 
 post_vigenere_cipher_docs = VigenereControllerDocs(operation=Operation.CIPHER)
 post_vigenere_decipher_docs = VigenereControllerDocs(operation=Operation.DECIPHER)
+post_vigenere_cipher_stream_docs = VigenereStreamControllerDocs(
+    operation=Operation.CIPHER,
+)
+post_vigenere_decipher_stream_docs = VigenereStreamControllerDocs(
+    operation=Operation.DECIPHER,
+)
+post_vigenere_batch_docs = BatchControllerDocs(
+    Algorithm.VIGENERE,
+    VIGENERE_DATA1,
+    VIGENERE_DATA2,
+)
+get_vigenere_cipher_docs = QueryControllerDocs(
+    Operation.CIPHER,
+    Algorithm.VIGENERE,
+    VIGENERE_DATA1,
+    VIGENERE_DATA2,
+)
+get_vigenere_decipher_docs = QueryControllerDocs(
+    Operation.DECIPHER,
+    Algorithm.VIGENERE,
+    VIGENERE_DATA1,
+    VIGENERE_DATA2,
+)
+post_vigenere_decrypt_docs = DecryptControllerDocs(
+    Algorithm.VIGENERE,
+    VIGENERE_DECRYPT_DATA,
+)
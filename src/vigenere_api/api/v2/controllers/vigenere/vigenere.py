@@ -18,14 +18,34 @@
 
 from typing import final
 
-from blacksheep import FromJSON, Response
-from blacksheep.server.controllers import post
+from blacksheep import FromJSON, FromQuery, Request, Response
+from blacksheep.server.controllers import get, post
 
-from vigenere_api.api.helpers import Controller
+from vigenere_api.api.helpers import (
+    Algorithm,
+    BatchItem,
+    Controller,
+    get_batch_size,
+    get_query_data,
+    job_executor,
+    Operation,
+    process_batch,
+    run_conditional_operation,
+    stream_vigenere,
+)
 from vigenere_api.api.v2.openapi_docs import docs
-from vigenere_api.models import VigenereData
+from vigenere_api.models import VigenereData, VigenereDecryptData
 
-from .docs import post_vigenere_cipher_docs, post_vigenere_decipher_docs
+from .docs import (
+    get_vigenere_cipher_docs,
+    get_vigenere_decipher_docs,
+    post_vigenere_batch_docs,
+    post_vigenere_cipher_docs,
+    post_vigenere_cipher_stream_docs,
+    post_vigenere_decipher_docs,
+    post_vigenere_decipher_stream_docs,
+    post_vigenere_decrypt_docs,
+)
 
 
 @final
@@ -36,6 +56,14 @@ class VigenereController(Controller):
     Provides routes:
     - POST /api/v2/vigenere/cipher
     - POST /api/v2/vigenere/decipher
+    - GET /api/v2/vigenere/cipher?content=...&key=...
+    - GET /api/v2/vigenere/decipher?content=...&key=...
+    - POST /api/v2/vigenere/batch
+    - POST /api/v2/vigenere/cipher/stream?key=...
+    - POST /api/v2/vigenere/decipher/stream?key=...
+    - POST /api/v2/vigenere/decrypt
+
+    The cipher and decipher routes send an ETag and handle If-None-Match.
     """
 
     @classmethod
@@ -52,12 +80,18 @@ class VigenereController(Controller):
 
     @docs(post_vigenere_cipher_docs)
     @post("cipher")
-    async def cipher(self, data: FromJSON[VigenereData]) -> Response:
+    async def cipher(
+        self,
+        request: Request,
+        data: FromJSON[VigenereData],
+    ) -> Response:
         """
         Cipher the input request with Vigenere algorithm.
 
         Parameters
         ----------
+        request : Request
+            The request, with the If-None-Match headers.
         data : VigenereData
             A VigenereData from JSON from the request body.
 
@@ -66,16 +100,27 @@ class VigenereController(Controller):
         response
             Response
         """
-        return self.json(data.value.cipher())
+        return await run_conditional_operation(
+            request,
+            Algorithm.VIGENERE,
+            Operation.CIPHER,
+            data.value,
+        )
 
     @docs(post_vigenere_decipher_docs)
     @post("decipher")
-    async def decipher(self, data: FromJSON[VigenereData]) -> Response:
+    async def decipher(
+        self,
+        request: Request,
+        data: FromJSON[VigenereData],
+    ) -> Response:
         """
         Decipher the input request with Vigenere algorithm.
 
         Parameters
         ----------
+        request : Request
+            The request, with the If-None-Match headers.
         data : VigenereData
             A VigenereData from JSON from the request body.
 
@@ -84,4 +129,167 @@ class VigenereController(Controller):
         response
             Response
         """
-        return self.json(data.value.decipher())
+        return await run_conditional_operation(
+            request,
+            Algorithm.VIGENERE,
+            Operation.DECIPHER,
+            data.value,
+        )
+
+    @docs(get_vigenere_cipher_docs)
+    @get("cipher")
+    async def get_cipher(
+        self,
+        request: Request,
+        content: FromQuery[str],
+        key: FromQuery[str],
+    ) -> Response:
+        """
+        Cipher the content of the query string with Vigenere algorithm.
+
+        Parameters
+        ----------
+        request : Request
+            The request, with the If-None-Match headers.
+        content : str
+            The content from the query string.
+        key : str
+            The key from the query string.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        return await run_conditional_operation(
+            request,
+            Algorithm.VIGENERE,
+            Operation.CIPHER,
+            get_query_data(VigenereData, content.value, key.value),
+        )
+
+    @docs(get_vigenere_decipher_docs)
+    @get("decipher")
+    async def get_decipher(
+        self,
+        request: Request,
+        content: FromQuery[str],
+        key: FromQuery[str],
+    ) -> Response:
+        """
+        Decipher the content of the query string with Vigenere algorithm.
+
+        Parameters
+        ----------
+        request : Request
+            The request, with the If-None-Match headers.
+        content : str
+            The content from the query string.
+        key : str
+            The key from the query string.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        return await run_conditional_operation(
+            request,
+            Algorithm.VIGENERE,
+            Operation.DECIPHER,
+            get_query_data(VigenereData, content.value, key.value),
+        )
+
+    @docs(post_vigenere_batch_docs)
+    @post("batch")
+    async def batch(self, items: FromJSON[list[BatchItem]]) -> Response:
+        """
+        Cipher or decipher each item of the batch with Vigenere algorithm.
+
+        Parameters
+        ----------
+        items : list[BatchItem]
+            The items from JSON from the request body.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        results = await job_executor.run(
+            process_batch,
+            items.value,
+            VigenereData,
+            size=get_batch_size(items.value),
+        )
+        return self.json(results)
+
+    @docs(post_vigenere_cipher_stream_docs)
+    @post("cipher/stream")
+    async def cipher_stream(self, request: Request, key: FromQuery[str]) -> Response:
+        """
+        Cipher the text body, streamed by chunks, with Vigenere algorithm.
+
+        Parameters
+        ----------
+        request : Request
+            The request with the text in the body.
+        key : str
+            The key from the query string.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        return stream_vigenere(request, key.value, Operation.CIPHER)
+
+    @docs(post_vigenere_decipher_stream_docs)
+    @post("decipher/stream")
+    async def decipher_stream(
+        self,
+        request: Request,
+        key: FromQuery[str],
+    ) -> Response:
+        """
+        Decipher the text body, streamed by chunks, with Vigenere algorithm.
+
+        Parameters
+        ----------
+        request : Request
+            The request with the text in the body.
+        key : str
+            The key from the query string.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        return stream_vigenere(request, key.value, Operation.DECIPHER)
+
+    @docs(post_vigenere_decrypt_docs)
+    @post("decrypt")
+    async def decrypt(self, data: FromJSON[VigenereDecryptData]) -> Response:
+        """
+        Find the key of the content ciphered with Vigenere algorithm, and decipher it.
+
+        Only the beginning of a large content is analysed,
+        but the whole content is deciphered, it is the size of the job.
+
+        Parameters
+        ----------
+        data : VigenereDecryptData
+            A VigenereDecryptData from JSON from the request body.
+
+        Returns
+        -------
+        response
+            Response
+        """
+        result = await job_executor.run(
+            data.value.decrypt,
+            size=len(data.value.content),
+            parallel=True,
+        )
+        return self.json(result)
@@ -14,11 +14,42 @@
 #  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-from blacksheep import FromJSON, Response
+from blacksheep import FromJSON, FromQuery, Request, Response
 from blacksheep.server.controllers import APIController
 
-from vigenere_api.models import VigenereData
+from vigenere_api.api.helpers import BatchItem
+from vigenere_api.models import VigenereData, VigenereDecryptData
 
 class VigenereController(APIController):
-    async def cipher(self, data: FromJSON[VigenereData]) -> Response: ...
-    async def decipher(self, data: FromJSON[VigenereData]) -> Response: ...
+    async def cipher(
+        self,
+        request: Request,
+        data: FromJSON[VigenereData],
+    ) -> Response: ...
+    async def decipher(
+        self,
+        request: Request,
+        data: FromJSON[VigenereData],
+    ) -> Response: ...
+    async def get_cipher(
+        self,
+        request: Request,
+        content: FromQuery[str],
+        key: FromQuery[str],
+    ) -> Response: ...
+    async def get_decipher(
+        self,
+        request: Request,
+        content: FromQuery[str],
+        key: FromQuery[str],
+    ) -> Response: ...
+    async def batch(self, items: FromJSON[list[BatchItem]]) -> Response: ...
+    async def cipher_stream(
+        self, request: Request, key: FromQuery[str]
+    ) -> Response: ...
+    async def decipher_stream(
+        self,
+        request: Request,
+        key: FromQuery[str],
+    ) -> Response: ...
+    async def decrypt(self, data: FromJSON[VigenereDecryptData]) -> Response: ...
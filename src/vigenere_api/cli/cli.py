@@ -0,0 +1,230 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Command line interface of Vigenere-API."""
+
+from argparse import ArgumentParser, BooleanOptionalAction, Namespace
+from collections.abc import Sequence
+from enum import auto, unique
+from pathlib import Path
+from typing import final, Optional, Union
+
+from strenum import LowercaseStrEnum
+from vigenere_api.api.helpers import Algorithm, Operation
+from vigenere_api.models import BaseStream, CaesarStream, VigenereStream
+from vigenere_api.models.helpers import shutdown_process_pool
+from vigenere_api.server import (
+    BACKLOG,
+    HOST,
+    KEEP_ALIVE,
+    LIMIT_CONCURRENCY,
+    PERFORMANCE,
+    PORT,
+    run,
+    ServerOptions,
+    WORKERS,
+)
+
+from .file import BLOCK_SIZE, cipher_file
+
+
+@final
+@unique
+class Command(LowercaseStrEnum):
+    """All commands of the command line."""
+
+    SERVE = auto()
+    FILE = auto()
+
+
+def create_parser() -> ArgumentParser:
+    """
+    Create the parser of the command line.
+
+    Returns
+    -------
+    parser
+        ArgumentParser
+    """
+    parser = ArgumentParser(
+        prog="vigenere-api",
+        description="Run the API, or cipher and decipher files.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    serve_parser = commands.add_parser(
+        Command.SERVE,
+        help="run the API, the default command",
+    )
+    serve_parser.add_argument(
+        "--host",
+        default=HOST,
+        help=f"the address to listen, by default {HOST}",
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        default=PORT,
+        help=f"the port to listen, by default {PORT}",
+    )
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=WORKERS,
+        help=f"the number of server processes, by default {WORKERS}",
+    )
+    serve_parser.add_argument(
+        "--backlog",
+        type=int,
+        default=BACKLOG,
+        help=f"the maximal number of pending connections, by default {BACKLOG}",
+    )
+    serve_parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=KEEP_ALIVE,
+        help=f"the seconds an idle connection is kept open, by default {KEEP_ALIVE}",
+    )
+    serve_parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        default=LIMIT_CONCURRENCY,
+        help="the maximal number of connections of each process, 0 for no limit,"
+        + f" by default {LIMIT_CONCURRENCY}",
+    )
+    serve_parser.add_argument(
+        "--performance",
+        action=BooleanOptionalAction,
+        default=PERFORMANCE,
+        help="use uvloop and orjson if they are installed",
+    )
+
+    file_parser = commands.add_parser(Command.FILE, help="cipher or decipher a file")
+    file_parser.add_argument(
+        "operation",
+        type=Operation,
+        choices=tuple(Operation),
+        help="the operation to apply on the file",
+    )
+    file_parser.add_argument(
+        "--algo",
+        type=str.capitalize,
+        choices=tuple(Algorithm),
+        metavar="{caesar,vigenere}",
+        required=True,
+        help="the algorithm to use",
+    )
+    file_parser.add_argument(
+        "--key",
+        required=True,
+        help="the key, an integer or a letter for the Caesar algorithm",
+    )
+    file_parser.add_argument(
+        "--block-size",
+        type=int,
+        default=BLOCK_SIZE,
+        help=f"the number of bytes moved at once, by default {BLOCK_SIZE}",
+    )
+    file_parser.add_argument("input", type=Path, help="the UTF-8 file to read")
+    file_parser.add_argument("output", type=Path, help="the file to write")
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the command line.
+
+    Without command, the API is run with the default options.
+
+    Parameters
+    ----------
+    argv : Optional[Sequence[str]], default None
+        The arguments, by default the arguments of the process.
+
+    Returns
+    -------
+    exit_code
+        int
+    """
+    parser = create_parser()
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == Command.FILE:
+        try:
+            stream = _create_stream(arguments)
+        except (TypeError, ValueError) as error:
+            parser.error(str(error))
+
+        try:
+            cipher_file(arguments.input, arguments.output, stream, arguments.block_size)
+        except ValueError as error:
+            parser.error(str(error))
+        except OSError as error:
+            parser.exit(1, f"{parser.prog}: error: {error}\n")
+        finally:
+            shutdown_process_pool()
+
+        return 0
+
+    options = ServerOptions()
+    if arguments.command == Command.SERVE:
+        options = ServerOptions(
+            host=arguments.host,
+            port=arguments.port,
+            workers=arguments.workers,
+            backlog=arguments.backlog,
+            keep_alive=arguments.keep_alive,
+            limit_concurrency=arguments.limit_concurrency,
+            performance=arguments.performance,
+        )
+
+    run(options)
+
+    return 0
+
+
+def _create_stream(arguments: Namespace) -> BaseStream:
+    """
+    Create the stream of the algorithm with the key.
+
+    Parameters
+    ----------
+    arguments : Namespace
+        The parsed arguments of the file command.
+
+    Raises
+    ------
+    TypeError
+        Thrown if the key has a bad type.
+    ValueError
+        Thrown if the key is invalid.
+
+    Returns
+    -------
+    stream
+        BaseStream
+    """
+    decipher = arguments.operation == Operation.DECIPHER
+
+    if arguments.algo == Algorithm.CAESAR:
+        key: Union[int, str] = arguments.key
+        if arguments.key.lstrip("-").isdigit():
+            key = int(arguments.key)
+
+        return CaesarStream(key, decipher=decipher)
+
+    return VigenereStream(arguments.key, decipher=decipher)
@@ -0,0 +1,75 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""All errors thrown by the command line interface."""
+
+from pathlib import Path
+from typing import Any, final
+
+from vigenere_api.helpers import VigenereAPITypeError
+
+
+@final
+class StreamTypeError(VigenereAPITypeError):
+    """Thrown if the stream is not a CaesarStream or a VigenereStream object."""
+
+    def __init__(self, stream: Any) -> None:
+        """
+        Create a StreamTypeError with the stream.
+
+        Parameters
+        ----------
+        stream : Any
+            The received stream.
+        """
+        super().__init__(stream, "stream", "a CaesarStream or a VigenereStream object")
+
+
+@final
+class BadBlockSizeError(ValueError):
+    """Thrown if the block size is not a positive integer."""
+
+    def __init__(self, block_size: int) -> None:
+        """
+        Create a BadBlockSizeError with the block size.
+
+        Parameters
+        ----------
+        block_size : int
+            The received block size.
+        """
+        super().__init__(
+            f"The block size is '{block_size}'. Please give an integer greater than 0.",
+        )
+
+
+@final
+class SameFileError(ValueError):
+    """Thrown if the input file and the output file are the same file."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Create a SameFileError with the path of the file.
+
+        Parameters
+        ----------
+        path : Path
+            The path of the input file.
+        """
+        super().__init__(
+            f"The input file '{path}' is also the output file."
+            + " Please give another output file.",
+        )
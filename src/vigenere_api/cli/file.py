@@ -0,0 +1,110 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Cipher or decipher a file with memory maps."""
+
+from mmap import ACCESS_READ, ACCESS_WRITE, mmap
+from pathlib import Path
+from typing import Final
+
+from vigenere_api.models import BaseStream
+
+from .errors import BadBlockSizeError, SameFileError, StreamTypeError
+
+
+BLOCK_SIZE: Final = 16 * 1024 * 1024
+"""Default number of bytes read and moved at once."""
+
+
+def cipher_file(
+    input_path: Path,
+    output_path: Path,
+    stream: BaseStream,
+    block_size: int = BLOCK_SIZE,
+) -> int:
+    """
+    Apply the stream on the input file and write the result in the output file.
+
+    The input file is memory-mapped and moved by blocks.
+    The moved text is never longer than the text, so the output file is
+    preallocated with the size of the input file, memory-mapped,
+    then truncated to the written size.
+
+    Parameters
+    ----------
+    input_path : Path
+        The file to cipher or decipher, in UTF-8.
+    output_path : Path
+        The file receiving the result, created or replaced.
+    stream : BaseStream
+        The new stream applying the algorithm.
+    block_size : int, default BLOCK_SIZE
+        The number of bytes moved at once.
+
+    Raises
+    ------
+    StreamTypeError
+        Thrown if 'stream' is not a CaesarStream or a VigenereStream object.
+    BadBlockSizeError
+        Thrown if 'block_size' is lower than 1.
+    SameFileError
+        Thrown if 'output_path' is the input file.
+    OSError
+        Thrown if a file cannot be read or written.
+
+    Returns
+    -------
+    written_size
+        int
+        The size of the output file.
+    """
+    if not isinstance(stream, BaseStream):
+        raise StreamTypeError(stream)
+
+    if block_size < 1:
+        raise BadBlockSizeError(block_size)
+
+    if output_path.exists() and output_path.samefile(input_path):
+        raise SameFileError(input_path)
+
+    with input_path.open("rb") as input_file, output_path.open("wb+") as output_file:
+        size = input_path.stat().st_size
+        if size == 0:
+            output_file.write(stream.finalize_bytes())
+            return output_file.tell()
+
+        output_file.truncate(size)
+        written_size = 0
+        with (
+            mmap(input_file.fileno(), 0, access=ACCESS_READ) as input_map,
+            mmap(
+                output_file.fileno(),
+                0,
+                access=ACCESS_WRITE,
+            ) as output_map,
+        ):
+            for start in range(0, size, block_size):
+                moved_block = stream.update_bytes(input_map[start : start + block_size])
+                output_map[written_size : written_size + len(moved_block)] = moved_block
+                written_size += len(moved_block)
+
+            moved_rest = stream.finalize_bytes()
+            output_map[written_size : written_size + len(moved_rest)] = moved_rest
+            written_size += len(moved_rest)
+
+        output_file.truncate(written_size)
+
+    return written_size
@@ -16,8 +16,16 @@
 
 """Common helpers for the package vigenere_api."""
 
-from .errors import VigenereAPITypeError
+from .environment import get_int_env
+from .errors import EnvironmentVariableValueError, VigenereAPITypeError
 from .model import Model
+from .processes import get_process_context
 
 
-__all__ = ["Model", "VigenereAPITypeError"]
+__all__ = [
+    "Model",
+    "VigenereAPITypeError",
+    "EnvironmentVariableValueError",
+    "get_int_env",
+    "get_process_context",
+]
@@ -0,0 +1,57 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Read the configuration of Vigenere-API from the environment variables."""
+
+from os import environ
+
+from .errors import EnvironmentVariableValueError
+
+
+def get_int_env(name: str, default: int) -> int:
+    """
+    Get the positive integer stored in the environment variable.
+
+    Parameters
+    ----------
+    name : str
+        The name of the environment variable.
+    default : int
+        The value used if the environment variable is not defined.
+
+    Raises
+    ------
+    EnvironmentVariableValueError
+        Thrown if the environment variable is not a positive integer.
+
+    Returns
+    -------
+    value
+        int
+    """
+    value = environ.get(name)
+    if value is None:
+        return default
+
+    try:
+        integer = int(value)
+    except ValueError as error:
+        raise EnvironmentVariableValueError(name, value) from error
+
+    if integer < 0:
+        raise EnvironmentVariableValueError(name, value)
+
+    return integer
@@ -16,7 +16,7 @@
 
 """All common errors for vigenere-api."""
 
-from typing import Any
+from typing import Any, final
 
 
 class VigenereAPITypeError(TypeError):
@@ -26,3 +26,24 @@ class VigenereAPITypeError(TypeError):
         """Create a new type error."""
         cls_name = type(obj).__qualname__
         super().__init__(f"The {name} is '{cls_name}'." + f" Please give {waited_obj}.")
+
+
+@final
+class EnvironmentVariableValueError(ValueError):
+    """Thrown if an environment variable does not contain a positive integer."""
+
+    def __init__(self, name: str, value: str) -> None:
+        """
+        Create an EnvironmentVariableValueError with the variable name and its value.
+
+        Parameters
+        ----------
+        name : str
+            The name of the environment variable.
+        value : str
+            The value of the environment variable.
+        """
+        super().__init__(
+            f"The environment variable '{name}' is equal to '{value}'."
+            + " Please give an integer greater or equal to zero.",
+        )
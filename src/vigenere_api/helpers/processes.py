@@ -0,0 +1,47 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Start the worker processes of Vigenere-API."""
+
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.context import BaseContext
+
+
+FORKSERVER_METHOD = "forkserver"
+SPAWN_METHOD = "spawn"
+
+
+def get_process_context() -> BaseContext:
+    """
+    Get the context starting the worker processes, without fork.
+
+    The pools are started from processes running threads, like the event loop
+    and the job threads. A forked child could copy a lock held by another thread.
+    The forkserver method is used where it exists, else the spawn method.
+
+    Returns
+    -------
+    context
+        BaseContext
+
+    Examples
+    --------
+    >>> get_process_context().get_start_method() in ("forkserver", "spawn")
+    True
+    """
+    if FORKSERVER_METHOD in get_all_start_methods():
+        return get_context(FORKSERVER_METHOD)
+    return get_context(SPAWN_METHOD)
@@ -17,7 +17,32 @@
 """All models used by VigenereAPI."""
 
 from .caesar import CaesarData
+from .cryptanalysis import (
+    CaesarCandidate,
+    CaesarDecryptData,
+    CaesarDecryptResult,
+    KeyLengthCandidate,
+    Language,
+    VigenereCandidate,
+    VigenereDecryptData,
+    VigenereDecryptResult,
+)
+from .stream import BaseStream, CaesarStream, VigenereStream
 from .vigenere import VigenereData
 
 
-__all__ = ["CaesarData", "VigenereData"]
+__all__ = [
+    "CaesarData",
+    "VigenereData",
+    "BaseStream",
+    "CaesarStream",
+    "VigenereStream",
+    "CaesarDecryptData",
+    "CaesarDecryptResult",
+    "CaesarCandidate",
+    "VigenereDecryptData",
+    "VigenereDecryptResult",
+    "KeyLengthCandidate",
+    "Language",
+    "VigenereCandidate",
+]
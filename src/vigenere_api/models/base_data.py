@@ -18,6 +18,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from pydantic import StrictStr, validator
 
 from vigenere_api.helpers import Model
@@ -26,11 +28,80 @@ from .errors import ContentTypeError, EmptyContentError
 
 
 class BaseData(Model):
-    """Base data to verify the content."""
+    """
+    Base data to verify the content.
+
+    Notes
+    -----
+    The valid data is checked once, without building any error,
+    and stored like 'construct' does. Only the invalid data goes through
+    the pydantic validators, to raise the detailed errors.
+    """
 
     content: StrictStr
     """The content to be ciphered or deciphered."""
 
+    def __init__(self, **data: Any) -> None:
+        """
+        Create the model from the data.
+
+        Parameters
+        ----------
+        **data : Any
+            The value of each field.
+
+        Raises
+        ------
+        ValidationError
+            Thrown if the data does not respect the constraints.
+        """
+        if not data.keys() <= self.__fields__.keys() or not self._is_valid(data):
+            super().__init__(**data)
+            return
+
+        object.__setattr__(self, "__dict__", self._get_valid_values(data))
+        object.__setattr__(self, "__fields_set__", set(data))
+        self._init_private_attributes()
+
+    @classmethod
+    def _is_valid(cls, data: dict[str, Any]) -> bool:
+        """
+        Check the data without building any error.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The value of each field.
+
+        Returns
+        -------
+        is_valid
+            bool
+        """
+        content = data.get("content")
+        return type(content) is str and len(content) > 0
+
+    @classmethod
+    def _get_valid_values(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Get the value of each field from the valid data, or its default.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The value of each field, checked by '_is_valid'.
+
+        Returns
+        -------
+        values
+            dict[str, Any]
+            The values in the order of the fields.
+        """
+        return {
+            name: data[name] if name in data else field.get_default()
+            for name, field in cls.__fields__.items()
+        }
+
     @validator("content", pre=True)
     def validate_content(cls, content: str) -> str:
         """
@@ -18,7 +18,7 @@
 
 from __future__ import annotations
 
-from typing import final, Union
+from typing import Any, final, Union
 
 from pydantic import StrictInt, StrictStr, validator
 
@@ -28,14 +28,8 @@ from .errors import (
     AlgorithmKeyTypeError,
     AlgorithmTextTypeError,
 )
-from .helpers import convert_key, move_char
-from .helpers.errors import (
-    BadKeyError,
-    EmptyKeyError,
-    ExpectedKeyType,
-    KeyTypeError,
-    TooLongKeyError,
-)
+from .helpers import convert_key, get_shift_table
+from .helpers.check_key import check_caesar_key
 
 
 Key = Union[StrictInt, StrictStr]
@@ -59,6 +53,11 @@ class CaesarData(BaseData):
 
     >>> assert caesar_data == deciphered_data == "Hello World"
     >>> assert caesar_data.key == ciphered_data.key == deciphered_data.key == 1
+
+    Notes
+    -----
+    Only the input is validated. The results are built with 'construct',
+    their content and key are valid by construction.
     """
 
     key: Key
@@ -73,7 +72,7 @@ class CaesarData(BaseData):
         ciphered_data
             CaesarData
         """
-        return CaesarData(
+        return CaesarData.construct(
             content=self.__algorithm(self.content, self.__convert_key()),
             key=self.key,
         )
@@ -87,7 +86,7 @@ class CaesarData(BaseData):
         deciphered_data
             CaesarData
         """
-        return CaesarData(
+        return CaesarData.construct(
             content=self.__algorithm(self.content, -self.__convert_key()),
             key=self.key,
         )
@@ -123,17 +122,7 @@ class CaesarData(BaseData):
         if not isinstance(key, int):
             raise AlgorithmKeyTypeError(key, AlgorithmExpectedKeyType.INTEGER)
 
-        result = ""
-        for char in text:
-            if char.isalpha():
-                if char.isupper():
-                    result += move_char(char, key, "A")
-                else:
-                    result += move_char(char, key, "a")
-            else:
-                result += char
-
-        return result
+        return text.translate(get_shift_table(key))
 
     def __convert_key(self) -> int:
         """
@@ -149,6 +138,26 @@ class CaesarData(BaseData):
 
         return convert_key(self.key)
 
+    @classmethod
+    def _is_valid(cls, data: dict[str, Any]) -> bool:
+        """
+        Check the data without building any error.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The value of each field.
+
+        Returns
+        -------
+        is_valid
+            bool
+        """
+        key = data.get("key")
+        return super()._is_valid(data) and (
+            type(key) is int or (type(key) is str and len(key) == 1 and key.isalpha())
+        )
+
     @validator("key", pre=True)
     def validate_key(cls, key: Key) -> Key:
         """
@@ -175,17 +184,6 @@ class CaesarData(BaseData):
         key
             Key
         """
-        if not isinstance(key, (str, int)):
-            raise KeyTypeError(key, ExpectedKeyType.STRING_OR_INTEGER)
-
-        if isinstance(key, str):
-            if len(key) == 0:
-                raise EmptyKeyError
-
-            if len(key) > 1:
-                raise TooLongKeyError
-
-            if not key.isalpha():
-                raise BadKeyError(key, ExpectedKeyType.STRING_OR_INTEGER)
+        check_caesar_key(key)
 
         return key
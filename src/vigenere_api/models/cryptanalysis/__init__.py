@@ -0,0 +1,112 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Decrypt the contents without their key."""
+
+from .caesar import CaesarCandidate, CaesarDecryptData, CaesarDecryptResult
+from .fitness import QuadgramScorer
+from .frequencies import (
+    DECRYPT_SAMPLE_SIZE,
+    ENGLISH_FREQUENCIES,
+    FRENCH_FREQUENCIES,
+    GERMAN_FREQUENCIES,
+    get_analysed_length,
+    get_chi_squared_scores,
+    get_column_chi_squared_scores,
+    get_letter_codes,
+    get_letter_histogram,
+    get_sample,
+)
+from .kasiski import (
+    count_period_repeats,
+    get_kasiski_distances,
+    get_repeat_distances,
+    KASISKI_MAX_OCCURRENCES,
+)
+from .key_length import (
+    estimate_key_lengths,
+    get_column_histograms,
+    get_index_of_coincidence,
+    KeyLengthCandidate,
+    MAX_KEY_LENGTH,
+)
+from .key_search import (
+    DECRYPT_KEY_COUNT,
+    get_deciphered_histogram,
+    get_key_period,
+    get_key_shifts,
+    search_keys,
+    VigenereCandidate,
+)
+from .language import (
+    count_ngrams,
+    get_language_model,
+    get_ngram_table,
+    Language,
+    LanguageModel,
+    LanguageModelLoader,
+    load_reference_model,
+    read_ngram_counts,
+    register_language_model,
+    remove_accents,
+)
+from .vigenere import VigenereDecryptData, VigenereDecryptResult
+
+
+__all__ = [
+    "CaesarDecryptData",
+    "CaesarDecryptResult",
+    "CaesarCandidate",
+    "VigenereDecryptData",
+    "VigenereDecryptResult",
+    "VigenereCandidate",
+    "KeyLengthCandidate",
+    "Language",
+    "LanguageModel",
+    "LanguageModelLoader",
+    "QuadgramScorer",
+    "get_letter_histogram",
+    "get_chi_squared_scores",
+    "get_column_chi_squared_scores",
+    "get_sample",
+    "get_letter_codes",
+    "get_column_histograms",
+    "get_index_of_coincidence",
+    "estimate_key_lengths",
+    "get_repeat_distances",
+    "get_kasiski_distances",
+    "count_period_repeats",
+    "get_key_shifts",
+    "get_key_period",
+    "get_deciphered_histogram",
+    "search_keys",
+    "get_language_model",
+    "register_language_model",
+    "load_reference_model",
+    "read_ngram_counts",
+    "count_ngrams",
+    "get_ngram_table",
+    "remove_accents",
+    "get_analysed_length",
+    "DECRYPT_SAMPLE_SIZE",
+    "MAX_KEY_LENGTH",
+    "KASISKI_MAX_OCCURRENCES",
+    "DECRYPT_KEY_COUNT",
+    "ENGLISH_FREQUENCIES",
+    "FRENCH_FREQUENCIES",
+    "GERMAN_FREQUENCIES",
+]
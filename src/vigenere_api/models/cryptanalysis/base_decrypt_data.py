@@ -0,0 +1,116 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Base model of the contents to decrypt."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Final
+
+from pydantic import validator
+
+from vigenere_api.models.base_data import BaseData
+from vigenere_api.models.errors import NoLetterContentError
+
+from .language import Language
+
+
+ASCII_LETTER: Final = re.compile("[A-Za-z]")
+"""Pattern of a letter moved by the algorithms and counted by the analysis."""
+
+_LANGUAGE_CODES: Final = frozenset(language.value for language in Language)
+
+
+class BaseDecryptData(BaseData):
+    """Base data to verify a content to decrypt, its key is unknown."""
+
+    language: Language = Language.EN
+    """The language of the content, its letter statistics are the reference."""
+
+    @classmethod
+    def _is_valid(cls, data: dict[str, Any]) -> bool:
+        """
+        Check the data without building any error.
+
+        The language can be missing, a Language or its code, like in a JSON body.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The value of each field.
+
+        Returns
+        -------
+        is_valid
+            bool
+        """
+        language = data.get("language", Language.EN)
+        return (
+            super()._is_valid(data)
+            and (
+                isinstance(language, Language)
+                or (type(language) is str and language in _LANGUAGE_CODES)
+            )
+            and ASCII_LETTER.search(data["content"]) is not None
+        )
+
+    @classmethod
+    def _get_valid_values(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Get the value of each field from the valid data, the language as a Language.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The value of each field, checked by '_is_valid'.
+
+        Returns
+        -------
+        values
+            dict[str, Any]
+            The values in the order of the fields.
+        """
+        values = super()._get_valid_values(data)
+        values["language"] = Language(values["language"])
+
+        return values
+
+    @validator("content")
+    def validate_letters(cls, content: str) -> str:
+        """
+        Check if the content has a letter to analyse.
+
+        Parameters
+        ----------
+        content : str
+            The new content.
+
+        Raises
+        ------
+        NoLetterContentError
+            Thrown if 'content' has no ASCII letter.
+
+        Returns
+        -------
+        content
+            str
+        """
+        if ASCII_LETTER.search(content) is None:
+            raise NoLetterContentError
+
+        return content
@@ -0,0 +1,103 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Decrypt a Caesar content without its key."""
+
+from __future__ import annotations
+
+from typing import final
+
+from pydantic import StrictFloat, StrictInt
+
+from vigenere_api.helpers import Model
+
+from .base_decrypt_data import BaseDecryptData
+from .frequencies import (
+    DECRYPT_SAMPLE_SIZE,
+    get_chi_squared_scores,
+    get_letter_histogram,
+    get_sample,
+)
+from .language import get_language_model
+
+
+@final
+class CaesarCandidate(Model):
+    """A possible key of a Caesar content, with its score."""
+
+    key: StrictInt
+    """The key, between 0 and 25, to decipher the content."""
+
+    score: StrictFloat
+    """The chi-squared statistic of the deciphered letters, lower is better."""
+
+
+@final
+class CaesarDecryptResult(Model):
+    """The possible keys of a Caesar content."""
+
+    candidates: list[CaesarCandidate]
+    """All keys, from the most likely to the least likely."""
+
+
+@final
+class CaesarDecryptData(BaseDecryptData):
+    """
+    Caesar content to decrypt, its key is unknown.
+
+    Exemples
+    --------
+    >>> from vigenere_api.models import CaesarData, CaesarDecryptData
+
+    >>> ciphered_data = CaesarData(content="Hello World, this is a secret", key=3)
+    >>> content = ciphered_data.cipher().content
+    >>> result = CaesarDecryptData(content=content).decrypt()
+    >>> result.candidates[0].key
+    3
+    """
+
+    def decrypt(self, sample_size: int = DECRYPT_SAMPLE_SIZE) -> CaesarDecryptResult:
+        """
+        Rank the 26 keys with the letter frequencies of the content.
+
+        The letters are counted once, on a sample if the content is large,
+        then the histogram is rotated for each key and compared with the letter
+        frequencies of the language.
+
+        Parameters
+        ----------
+        sample_size : int, default DECRYPT_SAMPLE_SIZE
+            The maximal number of characters analysed, 0 analyses the whole content.
+
+        Returns
+        -------
+        result
+            CaesarDecryptResult
+        """
+        histogram = get_letter_histogram(get_sample(self.content, sample_size))
+        if sum(histogram) == 0:
+            histogram = get_letter_histogram(self.content)
+
+        frequencies = get_language_model(self.language).frequencies
+        scores = get_chi_squared_scores(histogram, frequencies)
+        ranking = sorted(range(len(scores)), key=scores.__getitem__)
+
+        return CaesarDecryptResult.construct(
+            candidates=[
+                CaesarCandidate.construct(key=key, score=scores[key]) for key in ranking
+            ],
+        )
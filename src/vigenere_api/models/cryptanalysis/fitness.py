@@ -0,0 +1,193 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Score the keys of a content with the quadgrams of a language."""
+
+from __future__ import annotations
+
+from typing import final, Final, Optional, TYPE_CHECKING
+
+from vigenere_api.models.helpers.shift_table import ALPHABET_LENGTH
+from vigenere_api.models.helpers.vigenere_engine import NUMPY_THRESHOLD
+
+from .frequencies import OTHER_LETTER
+from .language import QUADGRAM_SIZE
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from .language import LanguageModel
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+
+_SQUARE: Final = ALPHABET_LENGTH * ALPHABET_LENGTH
+_CUBE: Final = _SQUARE * ALPHABET_LENGTH
+
+if HAS_NUMPY:
+    _PLACE_VALUES: Final = np.array(
+        [_CUBE, _SQUARE, ALPHABET_LENGTH, 1],
+        dtype=np.intp,
+    )
+
+
+@final
+class QuadgramScorer:
+    """
+    Score the keys of a content by the quadgrams of its deciphered letters.
+
+    The letter codes and their quadgram positions are prepared once,
+    so a key search can score thousands of keys by second.
+    With NumPy, a key is scored in one vectorized pass over the quadgrams.
+
+    Exemples
+    --------
+    >>> from vigenere_api.models.cryptanalysis import (
+    ...     get_language_model,
+    ...     get_letter_codes,
+    ...     Language,
+    ... )
+
+    >>> letter_codes = get_letter_codes("Xli tistpi sj xli Yrmxih Wxexiw")
+    >>> scorer = QuadgramScorer(letter_codes, get_language_model(Language.EN))
+    >>> scorer.score([4]) > scorer.score([5])
+    True
+    """
+
+    __slots__ = ("__codes", "__starts", "__table", "__arrays")
+
+    def __init__(
+        self,
+        letter_codes: bytes,
+        model: LanguageModel,
+        numpy_threshold: Optional[int] = None,
+    ) -> None:
+        """
+        Prepare the content to score its keys.
+
+        Parameters
+        ----------
+        letter_codes : bytes
+            The ciphered letter codes, from get_letter_codes.
+        model : LanguageModel
+            The model of the language of the content.
+        numpy_threshold : Optional[int], default NUMPY_THRESHOLD
+            The minimal number of letters to use NumPy.
+        """
+        if numpy_threshold is None:
+            numpy_threshold = NUMPY_THRESHOLD
+
+        # A quadgram ends at the fourth consecutive ASCII letter.
+        starts = []
+        nb_letters = 0
+        for position, code in enumerate(letter_codes):
+            nb_letters = 0 if code == OTHER_LETTER else nb_letters + 1
+            if nb_letters >= QUADGRAM_SIZE:
+                starts.append(position - QUADGRAM_SIZE + 1)
+
+        self.__codes: Final = letter_codes
+        self.__starts: Final = starts
+        self.__table: Final = model.quadgrams
+        self.__arrays: Final = (
+            self.__get_arrays(letter_codes, starts, model)
+            if HAS_NUMPY and len(letter_codes) >= numpy_threshold
+            else None
+        )
+
+    def score(self, shifts: Sequence[int]) -> float:
+        """
+        Get the log10 probability of the quadgrams deciphered with the key.
+
+        Parameters
+        ----------
+        shifts : Sequence[int]
+            The shift, between 0 and 25, of each key letter.
+
+        Returns
+        -------
+        score
+            float
+            The sum of the log10 probabilities, higher is better.
+        """
+        if self.__arrays is not None:
+            codes, key_positions, table = self.__arrays
+            key = np.asarray(shifts, dtype=np.intp)
+            # plain[letter, position] is the letter at the position of its quadgram.
+            plain = codes - key[key_positions % key.size]
+            plain %= ALPHABET_LENGTH
+            indexes = plain @ _PLACE_VALUES
+            return float(table[indexes].sum(dtype=np.float64))
+
+        length = len(shifts)
+        letters = [
+            (code - shifts[position % length]) % ALPHABET_LENGTH
+            for position, code in enumerate(self.__codes)
+        ]
+        quadgrams = self.__table
+        return sum(
+            quadgrams[
+                letters[start] * _CUBE
+                + letters[start + 1] * _SQUARE
+                + letters[start + 2] * ALPHABET_LENGTH
+                + letters[start + 3]
+            ]
+            for start in self.__starts
+        )
+
+    @staticmethod
+    def __get_arrays(
+        letter_codes: bytes,
+        starts: list[int],
+        model: LanguageModel,
+    ) -> tuple[NDArray[np.intp], NDArray[np.intp], NDArray[np.float32]]:
+        """
+        Gather the letters of each quadgram, with their positions in the key.
+
+        Parameters
+        ----------
+        letter_codes : bytes
+            The ciphered letter codes.
+        starts : list[int]
+            The position of the first letter of each quadgram.
+        model : LanguageModel
+            The model of the language of the content.
+
+        Returns
+        -------
+        arrays
+            tuple[NDArray[np.intp], NDArray[np.intp], NDArray[np.float32]]
+            The letter codes and the positions of each quadgram,
+            and the quadgram table read without copy.
+        """
+        positions = np.array(starts, dtype=np.intp)[:, None] + np.arange(
+            QUADGRAM_SIZE,
+            dtype=np.intp,
+        )
+        codes = np.frombuffer(letter_codes, dtype=np.uint8).astype(np.intp)
+        return (
+            codes[positions],
+            positions,
+            np.frombuffer(model.quadgrams, dtype=np.float32),
+        )
@@ -0,0 +1,410 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Letter frequencies of the texts and of the reference languages."""
+
+from collections.abc import Sequence
+from string import ascii_letters
+from typing import Final, Optional
+
+from vigenere_api.helpers import get_int_env
+from vigenere_api.models.helpers.shift_table import (
+    ALPHABET_LENGTH,
+    LOWER_FIRST_LETTER,
+    UPPER_FIRST_LETTER,
+)
+from vigenere_api.models.helpers.vigenere_engine import NUMPY_THRESHOLD
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+
+DECRYPT_SAMPLE_SIZE: Final = get_int_env("VIGENERE_API_DECRYPT_SAMPLE_SIZE", 262_144)
+"""Maximal number of characters analysed to decrypt a content, 0 disables the limit."""
+
+SAMPLE_BLOCKS: Final = 16
+"""Number of blocks, spread over the text, forming a sample."""
+
+_BYTE_COUNT: Final = 256
+
+ENGLISH_FREQUENCIES: Final = (
+    0.08167,
+    0.01492,
+    0.02782,
+    0.04253,
+    0.12702,
+    0.02228,
+    0.02015,
+    0.06094,
+    0.06966,
+    0.00153,
+    0.00772,
+    0.04025,
+    0.02406,
+    0.06749,
+    0.07507,
+    0.01929,
+    0.00095,
+    0.05987,
+    0.06327,
+    0.09056,
+    0.02758,
+    0.00978,
+    0.02360,
+    0.00150,
+    0.01974,
+    0.00074,
+)
+"""Frequency of each letter, from A to Z, in English texts."""
+
+FRENCH_FREQUENCIES: Final = (
+    0.07636,
+    0.00901,
+    0.03260,
+    0.03669,
+    0.14715,
+    0.01066,
+    0.00866,
+    0.00737,
+    0.07529,
+    0.00613,
+    0.00074,
+    0.05456,
+    0.02968,
+    0.07095,
+    0.05796,
+    0.02521,
+    0.01362,
+    0.06693,
+    0.07948,
+    0.07244,
+    0.06311,
+    0.01838,
+    0.00049,
+    0.00427,
+    0.00128,
+    0.00326,
+)
+"""Frequency of each letter, from A to Z, in French texts,
+without the accented letters."""
+
+GERMAN_FREQUENCIES: Final = (
+    0.06516,
+    0.01886,
+    0.02732,
+    0.05076,
+    0.16396,
+    0.01656,
+    0.03009,
+    0.04577,
+    0.06550,
+    0.00268,
+    0.01417,
+    0.03437,
+    0.02534,
+    0.09776,
+    0.02594,
+    0.00670,
+    0.00018,
+    0.07003,
+    0.07270,
+    0.06154,
+    0.04166,
+    0.00846,
+    0.01921,
+    0.00034,
+    0.00039,
+    0.01134,
+)
+"""Frequency of each letter, from A to Z, in German texts,
+without the umlauts and the eszett."""
+
+OTHER_LETTER: Final = ALPHABET_LENGTH
+"""Code of an alphabetic character which is not an ASCII letter."""
+
+_ASCII_LETTERS: Final = ascii_letters.encode("ascii")
+_NOT_ASCII_LETTERS: Final = bytes(
+    code for code in range(_BYTE_COUNT) if code not in _ASCII_LETTERS
+)
+_LETTER_CODES: Final = bytes(
+    (
+        ord(chr(code).lower()) - LOWER_FIRST_LETTER
+        if code in _ASCII_LETTERS
+        else OTHER_LETTER
+    )
+    for code in range(_BYTE_COUNT)
+)
+
+_UPPER_LETTERS: Final = tuple(
+    bytes((code,))
+    for code in range(UPPER_FIRST_LETTER, UPPER_FIRST_LETTER + ALPHABET_LENGTH)
+)
+
+
+def get_sample(text: str, sample_size: int) -> str:
+    """
+    Get blocks spread over the text, with a total length of about the sample size.
+
+    Parameters
+    ----------
+    text : str
+        The text to sample.
+    sample_size : int
+        The maximal length of the sample, 0 returns the whole text.
+
+    Returns
+    -------
+    sample
+        str
+
+    Examples
+    --------
+    >>> get_sample("Hello", 32)
+    'Hello'
+    >>> len(get_sample("a" * 1000, 32))
+    32
+    >>> get_sample("abcdef", 5)
+    'abcde'
+    >>> get_sample("abcdefghij", 2)
+    'aj'
+    """
+    if sample_size <= 0 or len(text) <= sample_size:
+        return text
+
+    # A sample smaller than SAMPLE_BLOCKS is made of blocks of one character.
+    nb_blocks = min(SAMPLE_BLOCKS, sample_size)
+    block_size = sample_size // nb_blocks
+    # The text is longer than the sample, so the step is at least the block size.
+    step = (len(text) - block_size) // max(nb_blocks - 1, 1)
+
+    return "".join(
+        text[start : start + block_size] for start in range(0, step * nb_blocks, step)
+    )
+
+
+def get_analysed_length(length: int, sample_size: int) -> int:
+    """
+    Get the number of characters analysed in a text.
+
+    Parameters
+    ----------
+    length : int
+        The length of the text.
+    sample_size : int
+        The maximal length of the sample, 0 analyses the whole text.
+
+    Returns
+    -------
+    analysed_length
+        int
+
+    Examples
+    --------
+    >>> get_analysed_length(1000, 32)
+    32
+    >>> get_analysed_length(1000, 0)
+    1000
+    """
+    if sample_size <= 0:
+        return length
+
+    return min(length, sample_size)
+
+
+def get_letter_histogram(text: str, numpy_threshold: Optional[int] = None) -> list[int]:
+    """
+    Count each ASCII letter of the text, without distinction of case.
+
+    The other characters are not moved by the same shifts as the ASCII letters,
+    they are ignored. NumPy counts all bytes in one pass if it is installed
+    and if the text is not shorter than the threshold.
+
+    Parameters
+    ----------
+    text : str
+        The text to analyse.
+    numpy_threshold : Optional[int], default NUMPY_THRESHOLD
+        The minimal length of the encoded text to use NumPy.
+
+    Returns
+    -------
+    histogram
+        list[int]
+        The number of each letter, from A to Z.
+
+    Examples
+    --------
+    >>> get_letter_histogram("Abba!")[:3]
+    [2, 2, 0]
+    """
+    data = text.encode("utf-8", "surrogatepass")
+    if numpy_threshold is None:
+        numpy_threshold = NUMPY_THRESHOLD
+
+    if HAS_NUMPY and len(data) >= numpy_threshold:
+        counts = np.bincount(
+            np.frombuffer(data, dtype=np.uint8),
+            minlength=_BYTE_COUNT,
+        )
+        letters = (
+            counts[UPPER_FIRST_LETTER : UPPER_FIRST_LETTER + ALPHABET_LENGTH]
+            + counts[LOWER_FIRST_LETTER : LOWER_FIRST_LETTER + ALPHABET_LENGTH]
+        )
+        return [int(count) for count in letters]
+
+    upper_data = data.upper()
+    return [upper_data.count(letter) for letter in _UPPER_LETTERS]
+
+
+def get_letter_codes(text: str) -> bytes:
+    """
+    Get the alphabetic characters of the text, each one consuming a Vigenere shift.
+
+    The ASCII letters get their code, from 0 for A to 25 for Z,
+    without distinction of case. The other alphabetic characters get OTHER_LETTER,
+    they keep the positions of the next letters in the key.
+
+    Parameters
+    ----------
+    text : str
+        The text to analyse.
+
+    Returns
+    -------
+    letter_codes
+        bytes
+
+    Examples
+    --------
+    >>> list(get_letter_codes("Ab, zé!"))
+    [0, 1, 25, 26]
+    """
+    if text.isascii():
+        return text.encode("ascii").translate(_LETTER_CODES, _NOT_ASCII_LETTERS)
+
+    letters = "".join(filter(str.isalpha, text)).encode("ascii", "replace")
+    return letters.translate(_LETTER_CODES)
+
+
+def get_chi_squared_scores(
+    histogram: Sequence[int],
+    frequencies: Sequence[float],
+) -> list[float]:
+    """
+    Compare the histogram, moved back by each shift, with the frequencies.
+
+    The histogram is counted once and rotated for each shift,
+    instead of deciphering the text with each shift.
+
+    Parameters
+    ----------
+    histogram : Sequence[int]
+        The number of each letter of the ciphered text, from A to Z.
+    frequencies : Sequence[float]
+        The frequency of each letter in the language, from A to Z.
+
+    Returns
+    -------
+    scores
+        list[float]
+        The chi-squared statistic of each shift, from 0 to 25.
+        The lower the score, the closer the deciphered text is to the language.
+
+    Examples
+    --------
+    >>> scores = get_chi_squared_scores([0, 10, 0], [1.0, 0.5, 0.5])
+    >>> scores.index(min(scores))
+    1
+    """
+    total = sum(histogram)
+    expected_counts = [total * frequency for frequency in frequencies]
+    letters = list(histogram)
+
+    scores = []
+    for shift in range(len(letters)):
+        rotated = letters[shift:] + letters[:shift]
+        scores.append(
+            sum(
+                (observed - expected) * (observed - expected) / expected
+                for observed, expected in zip(rotated, expected_counts)
+            ),
+        )
+
+    return scores
+
+
+def get_column_chi_squared_scores(
+    histograms: Sequence[Sequence[int]],
+    frequencies: Sequence[float],
+    numpy_threshold: Optional[int] = None,
+) -> list[list[float]]:
+    """
+    Compare the column histograms, moved back by each shift, with the frequencies.
+
+    NumPy scores all columns and shifts in one pass if it is installed
+    and if the letters are not fewer than the threshold.
+
+    Parameters
+    ----------
+    histograms : Sequence[Sequence[int]]
+        The number of each letter of each column, from A to Z.
+    frequencies : Sequence[float]
+        The frequency of each letter in the language, from A to Z.
+    numpy_threshold : Optional[int], default NUMPY_THRESHOLD
+        The minimal number of letters to use NumPy.
+
+    Returns
+    -------
+    scores
+        list[list[float]]
+        The chi-squared statistic of each shift of each column.
+        A column without letter has the score 0 for all shifts.
+
+    Examples
+    --------
+    >>> scores = get_column_chi_squared_scores([[0, 10, 0], [0, 0, 0]], [1.0, 0.5, 0.5])
+    >>> scores[0].index(min(scores[0])), scores[1]
+    (1, [0.0, 0.0, 0.0])
+    """
+    if numpy_threshold is None:
+        numpy_threshold = NUMPY_THRESHOLD
+
+    nb_letters = sum(sum(histogram) for histogram in histograms)
+    if HAS_NUMPY and nb_letters >= numpy_threshold and len(histograms) > 0:
+        counts = np.array(histograms, dtype=np.float64)
+        size = counts.shape[1]
+        # rotated[column, shift, letter] is the count of the letter moved by shift.
+        rotations = (np.arange(size)[:, None] + np.arange(size)[None, :]) % size
+        rotated = counts[:, rotations]
+        expected = counts.sum(axis=1)[:, None, None] * np.array(frequencies)
+        divisors = np.where(expected > 0, expected, 1.0)
+        scores = ((rotated - expected) ** 2 / divisors).sum(axis=2)
+        return [[float(score) for score in column] for column in scores]
+
+    return [
+        (
+            get_chi_squared_scores(histogram, frequencies)
+            if sum(histogram) > 0
+            else [0.0] * len(histogram)
+        )
+        for histogram in histograms
+    ]
@@ -0,0 +1,241 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Estimate the length of a Vigenere key with the Kasiski examination."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Final, Optional
+
+from vigenere_api.helpers import get_int_env
+from vigenere_api.models.helpers.vigenere_engine import NUMPY_THRESHOLD
+
+from .frequencies import OTHER_LETTER
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+
+NGRAM_SIZES: Final = (3, 4)
+"""Sizes of the repeated letter sequences searched, the trigrams and tetragrams."""
+
+KASISKI_MAX_OCCURRENCES: Final = get_int_env("VIGENERE_API_KASISKI_MAX_OCCURRENCES", 16)
+"""Maximal number of occurrences of a letter sequence in the Kasiski examination."""
+
+_BASE: Final = OTHER_LETTER + 1
+
+
+def get_repeat_distances(
+    letter_codes: bytes,
+    ngram_size: int,
+    max_occurrences: int = KASISKI_MAX_OCCURRENCES,
+    numpy_threshold: Optional[int] = None,
+) -> Counter[int]:
+    """
+    Count the distances between the repetitions of the letter sequences.
+
+    A letter sequence is identified by its rolling hash, its letter codes
+    written in base 27. The sequences with an OTHER_LETTER are ignored.
+    Each occurrence, until max_occurrences, gives its distance to the previous one.
+
+    NumPy sorts the sequences in one pass if it is installed
+    and if the letters are not fewer than the threshold.
+    Else the index keeps the last position and the count of each sequence.
+
+    Parameters
+    ----------
+    letter_codes : bytes
+        The letter codes, from get_letter_codes.
+    ngram_size : int
+        The number of letters of a sequence.
+    max_occurrences : int, default KASISKI_MAX_OCCURRENCES
+        The maximal number of occurrences of a sequence.
+    numpy_threshold : Optional[int], default NUMPY_THRESHOLD
+        The minimal number of letters to use NumPy.
+
+    Returns
+    -------
+    distances
+        Counter[int]
+        The number of repetitions at each distance.
+
+    Examples
+    --------
+    >>> from vigenere_api.models.cryptanalysis import get_letter_codes
+    >>> get_repeat_distances(get_letter_codes("abcxyabcxxabc"), 3)
+    Counter({5: 3})
+    """
+    if numpy_threshold is None:
+        numpy_threshold = NUMPY_THRESHOLD
+
+    if HAS_NUMPY and len(letter_codes) >= numpy_threshold:
+        return _get_repeat_distances_numpy(letter_codes, ngram_size, max_occurrences)
+
+    modulus = _BASE**ngram_size
+    index: dict[int, tuple[int, int]] = {}
+    distances: Counter[int] = Counter()
+    ngram_hash = 0
+    nb_letters = 0
+    for position, code in enumerate(letter_codes):
+        if code == OTHER_LETTER:
+            nb_letters = 0
+            continue
+
+        ngram_hash = (ngram_hash * _BASE + code) % modulus
+        nb_letters += 1
+        if nb_letters >= ngram_size:
+            previous = index.get(ngram_hash)
+            if previous is None:
+                index[ngram_hash] = (position, 1)
+            elif previous[1] < max_occurrences:
+                distances[position - previous[0]] += 1
+                index[ngram_hash] = (position, previous[1] + 1)
+
+    return distances
+
+
+def _get_repeat_distances_numpy(
+    letter_codes: bytes,
+    ngram_size: int,
+    max_occurrences: int,
+) -> Counter[int]:
+    """
+    Count the distances between the repetitions of the letter sequences with NumPy.
+
+    The rolling hashes of all the sequences are computed column by column,
+    then sorted to gather the occurrences of each sequence by position.
+
+    Parameters
+    ----------
+    letter_codes : bytes
+        The letter codes, from get_letter_codes.
+    ngram_size : int
+        The number of letters of a sequence.
+    max_occurrences : int
+        The maximal number of occurrences of a sequence.
+
+    Returns
+    -------
+    distances
+        Counter[int]
+        The number of repetitions at each distance.
+    """
+    nb_ngrams = len(letter_codes) - ngram_size + 1
+    if nb_ngrams <= 1:
+        return Counter()
+
+    codes = np.frombuffer(letter_codes, dtype=np.uint8).astype(np.intp)
+    hashes = np.zeros(nb_ngrams, dtype=np.intp)
+    is_word = np.ones(nb_ngrams, dtype=np.bool_)
+    for offset in range(ngram_size):
+        window = codes[offset : offset + nb_ngrams]
+        hashes *= _BASE
+        hashes += window
+        is_word &= window != OTHER_LETTER
+
+    positions = np.flatnonzero(is_word)
+    order = np.argsort(hashes[positions], kind="stable")
+    hashes = hashes[positions][order]
+    positions = positions[order]
+
+    # The occurrences of a sequence are consecutive and sorted by position,
+    # the rank of an occurrence is its index minus the index of the first one.
+    is_first = np.empty(len(hashes), dtype=np.bool_)
+    is_first[:1] = True
+    is_first[1:] = hashes[1:] != hashes[:-1]
+    firsts = np.flatnonzero(is_first)
+    ranks = np.arange(len(hashes)) - np.repeat(
+        firsts,
+        np.diff(firsts, append=len(hashes)),
+    )
+
+    is_repeat = (ranks > 0) & (ranks < max_occurrences)
+    gaps = np.diff(positions, prepend=0)[is_repeat]
+    values, counts = np.unique(gaps, return_counts=True)
+
+    return Counter(dict(zip(values.tolist(), counts.tolist())))
+
+
+def get_kasiski_distances(
+    letter_codes: bytes,
+    max_occurrences: int = KASISKI_MAX_OCCURRENCES,
+) -> Counter[int]:
+    """
+    Count the distances between the repetitions of the trigrams and tetragrams.
+
+    Parameters
+    ----------
+    letter_codes : bytes
+        The letter codes, from get_letter_codes.
+    max_occurrences : int, default KASISKI_MAX_OCCURRENCES
+        The maximal number of occurrences of a sequence.
+
+    Returns
+    -------
+    distances
+        Counter[int]
+        The number of repetitions at each distance.
+
+    Examples
+    --------
+    >>> from vigenere_api.models.cryptanalysis import get_letter_codes
+    >>> get_kasiski_distances(get_letter_codes("abcdxyabcdxx"))
+    Counter({6: 5})
+    """
+    distances: Counter[int] = Counter()
+    for ngram_size in NGRAM_SIZES:
+        distances.update(
+            get_repeat_distances(letter_codes, ngram_size, max_occurrences),
+        )
+
+    return distances
+
+
+def count_period_repeats(distances: Counter[int], periods: range) -> list[int]:
+    """
+    Count the repetitions at a multiple of each period.
+
+    A plain sequence ciphered at the same key position is repeated at
+    a multiple of the key length, the other repetitions are random.
+
+    Parameters
+    ----------
+    distances : Counter[int]
+        The number of repetitions at each distance, from get_kasiski_distances.
+    periods : range
+        The possible key lengths.
+
+    Returns
+    -------
+    repeats
+        list[int]
+        The number of repetitions of each period, in the order of periods.
+
+    Examples
+    --------
+    >>> count_period_repeats(Counter({6: 5, 8: 1}), range(2, 5))
+    [6, 5, 1]
+    """
+    return [
+        sum(count for distance, count in distances.items() if distance % period == 0)
+        for period in periods
+    ]
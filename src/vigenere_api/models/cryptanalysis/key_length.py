@@ -0,0 +1,241 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Estimate the length of a Vigenere key."""
+
+from __future__ import annotations
+
+from typing import final, Final, Optional
+
+from pydantic import StrictFloat, StrictInt
+
+from vigenere_api.helpers import get_int_env, Model
+from vigenere_api.models.helpers.shift_table import ALPHABET_LENGTH
+from vigenere_api.models.helpers.vigenere_engine import NUMPY_THRESHOLD
+
+from .frequencies import OTHER_LETTER
+from .kasiski import count_period_repeats, get_kasiski_distances
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+
+MIN_KEY_LENGTH: Final = 2
+"""Minimal length of a Vigenere key."""
+
+MAX_KEY_LENGTH: Final = get_int_env("VIGENERE_API_DECRYPT_MAX_KEY_LENGTH", 20)
+"""Maximal length of the Vigenere keys searched by the decrypt method."""
+
+RANDOM_INDEX_OF_COINCIDENCE: Final = 1 / ALPHABET_LENGTH
+"""Index of coincidence of uniformly random letters."""
+
+KEY_LENGTH_TOLERANCE: Final = 0.6
+"""Part of the gap between the random and the best index of coincidence,
+above which the key lengths are ranked by length."""
+
+KASISKI_SUPPORT: Final = 1.5
+"""Minimal ratio between the repetitions at a multiple of a key length
+and their number for random letters, to support this length."""
+
+_CODE_COUNT: Final = OTHER_LETTER + 1
+_LETTERS: Final = range(ALPHABET_LENGTH)
+
+
+@final
+class KeyLengthCandidate(Model):
+    """A possible length of a Vigenere key, with its score."""
+
+    length: StrictInt
+    """The length of the key."""
+
+    index_of_coincidence: StrictFloat
+    """The mean index of coincidence of the columns, higher is better."""
+
+    repeats: StrictInt
+    """The number of repeated trigrams and tetragrams at a multiple of the length."""
+
+
+def get_column_histograms(
+    letter_codes: bytes,
+    period: int,
+    numpy_threshold: Optional[int] = None,
+) -> list[list[int]]:
+    """
+    Count the letters of each column, a column being the letters of a key position.
+
+    NumPy counts the letters of all columns in one pass if it is installed
+    and if the letters are not fewer than the threshold.
+
+    Parameters
+    ----------
+    letter_codes : bytes
+        The letter codes, from get_letter_codes.
+    period : int
+        The number of columns, the length of the key.
+    numpy_threshold : Optional[int], default NUMPY_THRESHOLD
+        The minimal number of letters to use NumPy.
+
+    Returns
+    -------
+    histograms
+        list[list[int]]
+        The number of each letter, from A to Z, of each column.
+
+    Examples
+    --------
+    >>> histograms = get_column_histograms(bytes([0, 1, 0, 2]), 2)
+    >>> histograms[0][:3], histograms[1][:3]
+    ([2, 0, 0], [0, 1, 1])
+    """
+    if numpy_threshold is None:
+        numpy_threshold = NUMPY_THRESHOLD
+
+    if HAS_NUMPY and len(letter_codes) >= numpy_threshold:
+        # The letters are padded to full rows of the key length, the padding
+        # is counted as OTHER_LETTER and dropped with it.
+        nb_rows = -(-len(letter_codes) // period)
+        codes = np.full(nb_rows * period, OTHER_LETTER, dtype=np.intp)
+        codes[: len(letter_codes)] = np.frombuffer(letter_codes, dtype=np.uint8)
+        rows = codes.reshape(nb_rows, period)
+        rows += np.arange(period, dtype=np.intp) * _CODE_COUNT
+        counts = np.bincount(
+            rows.ravel(),
+            minlength=period * _CODE_COUNT,
+        ).reshape(period, _CODE_COUNT)
+        return [[int(count) for count in row[:ALPHABET_LENGTH]] for row in counts]
+
+    return [
+        [column.count(letter) for letter in _LETTERS]
+        for column in (letter_codes[start::period] for start in range(period))
+    ]
+
+
+def get_index_of_coincidence(histograms: list[list[int]]) -> float:
+    """
+    Get the mean index of coincidence of the columns.
+
+    The index of coincidence is the probability that two letters of a column
+    are the same. It is about 0.067 for an English text,
+    and 0.038 for random letters.
+
+    Parameters
+    ----------
+    histograms : list[list[int]]
+        The number of each letter of each column.
+
+    Returns
+    -------
+    index_of_coincidence
+        float
+        0 if no column has two letters.
+
+    Examples
+    --------
+    >>> get_index_of_coincidence([[2, 0], [1, 1]])
+    0.5
+    """
+    total = 0.0
+    nb_columns = 0
+    for histogram in histograms:
+        size = sum(histogram)
+        if size > 1:
+            coincidences = sum(count * (count - 1) for count in histogram)
+            total += coincidences / (size * (size - 1))
+            nb_columns += 1
+
+    if nb_columns == 0:
+        return 0.0
+
+    return total / nb_columns
+
+
+def estimate_key_lengths(
+    letter_codes: bytes,
+    max_length: int = MAX_KEY_LENGTH,
+) -> list[KeyLengthCandidate]:
+    """
+    Rank the key lengths by the index of coincidence of their columns.
+
+    The columns of the key length and of its multiples have the index
+    of coincidence of the language, the other lengths are closer to random letters.
+    The lengths with an index close to the best one are ranked first,
+    from the shortest supported by the Kasiski examination, then from the shortest.
+    The other lengths follow, from the highest index.
+
+    Parameters
+    ----------
+    letter_codes : bytes
+        The letter codes, from get_letter_codes.
+    max_length : int, default MAX_KEY_LENGTH
+        The maximal key length.
+
+    Returns
+    -------
+    candidates
+        list[KeyLengthCandidate]
+        The lengths from MIN_KEY_LENGTH to max_length, from the most likely.
+    """
+    lengths = range(MIN_KEY_LENGTH, max(max_length, MIN_KEY_LENGTH) + 1)
+    distances = get_kasiski_distances(letter_codes)
+    nb_distances = sum(distances.values())
+
+    candidates = [
+        KeyLengthCandidate.construct(
+            length=length,
+            index_of_coincidence=get_index_of_coincidence(
+                get_column_histograms(letter_codes, length),
+            ),
+            repeats=repeats,
+        )
+        for length, repeats in zip(lengths, count_period_repeats(distances, lengths))
+    ]
+
+    best_index = max(candidate.index_of_coincidence for candidate in candidates)
+    threshold = RANDOM_INDEX_OF_COINCIDENCE + KEY_LENGTH_TOLERANCE * (
+        best_index - RANDOM_INDEX_OF_COINCIDENCE
+    )
+
+    def rank(candidate: KeyLengthCandidate) -> tuple[bool, bool, float]:
+        """
+        Get the sort key of a candidate, the smallest is the most likely.
+
+        Parameters
+        ----------
+        candidate : KeyLengthCandidate
+            The key length with its index of coincidence and its repeats.
+
+        Returns
+        -------
+        sort_key
+            tuple[bool, bool, float]
+            If the index is under the threshold, if the length is not supported
+            by the Kasiski examination, then the length or the negative index.
+        """
+        if candidate.index_of_coincidence >= threshold:
+            # A random distance is a multiple of the length once in length times.
+            is_supported = (
+                candidate.repeats * candidate.length >= KASISKI_SUPPORT * nb_distances
+            )
+            return False, not is_supported, candidate.length
+
+        return True, False, -candidate.index_of_coincidence
+
+    return sorted(candidates, key=rank)
@@ -0,0 +1,231 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Search the Vigenere keys, one Caesar key by column."""
+
+from __future__ import annotations
+
+from math import exp, log
+from typing import final, Final, Optional, TYPE_CHECKING
+
+from pydantic import StrictFloat, StrictStr
+
+from vigenere_api.helpers import get_int_env, Model
+from vigenere_api.models.helpers.shift_table import ALPHABET_LENGTH, LOWER_FIRST_LETTER
+
+from .frequencies import ENGLISH_FREQUENCIES, get_column_chi_squared_scores
+from .key_length import get_column_histograms, MIN_KEY_LENGTH
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+DECRYPT_KEY_COUNT: Final = get_int_env("VIGENERE_API_DECRYPT_KEY_COUNT", 5)
+"""Maximal number of keys returned by the Vigenere decrypt method."""
+
+KEY_LETTER_PENALTY: Final = 2 * log(ALPHABET_LENGTH)
+"""Score added by each letter of a key, the cost of choosing one letter among 26."""
+
+
+@final
+class VigenereCandidate(Model):
+    """A possible key of a Vigenere content, with its scores."""
+
+    key: StrictStr
+    """The key to decipher the content."""
+
+    score: StrictFloat
+    """The chi-squared statistic of the deciphered letters, plus the penalty
+    of the key length, lower is better."""
+
+    confidence: StrictFloat
+    """The probability of the key among the returned keys, from 0 to 1."""
+
+
+def get_key_shifts(
+    histograms: Sequence[Sequence[int]],
+    frequencies: Sequence[float] = ENGLISH_FREQUENCIES,
+    numpy_threshold: Optional[int] = None,
+) -> list[int]:
+    """
+    Get the best Caesar key of each column.
+
+    Parameters
+    ----------
+    histograms : Sequence[Sequence[int]]
+        The number of each letter of each column, from get_column_histograms.
+    frequencies : Sequence[float], default ENGLISH_FREQUENCIES
+        The frequency of each letter in the language, from A to Z.
+    numpy_threshold : Optional[int], default NUMPY_THRESHOLD
+        The minimal number of letters to use NumPy.
+
+    Returns
+    -------
+    shifts
+        list[int]
+        The shift, between 0 and 25, of each column.
+    """
+    return [
+        scores.index(min(scores))
+        for scores in get_column_chi_squared_scores(
+            histograms,
+            frequencies,
+            numpy_threshold,
+        )
+    ]
+
+
+def get_key_period(shifts: Sequence[int]) -> int:
+    """
+    Get the length of the shortest pattern repeated by the shifts.
+
+    The columns of a multiple of the key length give the key repeated.
+
+    Parameters
+    ----------
+    shifts : Sequence[int]
+        The shifts of the key.
+
+    Returns
+    -------
+    period
+        int
+
+    Examples
+    --------
+    >>> get_key_period([1, 2, 1, 2, 1, 2])
+    2
+    >>> get_key_period([1, 2, 1])
+    3
+    """
+    length = len(shifts)
+    for period in range(1, length):
+        if length % period == 0 and all(
+            shifts[index] == shifts[index - period] for index in range(period, length)
+        ):
+            return period
+
+    return length
+
+
+def get_deciphered_histogram(
+    histograms: Sequence[Sequence[int]],
+    shifts: Sequence[int],
+) -> list[int]:
+    """
+    Count the deciphered letters, the columns being moved back by their shift.
+
+    Parameters
+    ----------
+    histograms : Sequence[Sequence[int]]
+        The number of each letter of each column.
+    shifts : Sequence[int]
+        The shift of each column.
+
+    Returns
+    -------
+    histogram
+        list[int]
+        The number of each deciphered letter, from A to Z.
+
+    Examples
+    --------
+    >>> get_deciphered_histogram([[0, 2, 0], [1, 0, 0]], [1, 2])
+    [2, 1, 0]
+    """
+    histogram = [0] * len(histograms[0]) if histograms else []
+    size = len(histogram)
+    for column, shift in zip(histograms, shifts):
+        for letter in range(size):
+            histogram[letter] += column[(letter + shift) % size]
+
+    return histogram
+
+
+def search_keys(
+    letter_codes: bytes,
+    key_lengths: Sequence[int],
+    key_count: int = DECRYPT_KEY_COUNT,
+    frequencies: Sequence[float] = ENGLISH_FREQUENCIES,
+) -> list[VigenereCandidate]:
+    """
+    Search the key of each key length and keep the most likely keys.
+
+    Each column of a key length is a Caesar content, its key is the shift
+    with the best chi-squared statistic. The keys repeated by a multiple of the
+    key length are merged, a key repeating one letter has two letters.
+    A longer key fits better any content,
+    so each letter adds KEY_LETTER_PENALTY to the chi-squared statistic of
+    the deciphered letters, as the Akaike information criterion.
+    The confidence of a key is its Akaike weight among the returned keys.
+
+    Parameters
+    ----------
+    letter_codes : bytes
+        The letter codes, from get_letter_codes.
+    key_lengths : Sequence[int]
+        The searched key lengths.
+    key_count : int, default DECRYPT_KEY_COUNT
+        The maximal number of keys.
+    frequencies : Sequence[float], default ENGLISH_FREQUENCIES
+        The frequency of each letter in the language, from A to Z.
+
+    Returns
+    -------
+    candidates
+        list[VigenereCandidate]
+        The keys, from the most likely.
+
+    Examples
+    --------
+    >>> from vigenere_api.models.cryptanalysis import get_letter_codes
+    >>> letter_codes = get_letter_codes("Uif tfdsfu pg uif tfdsfu")
+    >>> candidates = search_keys(letter_codes, [2])
+    >>> candidates[0].key, candidates[0].confidence
+    ('bb', 1.0)
+    """
+    scores: dict[str, float] = {}
+    for length in key_lengths:
+        histograms = get_column_histograms(letter_codes, length)
+        shifts = get_key_shifts(histograms, frequencies)
+        period = get_key_period(shifts)
+        # A Vigenere key has at least two letters, a repeated letter is a Caesar key.
+        key = "".join(
+            chr(LOWER_FIRST_LETTER + shift)
+            for shift in shifts[: max(period, MIN_KEY_LENGTH)]
+        )
+        if key not in scores:
+            histogram = get_deciphered_histogram(histograms, shifts)
+            chi_squared = get_column_chi_squared_scores([histogram], frequencies)[0][0]
+            scores[key] = chi_squared + KEY_LETTER_PENALTY * period
+
+    ranking = sorted(scores, key=scores.__getitem__)[: max(key_count, 1)]
+    if not ranking:
+        return []
+
+    best_score = scores[ranking[0]]
+    weights = [exp((best_score - scores[key]) / 2) for key in ranking]
+    total = sum(weights)
+
+    return [
+        VigenereCandidate.construct(
+            key=key,
+            score=scores[key],
+            confidence=weight / total,
+        )
+        for key, weight in zip(ranking, weights)
+    ]
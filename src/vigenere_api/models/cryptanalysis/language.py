@@ -0,0 +1,434 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Language models of the cryptanalysis, with their letter and n-gram statistics."""
+
+from __future__ import annotations
+
+import gzip
+import unicodedata
+from array import array
+from collections import Counter
+from enum import auto, unique
+from importlib.resources import files
+from math import log10
+from string import ascii_uppercase
+from threading import Lock
+from typing import Callable, final, Final, TYPE_CHECKING
+
+from strenum import LowercaseStrEnum
+from vigenere_api.models.errors import LanguageTypeError
+from vigenere_api.models.helpers.shift_table import ALPHABET_LENGTH
+
+from .frequencies import (
+    ENGLISH_FREQUENCIES,
+    FRENCH_FREQUENCIES,
+    GERMAN_FREQUENCIES,
+    get_letter_codes,
+    OTHER_LETTER,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+BIGRAM_SIZE: Final = 2
+"""Number of letters of a bigram."""
+
+QUADGRAM_SIZE: Final = 4
+"""Number of letters of a quadgram."""
+
+MISSING_NGRAM_COUNT: Final = 0.01
+"""Count given to an n-gram missing from the counts, to keep its probability above 0."""
+
+_LIGATURES: Final = str.maketrans(
+    {"ß": "ss", "æ": "ae", "Æ": "AE", "œ": "oe", "Œ": "OE"},
+)
+_CODE_LETTERS: Final = bytes.maketrans(
+    bytes(range(ALPHABET_LENGTH)),
+    ascii_uppercase.encode("ascii"),
+)
+_OTHER_LETTER_CODE: Final = bytes((OTHER_LETTER,))
+
+
+@final
+@unique
+class Language(LowercaseStrEnum):
+    """Languages of the contents to decrypt, by their ISO 639-1 code."""
+
+    EN = auto()
+    FR = auto()
+    DE = auto()
+
+
+def remove_accents(text: str) -> str:
+    """
+    Replace the accented letters and the ligatures by ASCII letters.
+
+    Parameters
+    ----------
+    text : str
+        The text.
+
+    Returns
+    -------
+    text
+        str
+
+    Examples
+    --------
+    >>> remove_accents("Déjà vu, Größe, œuvre")
+    'Deja vu, Grosse, oeuvre'
+    """
+    decomposed = unicodedata.normalize("NFKD", text.translate(_LIGATURES))
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def count_ngrams(text: str, size: int) -> Counter[str]:
+    """
+    Count the n-grams of the letters of a text, its accents removed.
+
+    The n-grams cross the words, as the Vigenere shifts do,
+    but not the other alphabetic characters.
+
+    Parameters
+    ----------
+    text : str
+        The text.
+    size : int
+        The number of letters of an n-gram.
+
+    Returns
+    -------
+    counts
+        Counter[str]
+        The number of each n-gram, in upper case.
+
+    Examples
+    --------
+    >>> sorted(count_ngrams("Abab, ça!", 2).items())
+    [('AB', 2), ('BA', 1), ('BC', 1), ('CA', 1)]
+    """
+    counts: Counter[str] = Counter()
+    letter_codes = get_letter_codes(remove_accents(text))
+    for run in letter_codes.split(_OTHER_LETTER_CODE):
+        letters = run.translate(_CODE_LETTERS).decode("ascii")
+        counts.update(
+            letters[start : start + size] for start in range(len(letters) - size + 1)
+        )
+
+    return counts
+
+
+def get_ngram_table(counts: Mapping[str, int], size: int) -> array[float]:
+    """
+    Get the log10 probability of each n-gram from their counts.
+
+    The index of an n-gram is its letter codes written in base 26,
+    so the table has 26 ** size floats. The keys of another size
+    or with other characters than the ASCII letters are ignored.
+
+    Parameters
+    ----------
+    counts : Mapping[str, int]
+        The number of each n-gram.
+    size : int
+        The number of letters of an n-gram.
+
+    Returns
+    -------
+    table
+        array[float]
+        The log10 probability of each n-gram, from AA..A to ZZ..Z.
+
+    Examples
+    --------
+    >>> table = get_ngram_table({"AB": 2, "ba": 1, "ABC": 5}, 2)
+    >>> len(table), round(table[1], 3), round(table[26], 3)
+    (676, -0.176, -0.477)
+    """
+    indexes: dict[int, int] = {}
+    for ngram, count in counts.items():
+        letter_codes = get_letter_codes(ngram)
+        if len(ngram) == size == len(letter_codes) and OTHER_LETTER not in letter_codes:
+            index = 0
+            for code in letter_codes:
+                index = index * ALPHABET_LENGTH + code
+            indexes[index] = indexes.get(index, 0) + count
+
+    total = max(sum(indexes.values()), 1)
+    table: array[float] = array("f", [log10(MISSING_NGRAM_COUNT / total)])
+    table *= ALPHABET_LENGTH**size
+    for index, count in indexes.items():
+        table[index] = log10(count / total)
+
+    return table
+
+
+@final
+class LanguageModel:
+    """
+    Letter and n-gram statistics of a language.
+
+    The tables are fixed-size float32 arrays indexed by the letter codes,
+    an n-gram being its letter codes written in base 26.
+    NumPy reads them without copy.
+    """
+
+    __slots__ = (
+        "__language",
+        "__frequencies",
+        "__unigrams",
+        "__bigrams",
+        "__quadgrams",
+    )
+
+    def __init__(
+        self,
+        language: Language,
+        frequencies: tuple[float, ...],
+        ngram_counts: Mapping[str, int],
+    ) -> None:
+        """
+        Create the model of a language.
+
+        Parameters
+        ----------
+        language : Language
+            The language.
+        frequencies : tuple[float, ...]
+            The frequency of each letter, from A to Z, normalised to a total of 1.
+        ngram_counts : Mapping[str, int]
+            The number of each bigram and quadgram in texts of the language.
+
+        Raises
+        ------
+        LanguageTypeError
+            Thrown if 'language' is not a Language object.
+        """
+        if not isinstance(language, Language):
+            raise LanguageTypeError(language)
+
+        total = sum(frequencies)
+
+        self.__language: Final = language
+        self.__frequencies: Final = tuple(
+            frequency / total for frequency in frequencies
+        )
+        self.__unigrams: Final = array(
+            "f",
+            (log10(frequency) for frequency in self.__frequencies),
+        )
+        self.__bigrams: Final = get_ngram_table(ngram_counts, BIGRAM_SIZE)
+        self.__quadgrams: Final = get_ngram_table(ngram_counts, QUADGRAM_SIZE)
+
+    @property
+    def language(self) -> Language:
+        """
+        Get the language.
+
+        Returns
+        -------
+        language
+            Language
+        """
+        return self.__language
+
+    @property
+    def frequencies(self) -> tuple[float, ...]:
+        """
+        Get the frequency of each letter, from A to Z.
+
+        Returns
+        -------
+        frequencies
+            tuple[float, ...]
+        """
+        return self.__frequencies
+
+    @property
+    def unigrams(self) -> array[float]:
+        """
+        Get the log10 probability of each letter, from A to Z.
+
+        Returns
+        -------
+        unigrams
+            array[float]
+        """
+        return self.__unigrams
+
+    @property
+    def bigrams(self) -> array[float]:
+        """
+        Get the log10 probability of each bigram, from AA to ZZ.
+
+        Returns
+        -------
+        bigrams
+            array[float]
+        """
+        return self.__bigrams
+
+    @property
+    def quadgrams(self) -> array[float]:
+        """
+        Get the log10 probability of each quadgram, from AAAA to ZZZZ.
+
+        Returns
+        -------
+        quadgrams
+            array[float]
+        """
+        return self.__quadgrams
+
+    def __repr__(self) -> str:
+        """
+        Get the representation of the model.
+
+        Returns
+        -------
+        str
+        """
+        return f"LanguageModel({self.__language!r})"
+
+
+LanguageModelLoader = Callable[[], LanguageModel]
+"""Function creating a language model, called on the first use of the language."""
+
+_REFERENCE_FREQUENCIES: Final = {
+    Language.EN: ENGLISH_FREQUENCIES,
+    Language.FR: FRENCH_FREQUENCIES,
+    Language.DE: GERMAN_FREQUENCIES,
+}
+
+
+def read_ngram_counts(language: Language) -> Counter[str]:
+    """
+    Read the bigram and quadgram counts shipped with Vigenere-API.
+
+    Each line of the gzip file holds an n-gram and its count.
+    The counts come from 'count_ngrams' on public domain texts of the language.
+
+    Parameters
+    ----------
+    language : Language
+        The language.
+
+    Returns
+    -------
+    counts
+        Counter[str]
+    """
+    data = files(__package__).joinpath("ngrams").joinpath(f"{language}.txt.gz")
+    counts: Counter[str] = Counter()
+    with gzip.open(data.open("rb"), "rt", encoding="ascii") as lines:
+        for line in lines:
+            ngram, count = line.split()
+            counts[ngram] = int(count)
+
+    return counts
+
+
+def load_reference_model(language: Language) -> LanguageModel:
+    """
+    Create the model of a language from the statistics shipped with Vigenere-API.
+
+    Parameters
+    ----------
+    language : Language
+        The language.
+
+    Returns
+    -------
+    model
+        LanguageModel
+    """
+    return LanguageModel(
+        language,
+        _REFERENCE_FREQUENCIES[language],
+        read_ngram_counts(language),
+    )
+
+
+_loaders: Final[dict[Language, LanguageModelLoader]] = {}
+_models: Final[dict[Language, LanguageModel]] = {}
+_lock: Final = Lock()
+
+
+def register_language_model(language: Language, loader: LanguageModelLoader) -> None:
+    """
+    Replace the model of a language, the loader is called on the first use.
+
+    Parameters
+    ----------
+    language : Language
+        The language.
+    loader : LanguageModelLoader
+        The function creating the model.
+
+    Raises
+    ------
+    LanguageTypeError
+        Thrown if 'language' is not a Language object.
+    """
+    if not isinstance(language, Language):
+        raise LanguageTypeError(language)
+
+    with _lock:
+        _loaders[language] = loader
+        _models.pop(language, None)
+
+
+def get_language_model(language: Language) -> LanguageModel:
+    """
+    Get the model of a language, it is created once by process.
+
+    Parameters
+    ----------
+    language : Language
+        The language.
+
+    Raises
+    ------
+    LanguageTypeError
+        Thrown if 'language' is not a Language object.
+
+    Returns
+    -------
+    model
+        LanguageModel
+
+    Examples
+    --------
+    >>> model = get_language_model(Language.FR)
+    >>> model is get_language_model(Language.FR)
+    True
+    >>> len(model.frequencies), len(model.bigrams), len(model.quadgrams)
+    (26, 676, 456976)
+    """
+    if not isinstance(language, Language):
+        raise LanguageTypeError(language)
+
+    with _lock:
+        model = _models.get(language)
+        if model is None:
+            loader = _loaders.get(language)
+            model = load_reference_model(language) if loader is None else loader()
+            _models[language] = model
+
+    return model
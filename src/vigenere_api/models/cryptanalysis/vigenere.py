@@ -0,0 +1,121 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Decrypt a Vigenere content without its key."""
+
+from typing import final
+
+from vigenere_api.helpers import Model
+from vigenere_api.models.vigenere import VigenereData
+
+from .base_decrypt_data import BaseDecryptData
+from .frequencies import DECRYPT_SAMPLE_SIZE, get_letter_codes, OTHER_LETTER
+from .key_length import estimate_key_lengths, KeyLengthCandidate, MAX_KEY_LENGTH
+from .key_search import DECRYPT_KEY_COUNT, search_keys, VigenereCandidate
+from .language import get_language_model
+
+
+@final
+class VigenereDecryptResult(Model):
+    """The possible keys of a Vigenere content, and the content deciphered."""
+
+    candidates: list[VigenereCandidate]
+    """The most likely keys, from the most likely."""
+
+    key_lengths: list[KeyLengthCandidate]
+    """All key lengths, from the most likely to the least likely."""
+
+    content: str
+    """The content deciphered with the most likely key."""
+
+
+@final
+class VigenereDecryptData(BaseDecryptData):
+    """
+    Vigenere content to decrypt, its key is unknown.
+
+    Exemples
+    --------
+    >>> from vigenere_api.models import VigenereData, VigenereDecryptData
+
+    >>> text = (
+    ...     "Four score and seven years ago our fathers brought forth on this"
+    ...     " continent a new nation, conceived in Liberty, and dedicated to the"
+    ...     " proposition that all men are created equal. Now we are engaged in a"
+    ...     " great civil war, testing whether that nation can long endure."
+    ... )
+    >>> content = VigenereData(content=text, key="lemon").cipher().content
+    >>> result = VigenereDecryptData(content=content).decrypt()
+    >>> result.key_lengths[0].length
+    5
+    >>> result.candidates[0].key
+    'lemon'
+    >>> result.content == text
+    True
+    """
+
+    def decrypt(
+        self,
+        sample_size: int = DECRYPT_SAMPLE_SIZE,
+        max_key_length: int = MAX_KEY_LENGTH,
+        key_count: int = DECRYPT_KEY_COUNT,
+    ) -> VigenereDecryptResult:
+        """
+        Search the key of the content and decipher it.
+
+        The key lengths are ranked, then each column of a key length is solved
+        as a Caesar content, with the letter frequencies of the language.
+        A large content is analysed on its beginning,
+        the letters keep their positions in the key.
+        The whole content is deciphered with the best key, as VigenereData.
+
+        Parameters
+        ----------
+        sample_size : int, default DECRYPT_SAMPLE_SIZE
+            The maximal number of characters analysed, 0 analyses the whole content.
+        max_key_length : int, default MAX_KEY_LENGTH
+            The maximal key length.
+        key_count : int, default DECRYPT_KEY_COUNT
+            The maximal number of returned keys.
+
+        Returns
+        -------
+        result
+            VigenereDecryptResult
+        """
+        text = self.content[:sample_size] if sample_size > 0 else self.content
+        letter_codes = get_letter_codes(text)
+        if letter_codes.count(OTHER_LETTER) == len(letter_codes):
+            letter_codes = get_letter_codes(self.content)
+
+        key_lengths = estimate_key_lengths(letter_codes, max_key_length)
+        candidates = search_keys(
+            letter_codes,
+            [key_length.length for key_length in key_lengths],
+            key_count,
+            get_language_model(self.language).frequencies,
+        )
+        deciphered_data = VigenereData(
+            content=self.content,
+            key=candidates[0].key,
+        ).decipher()
+
+        return VigenereDecryptResult.construct(
+            candidates=candidates,
+            key_lengths=key_lengths,
+            content=deciphered_data.content,
+        )
@@ -113,3 +113,57 @@ class AlgorithmOperationTypeError(VigenereAPITypeError):
         operation : Any
         """
         super().__init__(operation, "operation", "a VigenereOperation object")
+
+
+@final
+class ChunkTypeError(VigenereAPITypeError):
+    """Thrown if a stream receives a chunk which is not a string or bytes."""
+
+    def __init__(self, chunk: Any) -> None:
+        """
+        Create a ChunkTypeError with the chunk.
+
+        Parameters
+        ----------
+        chunk : Any
+            The given chunk.
+        """
+        super().__init__(chunk, "chunk", "a string or bytes")
+
+
+@final
+class FinalizedStreamError(ValueError):
+    """Thrown if a stream is used after its finalization."""
+
+    def __init__(self) -> None:
+        """Create a FinalizedStreamError."""
+        super().__init__(
+            "The stream is finalized. Please create a new stream.",
+        )
+
+
+@final
+class NoLetterContentError(ValueError):
+    """Thrown if the content to decrypt has no ASCII letter."""
+
+    def __init__(self) -> None:
+        """Create a NoLetterContentError."""
+        super().__init__(
+            "The content has no ASCII letter. Please give a content with letters.",
+        )
+
+
+@final
+class LanguageTypeError(VigenereAPITypeError):
+    """Thrown if the language is not a Language object."""
+
+    def __init__(self, language: Any) -> None:
+        """
+        Create a LanguageTypeError with the language.
+
+        Parameters
+        ----------
+        language : Any
+            The given language.
+        """
+        super().__init__(language, "language", "a Language object")
@@ -16,9 +16,45 @@
 
 """Helper package for models."""
 
+from .bytes_engine import cipher_bytes, count_bytes_letters, is_ascii_bytes
 from .convert_key import convert_key
+from .engine_timer import engine_timer, EngineStatistics, EngineTimer
+from .key_cache import (
+    get_vigenere_key,
+    KeyCacheStatistics,
+    vigenere_key_cache,
+    VigenereKeyCache,
+)
 from .move_char import move_char
+from .shift_table import get_shift_table
+from .vigenere_engine import (
+    apply_shifts,
+    count_letters,
+    disable_parallel_engine,
+    shutdown_process_pool,
+    uses_parallel_engine,
+)
 from .vigenere_key import VigenereKey
 
 
-__all__ = ["move_char", "convert_key", "VigenereKey"]
+__all__ = [
+    "move_char",
+    "convert_key",
+    "get_shift_table",
+    "apply_shifts",
+    "count_letters",
+    "shutdown_process_pool",
+    "disable_parallel_engine",
+    "uses_parallel_engine",
+    "cipher_bytes",
+    "count_bytes_letters",
+    "is_ascii_bytes",
+    "EngineTimer",
+    "EngineStatistics",
+    "engine_timer",
+    "VigenereKey",
+    "VigenereKeyCache",
+    "KeyCacheStatistics",
+    "vigenere_key_cache",
+    "get_vigenere_key",
+]
@@ -0,0 +1,393 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Engine applying the shifts on the ASCII letters of a bytes-like object."""
+
+import re
+from collections.abc import Sequence
+from string import ascii_letters
+from time import perf_counter
+from typing import Final, Optional, Union
+
+from .engine_timer import engine_timer
+from .errors import BufferTypeError, TooSmallBufferError
+from .shift_table import ALPHABET_LENGTH, LOWER_FIRST_LETTER, UPPER_FIRST_LETTER
+from .vigenere_engine import HAS_NUMPY, NUMPY_THRESHOLD
+
+
+if HAS_NUMPY:
+    import numpy as np
+
+    _FIRST_LETTERS: Final = np.zeros(256, dtype=np.uint8)
+    _FIRST_LETTERS[UPPER_FIRST_LETTER : UPPER_FIRST_LETTER + ALPHABET_LENGTH] = (
+        UPPER_FIRST_LETTER
+    )
+    _FIRST_LETTERS[LOWER_FIRST_LETTER : LOWER_FIRST_LETTER + ALPHABET_LENGTH] = (
+        LOWER_FIRST_LETTER
+    )
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+WritableBuffer = Union[bytearray, memoryview]
+
+_ASCII_LETTERS: Final = ascii_letters.encode("ascii")
+_NOT_LETTERS: Final = bytes(code for code in range(256) if code not in _ASCII_LETTERS)
+_LETTER_RUNS: Final = re.compile(b"[A-Za-z]+")
+_NOT_ASCII: Final = re.compile(b"[\\x80-\\xff]")
+
+
+def _create_byte_table(shift: int) -> bytes:
+    """
+    Create the translation table for 'bytes.translate' moving the ASCII letters.
+
+    Parameters
+    ----------
+    shift : int
+        The shift between 0 and 25.
+
+    Returns
+    -------
+    table
+        bytes
+    """
+    table = bytearray(range(256))
+    for first_letter in (UPPER_FIRST_LETTER, LOWER_FIRST_LETTER):
+        for index in range(ALPHABET_LENGTH):
+            table[first_letter + index] = (
+                first_letter + (index + shift) % ALPHABET_LENGTH
+            )
+
+    return bytes(table)
+
+
+_BYTE_TABLES: Final = tuple(
+    _create_byte_table(shift) for shift in range(ALPHABET_LENGTH)
+)
+
+
+def count_bytes_letters(buffer: Buffer) -> int:
+    """
+    Count the ASCII letters, the bytes consuming a shift.
+
+    Parameters
+    ----------
+    buffer : Buffer
+        The bytes to count the letters.
+
+    Raises
+    ------
+    BufferTypeError
+        Thrown if 'buffer' is not a bytes-like object.
+
+    Returns
+    -------
+    nb_letters
+        int
+
+    Examples
+    --------
+    >>> count_bytes_letters(b"Hello World!")
+    10
+    """
+    data = _as_buffer(buffer)
+
+    if not isinstance(data, memoryview):
+        return len(data) - len(data.translate(None, _ASCII_LETTERS))
+
+    if HAS_NUMPY:
+        return int(np.count_nonzero(_FIRST_LETTERS[np.frombuffer(data, np.uint8)]))
+
+    return sum(run.end() - run.start() for run in _LETTER_RUNS.finditer(data))
+
+
+def is_ascii_bytes(buffer: Buffer) -> bool:
+    """
+    Check if the buffer contains only ASCII bytes, without copying it.
+
+    Parameters
+    ----------
+    buffer : Buffer
+        The bytes to check.
+
+    Raises
+    ------
+    BufferTypeError
+        Thrown if 'buffer' is not a bytes-like object.
+
+    Returns
+    -------
+    is_ascii
+        bool
+
+    Examples
+    --------
+    >>> is_ascii_bytes(memoryview(b"Hello World!"))
+    True
+    >>> is_ascii_bytes("Héllo".encode())
+    False
+    """
+    data = _as_buffer(buffer)
+
+    if isinstance(data, memoryview):
+        return _NOT_ASCII.search(data) is None
+
+    return data.isascii()
+
+
+def cipher_bytes(
+    buffer: Buffer,
+    shifts: Sequence[int],
+    out: Optional[WritableBuffer] = None,
+    offset: int = 0,
+) -> WritableBuffer:
+    """
+    Move each ASCII letter of the buffer with the next shift, without decoding it.
+
+    The shifts are used in loop, only ASCII letters consume a shift,
+    the other bytes are copied unchanged.
+    For an ASCII text, the result is the same as the function 'apply_shifts'.
+    One shift is the Caesar algorithm, several shifts are the Vigenere algorithm.
+    To decipher, give the deciphering shifts.
+
+    Parameters
+    ----------
+    buffer : Buffer
+        The bytes to apply the shifts.
+    shifts : Sequence[int]
+        The not empty sequence of shifts.
+    out : Optional[WritableBuffer], default None
+        The buffer receiving the result in its first bytes.
+        It can be the input buffer itself. By default, a new bytearray is created.
+    offset : int, default 0
+        The index of the first shift to use.
+        It allows to continue a text, with the number of letters already moved.
+
+    Raises
+    ------
+    BufferTypeError
+        Thrown if 'buffer' is not a bytes-like object
+        or 'out' is not a writable buffer of contiguous bytes.
+    TooSmallBufferError
+        Thrown if 'out' is shorter than 'buffer'.
+
+    Returns
+    -------
+    out
+        WritableBuffer
+        The output buffer, 'out' if given.
+
+    Examples
+    --------
+    >>> cipher_bytes(b"Hello World!", [1])
+    bytearray(b'Ifmmp Xpsme!')
+    >>> cipher_bytes(b"Hello World!", [0, 1])
+    bytearray(b'Hflmo Xosle!')
+    """
+    data = _as_buffer(buffer)
+    length = len(data)
+
+    if out is None:
+        out = bytearray(length)
+
+    target = _as_writable_buffer(out)
+    if len(target) < length:
+        raise TooSmallBufferError(len(target), length)
+
+    offset %= len(shifts)
+    if offset != 0:
+        shifts = tuple(shifts[offset:]) + tuple(shifts[:offset])
+
+    # A memoryview has no 'translate' method: it goes through NumPy, or the letter
+    # runs found by the regular expressions, which both read any buffer in place.
+    start = perf_counter()
+    is_uniform = len({shift % ALPHABET_LENGTH for shift in shifts}) == 1
+    if is_uniform and not isinstance(data, memoryview):
+        engine = "bytes_translate"
+        target[:length] = data.translate(_BYTE_TABLES[shifts[0] % ALPHABET_LENGTH])
+    elif HAS_NUMPY and (isinstance(data, memoryview) or length >= NUMPY_THRESHOLD):
+        engine = "bytes_numpy"
+        _numpy_bytes_engine(data, shifts, target)
+    else:
+        engine = "bytes_python"
+        _python_bytes_engine(data, shifts, target)
+
+    engine_timer.observe(engine, length, perf_counter() - start)
+    return out
+
+
+def _as_buffer(buffer: Buffer, name: str = "buffer") -> Buffer:
+    """
+    Check the bytes-like object, without copying it.
+
+    A memoryview must be contiguous with items of one byte,
+    it is cast to unsigned bytes, without copy.
+
+    Parameters
+    ----------
+    buffer : Buffer
+        The bytes-like object.
+    name : str, default "buffer"
+        The name of the buffer, for the error.
+
+    Raises
+    ------
+    BufferTypeError
+        Thrown if 'buffer' is not a bytes-like object
+        or a memoryview of contiguous bytes.
+
+    Returns
+    -------
+    data
+        Buffer
+    """
+    if isinstance(buffer, (bytes, bytearray)):
+        return buffer
+
+    if isinstance(buffer, memoryview) and buffer.c_contiguous and buffer.itemsize == 1:
+        return buffer.cast("B")
+
+    raise BufferTypeError(
+        buffer,
+        name,
+        "a bytes, a bytearray or a memoryview of contiguous bytes",
+    )
+
+
+def _as_writable_buffer(out: WritableBuffer) -> WritableBuffer:
+    """
+    Check the output buffer, without copying it.
+
+    A memoryview must be writable and contiguous with items of one byte,
+    it is cast to unsigned bytes, without copy.
+
+    Parameters
+    ----------
+    out : WritableBuffer
+        The output buffer.
+
+    Raises
+    ------
+    BufferTypeError
+        Thrown if 'out' is not a bytearray or a writable memoryview of contiguous bytes.
+
+    Returns
+    -------
+    target
+        WritableBuffer
+    """
+    if isinstance(out, bytearray):
+        return out
+
+    if (
+        isinstance(out, memoryview)
+        and not out.readonly
+        and out.c_contiguous
+        and out.itemsize == 1
+    ):
+        return out.cast("B")
+
+    raise BufferTypeError(
+        out,
+        "output buffer",
+        "a bytearray or a writable memoryview of contiguous bytes",
+    )
+
+
+def _python_bytes_engine(
+    data: Buffer,
+    shifts: Sequence[int],
+    out: WritableBuffer,
+) -> None:
+    """
+    Gather the letters, move them with strided translations, then scatter them.
+
+    Parameters
+    ----------
+    data : Buffer
+        The bytes to apply the shifts.
+    shifts : Sequence[int]
+        The not empty sequence of shifts.
+    out : WritableBuffer
+        The buffer receiving the result, at least as long as data.
+    """
+    length = len(data)
+    letters: Union[bytes, bytearray]
+    if isinstance(data, memoryview):
+        letters = b"".join(_LETTER_RUNS.findall(data))
+    else:
+        letters = data.translate(None, _NOT_LETTERS)
+
+    # The n-th letter uses the shift n modulo the number of shifts,
+    # so each shift moves a strided slice of the letters.
+    nb_shifts = len(shifts)
+    moved_letters = bytearray(len(letters))
+    for index, shift in enumerate(shifts):
+        moved_letters[index::nb_shifts] = letters[index::nb_shifts].translate(
+            _BYTE_TABLES[shift % ALPHABET_LENGTH],
+        )
+
+    if len(letters) == length:
+        out[:length] = moved_letters
+        return
+
+    if out is not data:
+        out[:length] = data
+
+    view = memoryview(out)
+    position = 0
+    for run in _LETTER_RUNS.finditer(data):
+        start, end = run.span()
+        view[start:end] = moved_letters[position : position + end - start]
+        position += end - start
+
+
+def _numpy_bytes_engine(
+    data: Buffer,
+    shifts: Sequence[int],
+    out: WritableBuffer,
+) -> None:
+    """
+    Apply the shifts in one vectorized pass, writing directly in the output buffer.
+
+    Parameters
+    ----------
+    data : Buffer
+        The bytes to apply the shifts.
+    shifts : Sequence[int]
+        The not empty sequence of shifts.
+    out : WritableBuffer
+        The buffer receiving the result, at least as long as data.
+    """
+    length = len(data)
+    codes = np.frombuffer(data, dtype=np.uint8)
+    first_letters = _FIRST_LETTERS[codes]
+
+    # The letters are gathered in order, so the n-th letter uses the n-th tiled shift.
+    is_alpha = first_letters != 0
+    letter_first_letters = first_letters[is_alpha]
+    letters = codes[is_alpha].astype(np.int16)
+
+    key_shifts = np.array(shifts, dtype=np.int16) % ALPHABET_LENGTH
+    nb_repeats = -(-letters.size // key_shifts.size)
+    letters -= letter_first_letters
+    letters += np.tile(key_shifts, nb_repeats)[: letters.size]
+    letters %= ALPHABET_LENGTH
+    letters += letter_first_letters
+
+    result = np.frombuffer(out, dtype=np.uint8, count=length)
+    if out is not data:
+        result[:] = codes
+    np.place(result, is_alpha, letters.astype(np.uint8))
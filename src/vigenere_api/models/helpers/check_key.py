@@ -16,7 +16,15 @@
 
 """Check if the key is good."""
 
-from .errors import BadKeyError, EmptyKeyError, ExpectedKeyType, KeyTypeError
+from typing import Union
+
+from .errors import (
+    BadKeyError,
+    EmptyKeyError,
+    ExpectedKeyType,
+    KeyTypeError,
+    TooLongKeyError,
+)
 
 
 def check_key(key: str) -> None:
@@ -45,3 +53,37 @@ def check_key(key: str) -> None:
 
     if not key.isalpha():
         raise BadKeyError(key, ExpectedKeyType.STRING)
+
+
+def check_caesar_key(key: Union[int, str]) -> None:
+    """
+    Check if the key is an integer or an alphabetic character.
+
+    Parameters
+    ----------
+    key : Union[int, str]
+        The key to check.
+
+    Raises
+    ------
+    KeyTypeError
+        Thrown if 'key' is not an integer and not a string.
+    EmptyKeyError
+        Thrown if 'key' is an empty string.
+    TooLongKeyError
+        Thrown if 'key' is a string with a length longer than 1.
+    BadKeyError
+        Thrown if 'key' is not an alphabetic character.
+    """
+    if not isinstance(key, (str, int)):
+        raise KeyTypeError(key, ExpectedKeyType.STRING_OR_INTEGER)
+
+    if isinstance(key, str):
+        if len(key) == 0:
+            raise EmptyKeyError
+
+        if len(key) > 1:
+            raise TooLongKeyError
+
+        if not key.isalpha():
+            raise BadKeyError(key, ExpectedKeyType.STRING_OR_INTEGER)
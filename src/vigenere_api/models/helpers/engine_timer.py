@@ -0,0 +1,101 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Counters of the time spent in each engine applying the shifts."""
+
+from dataclasses import dataclass
+from threading import Lock
+from typing import final, Final
+
+
+@final
+@dataclass(frozen=True)
+class EngineStatistics:
+    """Counters of an engine."""
+
+    calls: int
+    """Number of texts moved by the engine."""
+
+    characters: int
+    """Number of characters, or bytes, moved by the engine."""
+
+    total_time: float
+    """Sum of the times, in seconds, spent in the engine."""
+
+
+@final
+class EngineTimer:
+    """
+    Thread-safe counters of the calls of each engine, in the current process.
+
+    Exemples
+    --------
+    >>> timer = EngineTimer()
+    >>> timer.observe("numpy", 2048, 0.001)
+    >>> timer.statistics["numpy"].characters
+    2048
+    """
+
+    def __init__(self) -> None:
+        """Create the timer without engine."""
+        self.__lock: Final = Lock()
+        self.__counters: Final[dict[str, tuple[int, int, float]]] = {}
+
+    def observe(self, engine: str, nb_characters: int, duration: float) -> None:
+        """
+        Add a call of an engine.
+
+        Parameters
+        ----------
+        engine : str
+            The name of the engine.
+        nb_characters : int
+            The number of characters, or bytes, moved.
+        duration : float
+            The time, in seconds, spent in the engine.
+        """
+        with self.__lock:
+            calls, characters, total_time = self.__counters.get(engine, (0, 0, 0.0))
+            self.__counters[engine] = (
+                calls + 1,
+                characters + nb_characters,
+                total_time + duration,
+            )
+
+    def clear(self) -> None:
+        """Remove the counters of all engines."""
+        with self.__lock:
+            self.__counters.clear()
+
+    @property
+    def statistics(self) -> dict[str, EngineStatistics]:
+        """
+        Get a snapshot of the counters of each called engine.
+
+        Returns
+        -------
+        statistics
+            dict[str, EngineStatistics]
+        """
+        with self.__lock:
+            return {
+                engine: EngineStatistics(*counters)
+                for engine, counters in self.__counters.items()
+            }
+
+
+engine_timer: Final = EngineTimer()
+"""The timer of the engines of apply_shifts and cipher_bytes."""
@@ -205,3 +205,83 @@ class TooLongKeyError(ValueError):
         super().__init__(
             "The key is too long. Please give a one character string or an integer.",
         )
+
+
+@final
+class CacheSizeTypeError(VigenereAPITypeError):
+    """Thrown if the maximal size of a cache is not an integer."""
+
+    def __init__(self, max_size: Any, name: str = "maximal size of the cache") -> None:
+        """
+        Create a CacheSizeTypeError with the maximal size.
+
+        Parameters
+        ----------
+        max_size : Any
+            The received maximal size.
+        name : str, default "maximal size of the cache"
+            The name of the maximal size.
+        """
+        super().__init__(max_size, name, "an integer")
+
+
+@final
+class BadCacheSizeError(ValueError):
+    """Thrown if the maximal size of a cache is negative."""
+
+    def __init__(self, max_size: int, name: str = "maximal size of the cache") -> None:
+        """
+        Create a BadCacheSizeError with the maximal size.
+
+        Parameters
+        ----------
+        max_size : int
+            The received maximal size.
+        name : str, default "maximal size of the cache"
+            The name of the maximal size.
+        """
+        super().__init__(
+            f"The {name} is '{max_size}'."
+            + " Please give an integer greater or equal to zero.",
+        )
+
+
+@final
+class BufferTypeError(VigenereAPITypeError):
+    """Thrown if the bytes engine receives a bad type for a buffer."""
+
+    def __init__(self, buffer: Any, name: str, expected: str) -> None:
+        """
+        Create a BufferTypeError with the buffer.
+
+        Parameters
+        ----------
+        buffer : Any
+            The received buffer.
+        name : str
+            The name of the buffer.
+        expected : str
+            The expected types.
+        """
+        super().__init__(buffer, name, expected)
+
+
+@final
+class TooSmallBufferError(ValueError):
+    """Thrown if the output buffer is shorter than the input buffer."""
+
+    def __init__(self, output_length: int, input_length: int) -> None:
+        """
+        Create a TooSmallBufferError with the lengths of the buffers.
+
+        Parameters
+        ----------
+        output_length : int
+            The length of the output buffer.
+        input_length : int
+            The length of the input buffer.
+        """
+        super().__init__(
+            f"The output buffer has a length of '{output_length}'."
+            + f" Please give a buffer of at least '{input_length}' bytes.",
+        )
@@ -0,0 +1,222 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Cache of the compiled Vigenere keys shared between requests."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import final, Final
+
+from vigenere_api.helpers import get_int_env
+
+from .errors import BadCacheSizeError, CacheSizeTypeError
+from .vigenere_key import VigenereKey
+
+
+_MAX_KEY_LENGTH_NAME: Final = "maximal length of a cached key"
+
+
+@final
+@dataclass(frozen=True)
+class KeyCacheStatistics:
+    """Counters of a VigenereKeyCache."""
+
+    hits: int
+    """Number of keys found in the cache."""
+
+    misses: int
+    """Number of keys compiled because they were not in the cache."""
+
+    evictions: int
+    """Number of keys removed from the cache to respect the maximal size."""
+
+    size: int
+    """Number of keys in the cache."""
+
+    max_size: int
+    """Maximal number of keys in the cache."""
+
+
+@final
+class VigenereKeyCache:
+    """
+    Thread-safe LRU cache of the compiled Vigenere keys.
+
+    Invalid keys are never stored, each call raises the validation error.
+    The keys longer than the maximal key length are not stored,
+    so the memory of the cache is bounded by the number and the length of its keys.
+
+    Exemples
+    --------
+    >>> cache = VigenereKeyCache(max_size=2)
+    >>> key = cache.get("abc")
+    >>> key is cache.get("abc")
+    True
+    >>> cache.statistics.hits
+    1
+    """
+
+    def __init__(self, max_size: int, max_key_length: int = 0) -> None:
+        """
+        Create an empty cache.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximal number of keys in the cache. Zero disables the cache.
+        max_key_length : int, default 0
+            The maximal length of a key kept in the cache, the longer keys are
+            compiled for each call. Zero disables the limit.
+
+        Raises
+        ------
+        CacheSizeTypeError
+            Thrown if 'max_size' or 'max_key_length' is not an integer.
+        BadCacheSizeError
+            Thrown if 'max_size' or 'max_key_length' is negative.
+        """
+        if not isinstance(max_size, int):
+            raise CacheSizeTypeError(max_size)
+
+        if max_size < 0:
+            raise BadCacheSizeError(max_size)
+
+        if not isinstance(max_key_length, int):
+            raise CacheSizeTypeError(max_key_length, _MAX_KEY_LENGTH_NAME)
+
+        if max_key_length < 0:
+            raise BadCacheSizeError(max_key_length, _MAX_KEY_LENGTH_NAME)
+
+        self.__max_size: Final = max_size
+        self.__max_key_length: Final = max_key_length
+        self.__keys: Final[OrderedDict[str, VigenereKey]] = OrderedDict()
+        self.__lock: Final = Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, key: str) -> VigenereKey:
+        """
+        Get the compiled key, compile it if the key is not in the cache.
+
+        Parameters
+        ----------
+        key : str
+            The string used like a key.
+
+        Raises
+        ------
+        KeyTypeError
+            Thrown if 'key' is not a string.
+        EmptyKeyError
+            Thrown if 'key' is empty.
+        TooShortKeyError
+            Thrown if 'key' is too short.
+        BadKeyError
+            Thrown if 'key' contains invalid characters.
+
+        Returns
+        -------
+        compiled_key
+            VigenereKey
+        """
+        with self.__lock:
+            # An unhashable key is compiled to raise the KeyTypeError.
+            compiled_key = self.__keys.get(key) if isinstance(key, str) else None
+            if compiled_key is not None:
+                self.__keys.move_to_end(key)
+                self.__hits += 1
+                return compiled_key
+
+            self.__misses += 1
+
+        compiled_key = VigenereKey(key)
+
+        if self.__max_size > 0 and (
+            self.__max_key_length == 0 or len(key) <= self.__max_key_length
+        ):
+            with self.__lock:
+                self.__keys[key] = compiled_key
+                self.__keys.move_to_end(key)
+                if len(self.__keys) > self.__max_size:
+                    self.__keys.popitem(last=False)
+                    self.__evictions += 1
+
+        return compiled_key
+
+    def clear(self) -> None:
+        """Remove all keys and reset the counters."""
+        with self.__lock:
+            self.__keys.clear()
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    @property
+    def statistics(self) -> KeyCacheStatistics:
+        """
+        Get the counters of the cache.
+
+        Returns
+        -------
+        statistics
+            KeyCacheStatistics
+        """
+        with self.__lock:
+            return KeyCacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                size=len(self.__keys),
+                max_size=self.__max_size,
+            )
+
+
+vigenere_key_cache: Final = VigenereKeyCache(
+    get_int_env("VIGENERE_API_KEY_CACHE_SIZE", 1024),
+    get_int_env("VIGENERE_API_KEY_CACHE_MAX_KEY_LENGTH", 1024),
+)
+"""Cache used by VigenereData, its size is set by VIGENERE_API_KEY_CACHE_SIZE,
+and the length of its keys by VIGENERE_API_KEY_CACHE_MAX_KEY_LENGTH."""
+
+
+def get_vigenere_key(key: str) -> VigenereKey:
+    """
+    Get the compiled key from the shared cache.
+
+    Parameters
+    ----------
+    key : str
+        The string used like a key.
+
+    Raises
+    ------
+    KeyTypeError
+        Thrown if 'key' is not a string.
+    EmptyKeyError
+        Thrown if 'key' is empty.
+    TooShortKeyError
+        Thrown if 'key' is too short.
+    BadKeyError
+        Thrown if 'key' contains invalid characters.
+
+    Returns
+    -------
+    compiled_key
+        VigenereKey
+    """
+    return vigenere_key_cache.get(key)
@@ -0,0 +1,128 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Precomputed translation tables to move all alphabetic characters of a text."""
+
+from collections.abc import Mapping
+from typing import final, Final
+
+from .errors import HelperKeyTypeError
+
+
+ALPHABET_LENGTH: Final = 26
+UPPER_FIRST_LETTER: Final = ord("A")
+LOWER_FIRST_LETTER: Final = ord("a")
+
+_ASCII_LENGTH: Final = 128
+
+
+@final
+class _ShiftTable(dict[int, int]):
+    """
+    Translation table for 'str.translate', moving each alphabetic character.
+
+    The ASCII characters are computed at the creation.
+    Other letters are computed on the first lookup, then kept in the table.
+    Other characters are not moved and never kept, so the table cannot grow
+    with the characters of the texts.
+    """
+
+    __slots__ = ("__shift",)
+
+    def __init__(self, shift: int) -> None:
+        """
+        Create the translation table for the shift.
+
+        Parameters
+        ----------
+        shift : int
+            The shift between 0 and 25.
+        """
+        super().__init__()
+        self.__shift: Final = shift
+
+        for code in range(_ASCII_LENGTH):
+            self[code] = code
+
+        for first_letter in (UPPER_FIRST_LETTER, LOWER_FIRST_LETTER):
+            for index in range(ALPHABET_LENGTH):
+                self[first_letter + index] = (
+                    first_letter + (index + shift) % ALPHABET_LENGTH
+                )
+
+    def __missing__(self, code: int) -> int:
+        """
+        Compute the moved code point, like the function 'move_char'.
+
+        Only the alphabetic characters are kept in the table.
+
+        Parameters
+        ----------
+        code : int
+            The code point of the character.
+
+        Returns
+        -------
+        moved_code
+            int
+        """
+        char = chr(code)
+        if not char.isalpha():
+            return code
+
+        first_letter = UPPER_FIRST_LETTER if char.isupper() else LOWER_FIRST_LETTER
+        moved_code = (
+            first_letter + (code - first_letter + self.__shift) % ALPHABET_LENGTH
+        )
+
+        self[code] = moved_code
+        return moved_code
+
+
+_SHIFT_TABLES: Final = tuple(_ShiftTable(shift) for shift in range(ALPHABET_LENGTH))
+
+
+def get_shift_table(key: int) -> Mapping[int, int]:
+    """
+    Get the translation table moving each alphabetic character with the key.
+
+    The table gives the same result as the function 'move_char'
+    applied on each alphabetic character.
+
+    Parameters
+    ----------
+    key : int
+        The key to moving the characters.
+
+    Raises
+    ------
+    HelperKeyTypeError
+        Thrown if 'key' is not an integer.
+
+    Returns
+    -------
+    table
+        Mapping[int, int]
+
+    Examples
+    --------
+    >>> "Hello World!".translate(get_shift_table(1))
+    'Ifmmp Xpsme!'
+    """
+    if not isinstance(key, int):
+        raise HelperKeyTypeError(key)
+
+    return _SHIFT_TABLES[key % ALPHABET_LENGTH]
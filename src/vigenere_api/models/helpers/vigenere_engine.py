@@ -0,0 +1,498 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Engines applying the Vigenere shifts on each alphabetic character of a text."""
+
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from string import ascii_letters
+from threading import Lock
+from time import perf_counter
+from typing import Any, final, Final, Optional
+
+from vigenere_api.helpers import get_int_env, get_process_context
+
+from .engine_timer import engine_timer
+from .shift_table import (
+    ALPHABET_LENGTH,
+    get_shift_table,
+    LOWER_FIRST_LETTER,
+    UPPER_FIRST_LETTER,
+)
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+    _LAST_ASCII: Final = 0x7F
+    _ASCII_FIRST_LETTERS: Final = np.zeros(_LAST_ASCII + 1, dtype=np.int16)
+    _ASCII_FIRST_LETTERS[UPPER_FIRST_LETTER : UPPER_FIRST_LETTER + ALPHABET_LENGTH] = (
+        UPPER_FIRST_LETTER
+    )
+    _ASCII_FIRST_LETTERS[LOWER_FIRST_LETTER : LOWER_FIRST_LETTER + ALPHABET_LENGTH] = (
+        LOWER_FIRST_LETTER
+    )
+
+
+NUMPY_THRESHOLD: Final = get_int_env("VIGENERE_API_NUMPY_THRESHOLD", 1024)
+"""Minimal length of a text to use the NumPy engine."""
+
+PARALLEL_THRESHOLD: Final = get_int_env("VIGENERE_API_PARALLEL_THRESHOLD", 4_194_304)
+"""Minimal length of a text to split it between several processes."""
+
+PARALLEL_WORKERS: Final = get_int_env(
+    "VIGENERE_API_PARALLEL_WORKERS",
+    os.cpu_count() or 1,
+)
+"""Number of processes of the parallel engine, 0 or 1 disables it."""
+
+_ASCII_LETTERS: Final = ascii_letters.encode("ascii")
+
+
+def count_letters(text: str) -> int:
+    """
+    Count the alphabetic characters, the characters consuming a shift.
+
+    Parameters
+    ----------
+    text : str
+        The text to count the letters.
+
+    Returns
+    -------
+    nb_letters
+        int
+
+    Examples
+    --------
+    >>> count_letters("Hello World!")
+    10
+    """
+    if text.isascii():
+        return len(text) - len(text.encode("ascii").translate(None, _ASCII_LETTERS))
+
+    return sum(map(str.isalpha, text))
+
+
+def apply_shifts(
+    text: str,
+    shifts: Sequence[int],
+    numpy_threshold: Optional[int] = None,
+    offset: int = 0,
+    parallel_threshold: Optional[int] = None,
+    nb_workers: Optional[int] = None,
+) -> str:
+    """
+    Move each alphabetic character of the text with the next shift.
+
+    The shifts are used in loop, only alphabetic characters consume a shift.
+    The NumPy engine is used if NumPy is installed
+    and if the text is not shorter than the threshold.
+    A text not shorter than the parallel threshold is split between processes,
+    the result is the same as the serial engines. The time of each engine
+    is added in the engine_timer. The pool of processes is shared by the calls
+    until shutdown_process_pool, it is replaced if another number is asked.
+
+    Parameters
+    ----------
+    text : str
+        The text to apply the shifts.
+    shifts : Sequence[int]
+        The not empty sequence of shifts.
+    numpy_threshold : Optional[int], default NUMPY_THRESHOLD
+        The minimal length of the text to use the NumPy engine.
+    offset : int, default 0
+        The index of the first shift to use.
+        It allows to continue a text, with the number of letters already moved.
+    parallel_threshold : Optional[int], default PARALLEL_THRESHOLD
+        The minimal length of the text to use the parallel engine.
+    nb_workers : Optional[int], default PARALLEL_WORKERS
+        The number of processes of the parallel engine, 0 or 1 disables it.
+
+    Returns
+    -------
+    moved_text
+        str
+
+    Examples
+    --------
+    >>> apply_shifts("Hello World!", [0, 1])
+    'Hflmo Xosle!'
+    >>> apply_shifts("Hello", [0, 1]) + apply_shifts(" World!", [0, 1], offset=5)
+    'Hflmo Xosle!'
+    """
+    if numpy_threshold is None:
+        numpy_threshold = NUMPY_THRESHOLD
+
+    if parallel_threshold is None:
+        parallel_threshold = PARALLEL_THRESHOLD
+
+    if nb_workers is None:
+        nb_workers = PARALLEL_WORKERS
+
+    start = perf_counter()
+    if nb_workers > 1 and len(text) >= parallel_threshold and _process_pool.is_enabled:
+        engine = "parallel"
+        moved_text = _parallel_engine(text, shifts, numpy_threshold, offset, nb_workers)
+    else:
+        engine = "numpy" if HAS_NUMPY and len(text) >= numpy_threshold else "python"
+        moved_text = _serial_engine(text, shifts, numpy_threshold, offset)
+
+    engine_timer.observe(engine, len(text), perf_counter() - start)
+    return moved_text
+
+
+def uses_parallel_engine(length: int) -> bool:
+    """
+    Check if apply_shifts splits a text of the length between processes.
+
+    Parameters
+    ----------
+    length : int
+        The length of the text.
+
+    Returns
+    -------
+    uses_parallel_engine
+        bool
+        True if the text is not shorter than PARALLEL_THRESHOLD,
+        with several PARALLEL_WORKERS and the parallel engine enabled.
+
+    Examples
+    --------
+    >>> uses_parallel_engine(10)
+    False
+    """
+    return (
+        PARALLEL_WORKERS > 1
+        and length >= PARALLEL_THRESHOLD
+        and _process_pool.is_enabled
+    )
+
+
+def _serial_engine(
+    text: str,
+    shifts: Sequence[int],
+    numpy_threshold: int,
+    offset: int,
+) -> str:
+    """
+    Apply the shifts in the current process.
+
+    Parameters
+    ----------
+    text : str
+        The text to apply the shifts.
+    shifts : Sequence[int]
+        The not empty sequence of shifts.
+    numpy_threshold : int
+        The minimal length of the text to use the NumPy engine.
+    offset : int
+        The index of the first shift to use.
+
+    Returns
+    -------
+    moved_text
+        str
+    """
+    offset %= len(shifts)
+    if offset != 0:
+        shifts = tuple(shifts[offset:]) + tuple(shifts[:offset])
+
+    if HAS_NUMPY and len(text) >= numpy_threshold:
+        return _numpy_engine(text, shifts)
+
+    return _python_engine(text, shifts)
+
+
+@final
+class _ProcessPool:
+    """The process pool of the parallel engine, one by process."""
+
+    def __init__(self) -> None:
+        """Create the holder, the pool is started by the first parallel text."""
+        self.__lock: Final = Lock()
+        self.__executor: Optional[ProcessPoolExecutor] = None
+        self.__nb_workers = 0
+        self.__is_enabled = True
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Check if the parallel engine can start processes.
+
+        Returns
+        -------
+        is_enabled
+            bool
+        """
+        return self.__is_enabled
+
+    def submit_map(
+        self,
+        nb_workers: int,
+        function: Callable[..., str],
+        *iterables: Iterable[Any],
+    ) -> Iterator[str]:
+        """
+        Submit the calls to the pool, started with the number of processes.
+
+        A pool with another number of processes is replaced,
+        its submitted calls finish before its processes stop.
+
+        Parameters
+        ----------
+        nb_workers : int
+            The number of processes.
+        function : Callable[..., str]
+            The function called in the processes.
+        *iterables : Iterable[Any]
+            The arguments of each call.
+
+        Returns
+        -------
+        results
+            Iterator[str]
+            The result of each call, in the order of the arguments.
+        """
+        with self.__lock:
+            previous_executor = None
+            if self.__executor is not None and nb_workers != self.__nb_workers:
+                previous_executor = self.__executor
+                self.__executor = None
+
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(
+                    max_workers=nb_workers,
+                    mp_context=get_process_context(),
+                )
+                self.__nb_workers = nb_workers
+
+            # The calls are submitted before the pool can be replaced or stopped.
+            results = self.__executor.map(function, *iterables)
+
+        if previous_executor is not None:
+            previous_executor.shutdown(wait=False)
+
+        return results
+
+    def disable(self) -> None:
+        """Move the next texts in the current process, the pool is never started."""
+        self.__is_enabled = False
+
+    def shutdown(self) -> None:
+        """Stop the processes, a next parallel text starts a new pool."""
+        with self.__lock:
+            executor = self.__executor
+            self.__executor = None
+
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+_process_pool: Final = _ProcessPool()
+
+
+def shutdown_process_pool() -> None:
+    """
+    Stop the processes of the parallel engine, before the exit of the program.
+
+    The pool is started again by the next text longer than the parallel threshold.
+
+    Examples
+    --------
+    >>> shutdown_process_pool()
+    """
+    _process_pool.shutdown()
+
+
+def disable_parallel_engine() -> None:
+    """
+    Move all the texts in the current process, without starting the process pool.
+
+    It is the initializer of the processes running jobs,
+    so they do not start their own processes.
+    """
+    _process_pool.disable()
+
+
+def _parallel_engine(
+    text: str,
+    shifts: Sequence[int],
+    numpy_threshold: int,
+    offset: int,
+    nb_workers: int,
+) -> str:
+    """
+    Split the text in one chunk per process, then join the moved chunks.
+
+    The offset of each chunk is the number of letters in the previous chunks,
+    so the result is the same as the serial engines.
+
+    Parameters
+    ----------
+    text : str
+        The text to apply the shifts.
+    shifts : Sequence[int]
+        The not empty sequence of shifts.
+    numpy_threshold : int
+        The minimal length of a chunk to use the NumPy engine.
+    offset : int
+        The index of the first shift to use.
+    nb_workers : int
+        The number of processes.
+
+    Returns
+    -------
+    moved_text
+        str
+    """
+    chunk_size = -(-len(text) // nb_workers)
+    chunks = [
+        text[start : start + chunk_size] for start in range(0, len(text), chunk_size)
+    ]
+
+    offsets = []
+    for chunk in chunks:
+        offsets.append(offset)
+        offset += count_letters(chunk)
+
+    moved_chunks = _process_pool.submit_map(
+        nb_workers,
+        _serial_engine,
+        chunks,
+        repeat(tuple(shifts)),
+        repeat(numpy_threshold),
+        offsets,
+    )
+
+    return "".join(moved_chunks)
+
+
+def _python_engine(text: str, shifts: Sequence[int]) -> str:
+    """
+    Apply the shifts with the translation tables.
+
+    Parameters
+    ----------
+    text : str
+        The text to apply the shifts.
+    shifts : Sequence[int]
+        The not empty sequence of shifts.
+
+    Returns
+    -------
+    moved_text
+        str
+    """
+    tables = [get_shift_table(shift) for shift in shifts]
+    nb_tables = len(tables)
+
+    index = 0
+    result = []
+    for char in text:
+        if char.isalpha():
+            result.append(chr(tables[index][ord(char)]))
+            index = (index + 1) % nb_tables
+        else:
+            result.append(char)
+
+    return "".join(result)
+
+
+def _get_first_letter(code: int) -> int:
+    """
+    Get the first letter of the alphabet used to move the character.
+
+    Parameters
+    ----------
+    code : int
+        The code point of the character.
+
+    Returns
+    -------
+    first_letter
+        int
+        The code point of 'A' or 'a', or 0 if the character is not alphabetic.
+    """
+    char = chr(code)
+    if not char.isalpha():
+        return 0
+
+    return UPPER_FIRST_LETTER if char.isupper() else LOWER_FIRST_LETTER
+
+
+def _numpy_engine(text: str, shifts: Sequence[int]) -> str:
+    """
+    Apply the shifts in one vectorized pass over the code points of the text.
+
+    Parameters
+    ----------
+    text : str
+        The text to apply the shifts.
+    shifts : Sequence[int]
+        The not empty sequence of shifts.
+
+    Returns
+    -------
+    moved_text
+        str
+    """
+    is_ascii = text.isascii()
+    if is_ascii:
+        codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        first_letters = _ASCII_FIRST_LETTERS[codes]
+        codes = codes.astype(np.int16)
+    else:
+        codes = np.frombuffer(
+            text.encode("utf-32-le", "surrogatepass"),
+            dtype=np.uint32,
+        ).astype(np.int32)
+        first_letters = _ASCII_FIRST_LETTERS[np.minimum(codes, _LAST_ASCII)].astype(
+            np.int32,
+        )
+
+        non_ascii = codes > _LAST_ASCII
+        unique_codes, inverse = np.unique(codes[non_ascii], return_inverse=True)
+        unique_first_letters = np.array(
+            [_get_first_letter(code) for code in unique_codes.tolist()],
+            dtype=np.int32,
+        )
+        first_letters[non_ascii] = unique_first_letters[inverse]
+
+    # The letters are gathered in order, so the n-th letter uses the n-th tiled shift.
+    is_alpha = first_letters != 0
+    letters = codes[is_alpha]
+    letter_first_letters = first_letters[is_alpha]
+
+    key_shifts = np.array(shifts, dtype=codes.dtype) % ALPHABET_LENGTH
+    nb_repeats = -(-letters.size // key_shifts.size)
+    letters -= letter_first_letters
+    letters += np.tile(key_shifts, nb_repeats)[: letters.size]
+    letters %= ALPHABET_LENGTH
+    letters += letter_first_letters
+    np.place(codes, is_alpha, letters)
+
+    if is_ascii:
+        return codes.astype(np.uint8).tobytes().decode("ascii")
+
+    return codes.astype(np.uint32).tobytes().decode("utf-32-le", "surrogatepass")
@@ -16,15 +16,66 @@
 
 """Utils class for VigenereData."""
 
+from string import ascii_letters
 from typing import final, Final
 
 from .check_key import check_key
 from .errors import TooShortKeyError
+from .shift_table import ALPHABET_LENGTH, LOWER_FIRST_LETTER, UPPER_FIRST_LETTER
+
+
+_SHIFT_BYTES: Final = bytes.maketrans(
+    ascii_letters.encode("ascii"),
+    bytes(range(ALPHABET_LENGTH)) * 2,
+)
+_DECIPHER_BYTES: Final = bytes.maketrans(
+    bytes(range(ALPHABET_LENGTH)),
+    bytes(-shift % ALPHABET_LENGTH for shift in range(ALPHABET_LENGTH)),
+)
+
+
+def _get_cipher_shifts(key: str) -> bytes:
+    """
+    Convert each character of a checked key into a shift between 0 and 25.
+
+    An ASCII key is converted in one pass by 'bytes.translate'.
+    Other letters are converted like the function 'convert_key'.
+
+    Parameters
+    ----------
+    key : str
+        The checked key.
+
+    Returns
+    -------
+    cipher_shifts
+        bytes
+
+    Examples
+    --------
+    >>> list(_get_cipher_shifts("AbZz"))
+    [0, 1, 25, 25]
+    """
+    if key.isascii():
+        return key.encode("ascii").translate(_SHIFT_BYTES)
+
+    return bytes(
+        (ord(char) - (UPPER_FIRST_LETTER if char.isupper() else LOWER_FIRST_LETTER))
+        % ALPHABET_LENGTH
+        for char in key
+    )
 
 
 @final
 class VigenereKey:
-    """Util class to loop on each character of the key."""
+    """
+    Compiled Vigenere key, with the shifts to cipher and decipher.
+
+    The key is converted once to immutable tuples of shifts,
+    so the same object can be shared between threads and requests.
+    """
+
+    __slots__ = ("__key", "__cipher_shifts", "__decipher_shifts")
 
     def __init__(self, key: str) -> None:
         """
@@ -51,27 +102,36 @@ class VigenereKey:
         if len(key) == 1:
             raise TooShortKeyError
 
-        self.__index = 0
+        # The key is checked once, then all its characters are converted at once.
+        cipher_shifts = _get_cipher_shifts(key)
+
         self.__key: Final = key
+        self.__cipher_shifts: Final = tuple(cipher_shifts)
+        self.__decipher_shifts: Final = tuple(cipher_shifts.translate(_DECIPHER_BYTES))
 
-    def __next__(self) -> str:
+    @property
+    def cipher_shifts(self) -> tuple[int, ...]:
         """
-        Get the next character of the key.
+        Get the shifts, between 0 and 25, to cipher a text.
 
         Returns
         -------
-        The next character of the key.
-            str
+        cipher_shifts
+            tuple[int, ...]
+        """
+        return self.__cipher_shifts
+
+    @property
+    def decipher_shifts(self) -> tuple[int, ...]:
         """
-        try:
-            return self.__key[self.__index]
-        finally:
-            self.__increase_index()
+        Get the shifts, between 0 and 25, to decipher a text.
 
-    def __increase_index(self) -> None:
-        """Increase the index of the key."""
-        self.__index += 1
-        self.__index %= len(self)
+        Returns
+        -------
+        decipher_shifts
+            tuple[int, ...]
+        """
+        return self.__decipher_shifts
 
     def __len__(self) -> int:
         """
@@ -83,3 +143,46 @@ class VigenereKey:
             The length of the key.
         """
         return len(self.__key)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Check if both keys have the same shifts.
+
+        The case of the key is ignored.
+
+        Parameters
+        ----------
+        other : object
+            The other key.
+
+        Returns
+        -------
+        bool
+            True if both keys have the same shifts.
+        """
+        if not isinstance(other, VigenereKey):
+            return NotImplemented
+
+        return self.__cipher_shifts == other.cipher_shifts
+
+    def __hash__(self) -> int:
+        """
+        Get the hash of the shifts.
+
+        Returns
+        -------
+        int
+            The hash of the shifts.
+        """
+        return hash(self.__cipher_shifts)
+
+    def __repr__(self) -> str:
+        """
+        Get the representation of the key.
+
+        Returns
+        -------
+        str
+            The representation of the key.
+        """
+        return f"VigenereKey({self.__key!r})"
@@ -0,0 +1,393 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""Incremental Caesar and Vigenere algorithms, chunk by chunk."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from codecs import getincrementaldecoder
+from typing import final, Union
+
+from .errors import ChunkTypeError, FinalizedStreamError
+from .helpers import (
+    apply_shifts,
+    cipher_bytes,
+    convert_key,
+    count_bytes_letters,
+    count_letters,
+    get_shift_table,
+    get_vigenere_key,
+    is_ascii_bytes,
+)
+from .helpers.check_key import check_caesar_key
+
+
+Chunk = Union[str, bytes, bytearray, memoryview]
+
+
+class BaseStream(ABC):
+    """
+    Base of the streams, it decodes the chunks and follows the finalization.
+
+    Bytes are decoded like UTF-8, a character split between two chunks is kept
+    until the next chunk. Invalid UTF-8 bytes are not alphabetic characters,
+    they are escaped with the 'surrogateescape' error handler.
+
+    The methods 'update_bytes' and 'finalize_bytes' give UTF-8 bytes.
+    ASCII chunks are moved without decoding them, into a new bytearray.
+    """
+
+    def __init__(self) -> None:
+        """Create a stream ready to receive chunks."""
+        self.__decoder = getincrementaldecoder("utf-8")("surrogateescape")
+        self.__finalized = False
+
+    @property
+    def finalized(self) -> bool:
+        """
+        Check if the stream is finalized.
+
+        Returns
+        -------
+        finalized
+            bool
+        """
+        return self.__finalized
+
+    def update(self, chunk: Chunk) -> str:
+        """
+        Cipher or decipher the next chunk.
+
+        Parameters
+        ----------
+        chunk : Chunk
+            The next part of the text, a string or UTF-8 bytes-like object.
+
+        Raises
+        ------
+        FinalizedStreamError
+            Thrown if the stream is finalized.
+        ChunkTypeError
+            Thrown if 'chunk' is not a string or bytes.
+
+        Returns
+        -------
+        moved_chunk
+            str
+        """
+        if self.__finalized:
+            raise FinalizedStreamError
+
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            text = self.__decoder.decode(chunk)
+        elif isinstance(chunk, str):
+            text = self.__decoder.decode(b"", final=True) + chunk
+        else:
+            raise ChunkTypeError(chunk)
+
+        return self._move(text) if text else ""
+
+    def finalize(self) -> str:
+        """
+        Finalize the stream and get the last bytes kept by the decoder.
+
+        Raises
+        ------
+        FinalizedStreamError
+            Thrown if the stream is already finalized.
+
+        Returns
+        -------
+        moved_rest
+            str
+        """
+        if self.__finalized:
+            raise FinalizedStreamError
+
+        self.__finalized = True
+        text = self.__decoder.decode(b"", final=True)
+
+        return self._move(text) if text else ""
+
+    def update_bytes(
+        self,
+        chunk: Union[bytes, bytearray, memoryview],
+    ) -> Union[bytes, bytearray]:
+        """
+        Cipher or decipher the next chunk of UTF-8 bytes.
+
+        Parameters
+        ----------
+        chunk : Union[bytes, bytearray, memoryview]
+            The next part of the text, in UTF-8.
+
+        Raises
+        ------
+        FinalizedStreamError
+            Thrown if the stream is finalized.
+        ChunkTypeError
+            Thrown if 'chunk' is not a bytes-like object.
+        BufferTypeError
+            Thrown if 'chunk' is a memoryview not made of contiguous bytes.
+
+        Returns
+        -------
+        moved_chunk
+            Union[bytes, bytearray]
+            The moved chunk, in UTF-8.
+        """
+        if self.__finalized:
+            raise FinalizedStreamError
+
+        if not isinstance(chunk, (bytes, bytearray, memoryview)):
+            raise ChunkTypeError(chunk)
+
+        pending_bytes, _flag = self.__decoder.getstate()
+        if not pending_bytes and is_ascii_bytes(chunk):
+            return self._move_bytes(chunk) if chunk else b""
+
+        return self.update(chunk).encode("utf-8", "surrogateescape")
+
+    def finalize_bytes(self) -> bytes:
+        """
+        Finalize the stream and get the last bytes kept by the decoder.
+
+        Raises
+        ------
+        FinalizedStreamError
+            Thrown if the stream is already finalized.
+
+        Returns
+        -------
+        moved_rest
+            bytes
+            The moved rest, in UTF-8.
+        """
+        return self.finalize().encode("utf-8", "surrogateescape")
+
+    @abstractmethod
+    def _move(self, text: str) -> str:
+        """
+        Apply the algorithm on the decoded text.
+
+        Parameters
+        ----------
+        text : str
+            The decoded text, never empty.
+
+        Returns
+        -------
+        moved_text
+            str
+        """
+
+    @abstractmethod
+    def _move_bytes(self, chunk: Union[bytes, bytearray, memoryview]) -> bytearray:
+        """
+        Apply the algorithm on the ASCII bytes.
+
+        Parameters
+        ----------
+        chunk : Union[bytes, bytearray, memoryview]
+            The ASCII bytes, never empty.
+
+        Returns
+        -------
+        moved_chunk
+            bytearray
+        """
+
+
+@final
+class CaesarStream(BaseStream):
+    """
+    Caesar algorithm applied chunk by chunk.
+
+    Exemples
+    --------
+    >>> from vigenere_api.models import CaesarStream
+
+    >>> stream = CaesarStream(key="b")
+    >>> stream.update("Hello ") + stream.update(b"World") + stream.finalize()
+    'Ifmmp Xpsme'
+    """
+
+    def __init__(self, key: Union[int, str], *, decipher: bool = False) -> None:
+        """
+        Create a Caesar stream.
+
+        Parameters
+        ----------
+        key : Union[int, str]
+            The key of the Caesar algorithm.
+        decipher : bool, optional
+            Decipher the chunks instead of ciphering them, by default False.
+
+        Raises
+        ------
+        KeyTypeError
+            Thrown if 'key' is not an integer and not a string.
+        EmptyKeyError
+            Thrown if 'key' is an empty string.
+        TooLongKeyError
+            Thrown if 'key' is a string with a length longer than 1.
+        BadKeyError
+            Thrown if 'key' is not an alphabetic character.
+        """
+        super().__init__()
+
+        check_caesar_key(key)
+        int_key = key if isinstance(key, int) else convert_key(key)
+
+        self.__shift = -int_key if decipher else int_key
+        self.__table = get_shift_table(self.__shift)
+
+    def _move(self, text: str) -> str:
+        """
+        Apply the Caesar algorithm on the decoded text.
+
+        Parameters
+        ----------
+        text : str
+            The decoded text, never empty.
+
+        Returns
+        -------
+        moved_text
+            str
+        """
+        return text.translate(self.__table)
+
+    def _move_bytes(self, chunk: Union[bytes, bytearray, memoryview]) -> bytearray:
+        """
+        Apply the Caesar algorithm on the ASCII bytes.
+
+        Parameters
+        ----------
+        chunk : Union[bytes, bytearray, memoryview]
+            The ASCII bytes, never empty.
+
+        Returns
+        -------
+        moved_chunk
+            bytearray
+        """
+        moved_chunk = bytearray(len(chunk))
+        cipher_bytes(chunk, (self.__shift,), moved_chunk)
+
+        return moved_chunk
+
+
+@final
+class VigenereStream(BaseStream):
+    """
+    Vigenere algorithm applied chunk by chunk.
+
+    The position in the key continues between chunks,
+    the result is the same as with the whole text.
+
+    Exemples
+    --------
+    >>> from vigenere_api.models import VigenereStream
+
+    >>> stream = VigenereStream(key="test")
+    >>> stream.update("Hello ") + stream.update(b"World") + stream.finalize()
+    'Aideh Agkeh'
+    """
+
+    def __init__(self, key: str, *, decipher: bool = False) -> None:
+        """
+        Create a Vigenere stream.
+
+        Parameters
+        ----------
+        key : str
+            The key of the Vigenere algorithm.
+        decipher : bool, optional
+            Decipher the chunks instead of ciphering them, by default False.
+
+        Raises
+        ------
+        KeyTypeError
+            Thrown if 'key' is not a string.
+        EmptyKeyError
+            Thrown if 'key' is an empty string.
+        TooShortKeyError
+            Thrown if 'key' is a string with a length of 1.
+        BadKeyError
+            Thrown if 'key' contains a non-alphabetic character.
+        """
+        super().__init__()
+
+        compiled_key = get_vigenere_key(key)
+        self.__shifts = (
+            compiled_key.decipher_shifts if decipher else compiled_key.cipher_shifts
+        )
+        self.__offset = 0
+
+    @property
+    def offset(self) -> int:
+        """
+        Get the position in the key of the next alphabetic character.
+
+        Returns
+        -------
+        offset
+            int
+        """
+        return self.__offset
+
+    def _move(self, text: str) -> str:
+        """
+        Apply the Vigenere algorithm on the decoded text.
+
+        Parameters
+        ----------
+        text : str
+            The decoded text, never empty.
+
+        Returns
+        -------
+        moved_text
+            str
+        """
+        moved_text = apply_shifts(text, self.__shifts, offset=self.__offset)
+        self.__offset = (self.__offset + count_letters(text)) % len(self.__shifts)
+
+        return moved_text
+
+    def _move_bytes(self, chunk: Union[bytes, bytearray, memoryview]) -> bytearray:
+        """
+        Apply the Vigenere algorithm on the ASCII bytes.
+
+        Parameters
+        ----------
+        chunk : Union[bytes, bytearray, memoryview]
+            The ASCII bytes, never empty.
+
+        Returns
+        -------
+        moved_chunk
+            bytearray
+        """
+        moved_chunk = bytearray(len(chunk))
+        cipher_bytes(chunk, self.__shifts, moved_chunk, self.__offset)
+        self.__offset = (self.__offset + count_bytes_letters(chunk)) % len(
+            self.__shifts,
+        )
+
+        return moved_chunk
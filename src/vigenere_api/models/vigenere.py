@@ -19,7 +19,7 @@
 from __future__ import annotations
 
 from enum import auto, unique
-from typing import final
+from typing import Any, final
 
 from pydantic import StrictStr, validator
 
@@ -32,7 +32,7 @@ from .errors import (
     AlgorithmOperationTypeError,
     AlgorithmTextTypeError,
 )
-from .helpers import convert_key, move_char, VigenereKey
+from .helpers import apply_shifts, get_vigenere_key, VigenereKey
 
 
 @final
@@ -62,6 +62,11 @@ class VigenereData(BaseData):
 
     >>> assert vigenere_data == deciphered_data == "Hello World"
     >>> assert vigenere_data.key == ciphered_data.key == deciphered_data.key == "test"
+
+    Notes
+    -----
+    The results are built with 'construct', the key is not compiled
+    and validated a second time.
     """
 
     key: StrictStr
@@ -76,10 +81,10 @@ class VigenereData(BaseData):
         ciphered_data
             VigenereData
         """
-        return VigenereData(
+        return VigenereData.construct(
             content=self.__algorithm(
                 self.content,
-                VigenereKey(self.key),
+                get_vigenere_key(self.key),
                 VigenereOperation.CIPHER,
             ),
             key=self.key,
@@ -94,10 +99,10 @@ class VigenereData(BaseData):
         deciphered_data
             VigenereData
         """
-        return VigenereData(
+        return VigenereData.construct(
             content=self.__algorithm(
                 self.content,
-                VigenereKey(self.key),
+                get_vigenere_key(self.key),
                 VigenereOperation.DECIPHER,
             ),
             key=self.key,
@@ -140,21 +145,34 @@ class VigenereData(BaseData):
         if not isinstance(operation, VigenereOperation):
             raise AlgorithmOperationTypeError(operation)
 
-        result = ""
-        for char in text:
-            if char.isalpha():
-                index_key = convert_key(next(key))
-                if operation == VigenereOperation.DECIPHER:
-                    index_key = -index_key
+        shifts = key.cipher_shifts
+        if operation == VigenereOperation.DECIPHER:
+            shifts = key.decipher_shifts
+
+        return apply_shifts(text, shifts)
 
-                if char.isupper():
-                    result += move_char(char, index_key, "A")
-                else:
-                    result += move_char(char, index_key, "a")
-            else:
-                result += char
+    @classmethod
+    def _is_valid(cls, data: dict[str, Any]) -> bool:
+        """
+        Check the data without building any error.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The value of each field.
 
-        return result
+        Returns
+        -------
+        is_valid
+            bool
+        """
+        key = data.get("key")
+        return (
+            super()._is_valid(data)
+            and type(key) is str
+            and len(key) > 1
+            and key.isalpha()
+        )
 
     @validator("key", pre=True)
     def validate_key(cls, key: str) -> str:
@@ -182,6 +200,6 @@ class VigenereData(BaseData):
         key
             str
         """
-        _key_can_be_instantiate = VigenereKey(key)
+        _key_can_be_instantiate = get_vigenere_key(key)
 
         return key
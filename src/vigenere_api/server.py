@@ -16,22 +16,211 @@
 
 """Start method of API."""
 
+import os
+import socket
+from asyncio import new_event_loop
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import final, Final, Optional
+
 from uvicorn import Config, Server
+from uvicorn.supervisors import Multiprocess
 
 from .api import application
+from .api.helpers import use_fast_json
+from .helpers import get_int_env
+
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    HAS_UVLOOP = False
+else:
+    HAS_UVLOOP = True
+
+
+HOST: Final = os.environ.get("VIGENERE_API_HOST", "127.0.0.1")
+"""Default address listened by the server."""
+
+PORT: Final = get_int_env("VIGENERE_API_PORT", 8080)
+"""Default port listened by the server."""
+
+WORKERS: Final = get_int_env("VIGENERE_API_WORKERS", 1)
+"""Default number of server processes."""
+
+BACKLOG: Final = get_int_env("VIGENERE_API_BACKLOG", 2048)
+"""Default maximal number of connections waiting to be accepted."""
+
+KEEP_ALIVE: Final = get_int_env("VIGENERE_API_KEEP_ALIVE", 5)
+"""Default number of seconds an idle connection is kept open."""
+
+LIMIT_CONCURRENCY: Final = get_int_env("VIGENERE_API_LIMIT_CONCURRENCY", 0)
+"""Default maximal number of connections of each process, 0 for no limit."""
+
+PERFORMANCE: Final = get_int_env("VIGENERE_API_PERFORMANCE", 0) > 0
+"""Use uvloop and orjson if they are installed."""
+
+HAS_REUSE_PORT: Final = hasattr(socket, "SO_REUSEPORT")
+"""Each worker listens its own socket, the kernel balances the connections."""
+
+_APPLICATION_PATH: Final = "vigenere_api.api:application"
+
+
+@final
+@dataclass(frozen=True)
+class ServerOptions:
+    """Options of the server, by default from the environment variables."""
+
+    host: str = HOST
+    """The address to listen."""
+
+    port: int = PORT
+    """The port to listen."""
+
+    workers: int = WORKERS
+    """The number of server processes, 1 serves in the current process."""
+
+    backlog: int = BACKLOG
+    """The maximal number of connections waiting to be accepted."""
+
+    keep_alive: int = KEEP_ALIVE
+    """The number of seconds an idle connection is kept open."""
+
+    limit_concurrency: int = LIMIT_CONCURRENCY
+    """The maximal number of connections of each process, 0 for no limit."""
+
+    performance: bool = PERFORMANCE
+    """Use the event loop uvloop and the JSON codec orjson, if they are installed."""
+
 
+def _create_config(options: ServerOptions) -> Config:
+    """
+    Create the configuration of uvicorn.
 
-async def start() -> None:
-    """Start the API on 127.0.0.1:8080."""
-    server = Server(
-        Config(
-            app=application,
-            port=8080,
-            http="httptools",
-            ws="none",
-            log_level="info",
-            use_colors=True,
-        ),
+    Parameters
+    ----------
+    options : ServerOptions
+        The options of the server.
+
+    Returns
+    -------
+    config
+        Config
+    """
+    return Config(
+        app=application if options.workers <= 1 else _APPLICATION_PATH,
+        host=options.host,
+        port=options.port,
+        loop="uvloop" if options.performance and HAS_UVLOOP else "asyncio",
+        http="httptools",
+        ws="none",
+        log_level="info",
+        use_colors=True,
+        workers=max(options.workers, 1),
+        backlog=options.backlog,
+        timeout_keep_alive=options.keep_alive,
+        limit_concurrency=options.limit_concurrency or None,
     )
 
+
+def _create_reuse_port_socket(options: ServerOptions) -> socket.socket:
+    """
+    Create a socket bound with SO_REUSEPORT, shared with the other workers.
+
+    Parameters
+    ----------
+    options : ServerOptions
+        The options of the server.
+
+    Returns
+    -------
+    server_socket
+        socket.socket
+    """
+    family, kind, protocol, _name, address = socket.getaddrinfo(
+        options.host,
+        options.port,
+        type=socket.SOCK_STREAM,
+    )[0]
+    server_socket = socket.socket(family, kind, protocol)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    server_socket.bind(address)
+
+    return server_socket
+
+
+def _serve_worker(
+    options: ServerOptions,
+    sockets: Optional[list[socket.socket]] = None,
+) -> None:
+    """
+    Serve the API in a worker process.
+
+    Parameters
+    ----------
+    options : ServerOptions
+        The options of the server.
+    sockets : Optional[list[socket.socket]], default None
+        The sockets bound by the supervisor, without SO_REUSEPORT.
+    """
+    if not sockets:
+        sockets = [_create_reuse_port_socket(options)]
+
+    if options.performance:
+        use_fast_json()
+
+    Server(_create_config(options)).run(sockets=sockets)
+
+
+async def start(options: Optional[ServerOptions] = None) -> None:
+    """
+    Start the API in the current process, on 127.0.0.1:8080 by default.
+
+    Parameters
+    ----------
+    options : Optional[ServerOptions], default None
+        The options of the server, the number of workers is not used.
+    """
+    if options is None:
+        options = ServerOptions()
+
+    if options.performance:
+        use_fast_json()
+
+    server = Server(_create_config(replace(options, workers=1)))
+
     await server.serve()
+
+
+def run(options: Optional[ServerOptions] = None) -> None:
+    """
+    Run the API with the number of workers of the options.
+
+    With several workers, a supervisor process starts the workers,
+    restarts them if they die, and restarts them all gracefully on SIGHUP.
+    Each worker listens its own SO_REUSEPORT socket if the platform supports it,
+    else the workers share the socket of the supervisor.
+    With the performance option, the event loop is uvloop and the JSON codec is orjson,
+    each one is used only if it is installed.
+
+    Parameters
+    ----------
+    options : Optional[ServerOptions], default None
+        The options of the server.
+    """
+    if options is None:
+        options = ServerOptions()
+
+    if options.workers <= 1:
+        loop = (
+            uvloop.new_event_loop()
+            if options.performance and HAS_UVLOOP
+            else new_event_loop()
+        )
+        loop.run_until_complete(start(options))
+        return
+
+    config = _create_config(options)
+    sockets = [] if HAS_REUSE_PORT else [config.bind_socket()]
+    Multiprocess(config, partial(_serve_worker, options), sockets).run()
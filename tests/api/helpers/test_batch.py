@@ -0,0 +1,97 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+from vigenere_api.api.helpers import Algorithm, BatchControllerDocs, process_batch
+from vigenere_api.api.helpers.errors import (
+    AlgorithmTypeError,
+    ExamplesTypeError,
+    ExampleTypeError,
+    TooLargeBatchError,
+)
+from vigenere_api.api.v1.controllers.caesar.docs import CAESAR_DATA1, CAESAR_DATA2
+from vigenere_api.models import CaesarData, VigenereData
+
+
+class ProcessBatchSuite:
+    @staticmethod
+    def test_results_in_order() -> None:
+        results = process_batch(
+            [
+                {"operation": "decipher", "content": "Vxum", "key": "ct"},
+                {"operation": "cipher", "content": "Test", "key": "ct"},
+            ],
+            VigenereData,
+        )
+
+        assert results == [
+            {"content": "Test", "key": "ct"},
+            {"content": "Vxum", "key": "ct"},
+        ]
+
+    @staticmethod
+    def test_missing_operation() -> None:
+        results = process_batch([{"content": "Test", "key": 1}], CaesarData)
+
+        assert results[0]["errors"][0]["loc"] == ("operation",)
+
+    @staticmethod
+    def test_all_errors_of_item() -> None:
+        results = process_batch(
+            [{"operation": "cipher", "content": "", "key": "a"}],
+            VigenereData,
+        )
+
+        assert [error["loc"] for error in results[0]["errors"]] == [
+            ("content",),
+            ("key",),
+        ]
+
+    @staticmethod
+    @pytest.mark.raises(exception=TooLargeBatchError)
+    def test_too_large_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("vigenere_api.api.helpers.batch.MAX_BATCH_SIZE", 1)
+
+        _ignored = process_batch(
+            [{"operation": "cipher", "content": "Test", "key": 1}] * 2,
+            CaesarData,
+        )
+
+
+class BatchControllerDocsSuite:
+    @staticmethod
+    def test_docs() -> None:
+        docs = BatchControllerDocs(Algorithm.CAESAR, CAESAR_DATA1, CAESAR_DATA2)
+
+        assert docs.summary == "Apply the Caesar algorithm to a batch of contents."
+        assert "Caesar" in docs.tags
+        assert docs.request_body is not None
+
+    @staticmethod
+    @pytest.mark.raises(exception=AlgorithmTypeError)
+    def test_bad_algorithm() -> None:
+        _ignored = BatchControllerDocs("Caesar", CAESAR_DATA1, CAESAR_DATA2)
+
+    @staticmethod
+    @pytest.mark.raises(exception=ExamplesTypeError)
+    def test_bad_examples() -> None:
+        _ignored = BatchControllerDocs(Algorithm.CAESAR, 1, CAESAR_DATA2)
+
+    @staticmethod
+    @pytest.mark.raises(exception=ExampleTypeError)
+    def test_bad_example() -> None:
+        _ignored = BatchControllerDocs(Algorithm.CAESAR, CAESAR_DATA1, [1])
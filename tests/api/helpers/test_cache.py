@@ -0,0 +1,151 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+from vigenere_api.api.helpers import (
+    Algorithm,
+    cache as cache_module,
+    get_request_digest,
+    Operation,
+    ResponseCache,
+)
+
+
+def make_key(content: str = "Test") -> bytes:
+    return get_request_digest(Algorithm.VIGENERE, Operation.CIPHER, "ct", content)
+
+
+class RequestDigestSuite:
+    @staticmethod
+    def test_same_request() -> None:
+        assert make_key() == make_key()
+
+    @staticmethod
+    def test_each_part_changes_digest() -> None:
+        digests = {
+            get_request_digest(Algorithm.CAESAR, Operation.CIPHER, 1, "Test"),
+            get_request_digest(Algorithm.CAESAR, Operation.CIPHER, "b", "Test"),
+            get_request_digest(Algorithm.CAESAR, Operation.DECIPHER, 1, "Test"),
+            get_request_digest(Algorithm.VIGENERE, Operation.CIPHER, "b", "Test"),
+            get_request_digest(Algorithm.CAESAR, Operation.CIPHER, 1, "Tests"),
+        }
+
+        assert len(digests) == 5
+
+    @staticmethod
+    def test_with_surrogate_content() -> None:
+        assert make_key("\ud800") != make_key("\ud801")
+
+
+class AcceptsSuite:
+    @staticmethod
+    def test_small_content() -> None:
+        assert ResponseCache(100, ttl=0, max_content_size=4).accepts("Test")
+
+    @staticmethod
+    def test_too_large_content() -> None:
+        assert not ResponseCache(100, ttl=0, max_content_size=3).accepts("Test")
+
+    @staticmethod
+    def test_disabled_cache() -> None:
+        assert not ResponseCache(0, ttl=0, max_content_size=10).accepts("Test")
+
+
+class ResponseCacheSuite:
+    @staticmethod
+    def test_hit_and_miss() -> None:
+        cache = ResponseCache(100, ttl=0, max_content_size=10)
+        cache_key = make_key()
+
+        assert cache.get(cache_key) is None
+        cache.put(cache_key, b"body")
+
+        assert cache.get(cache_key) == b"body"
+        statistics = cache.statistics
+        assert statistics.hits == statistics.misses == statistics.entries == 1
+        assert statistics.size == 4
+        assert statistics.max_size == 100
+
+    @staticmethod
+    def test_eviction_by_size() -> None:
+        cache = ResponseCache(10, ttl=0, max_content_size=10)
+        first_key = make_key("1")
+        second_key = make_key("2")
+        third_key = make_key("3")
+
+        cache.put(first_key, b"12345")
+        cache.put(second_key, b"12345")
+        assert cache.get(first_key) == b"12345"
+        cache.put(third_key, b"1")
+
+        assert cache.get(second_key) is None
+        assert cache.get(first_key) == b"12345"
+        assert cache.get(third_key) == b"1"
+        statistics = cache.statistics
+        assert statistics.evictions == 1
+        assert statistics.size == 6
+
+    @staticmethod
+    def test_too_large_body() -> None:
+        cache = ResponseCache(3, ttl=0, max_content_size=10)
+        cache_key = make_key()
+
+        cache.put(cache_key, b"body")
+
+        assert cache.get(cache_key) is None
+        assert cache.statistics.size == 0
+
+    @staticmethod
+    def test_replace_body() -> None:
+        cache = ResponseCache(100, ttl=0, max_content_size=10)
+        cache_key = make_key()
+
+        cache.put(cache_key, b"body")
+        cache.put(cache_key, b"new body")
+
+        assert cache.get(cache_key) == b"new body"
+        assert cache.statistics.size == 8
+
+    @staticmethod
+    def test_expiration(monkeypatch: pytest.MonkeyPatch) -> None:
+        now = 1000.0
+        monkeypatch.setattr(cache_module, "monotonic", lambda: now)
+        cache = ResponseCache(100, ttl=10, max_content_size=10)
+        cache_key = make_key()
+
+        cache.put(cache_key, b"body")
+        now += 9
+        assert cache.get(cache_key) == b"body"
+        now += 1
+
+        assert cache.get(cache_key) is None
+        statistics = cache.statistics
+        assert statistics.expirations == 1
+        assert statistics.entries == statistics.size == 0
+
+    @staticmethod
+    def test_clear() -> None:
+        cache = ResponseCache(100, ttl=0, max_content_size=10)
+        cache_key = make_key()
+        cache.put(cache_key, b"body")
+        _ignored_body = cache.get(cache_key)
+
+        cache.clear()
+
+        assert cache.get(cache_key) is None
+        statistics = cache.statistics
+        assert statistics.hits == statistics.entries == statistics.size == 0
@@ -0,0 +1,283 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import gzip
+from collections.abc import AsyncIterator
+
+import pytest
+from blacksheep import Content, Request, Response, StreamedContent
+
+from vigenere_api.api.helpers import (
+    compress,
+    CompressionMiddleware,
+    Encoding,
+    JobExecutor,
+    select_encoding,
+)
+from vigenere_api.api.helpers.compression import DECOMPRESSION_CHUNK_SIZE, HAS_ZSTANDARD
+from vigenere_api.api.helpers.errors import (
+    CorruptedRequestBodyError,
+    TooLargeRequestBodyError,
+    UnsupportedContentEncodingError,
+)
+
+
+BODY = b"Hello World! " * 200
+
+
+def gzip_request(body: bytes) -> Request:
+    request = Request("POST", b"/", [(b"Content-Encoding", b"gzip")])
+    request.with_content(Content(b"text/plain", body))
+    return request
+
+
+def streamed_gzip_request(body: bytes, chunk_size: int) -> tuple[Request, list[int]]:
+    compressed_body = gzip.compress(body)
+    received: list[int] = []
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(compressed_body), chunk_size):
+            received.append(start)
+            yield compressed_body[start : start + chunk_size]
+
+    request = Request("POST", b"/", [(b"Content-Encoding", b"gzip")])
+    request.with_content(StreamedContent(b"text/plain", chunks))
+    return request, received
+
+
+async def read_body(request: Request) -> Response:
+    return Response(200, None, Content(b"text/plain", await request.read()))
+
+
+class SelectEncodingSuite:
+    @staticmethod
+    def test_gzip() -> None:
+        assert select_encoding(b"gzip, deflate") == Encoding.GZIP
+
+    @staticmethod
+    def test_no_encoding() -> None:
+        assert select_encoding(b"") is None
+        assert select_encoding(b"deflate, identity") is None
+
+    @staticmethod
+    def test_refused_encoding() -> None:
+        assert select_encoding(b"gzip;q=0, *;q=0") is None
+
+    @staticmethod
+    def test_bad_quality() -> None:
+        assert select_encoding(b"gzip;q=bad") is None
+
+    @staticmethod
+    def test_any_encoding() -> None:
+        assert select_encoding(b"*") is not None
+
+    @staticmethod
+    @pytest.mark.skipif(not HAS_ZSTANDARD, reason="zstandard is not installed")
+    def test_best_quality() -> None:
+        assert select_encoding(b"zstd;q=0.5, GZIP") == Encoding.GZIP
+        assert select_encoding(b"gzip;q=0.5, zstd") == Encoding.ZSTD
+
+    @staticmethod
+    @pytest.mark.skipif(not HAS_ZSTANDARD, reason="zstandard is not installed")
+    def test_preferred_at_same_quality() -> None:
+        assert select_encoding(b"gzip, zstd") == Encoding.ZSTD
+
+
+class CompressSuite:
+    @staticmethod
+    @pytest.mark.parametrize("level", [1, 6, 100])
+    def test_gzip(level: int) -> None:
+        compressed_body = compress(BODY, Encoding.GZIP, level)
+
+        assert gzip.decompress(compressed_body) == BODY
+        assert len(compressed_body) < len(BODY)
+
+    @staticmethod
+    @pytest.mark.skipif(not HAS_ZSTANDARD, reason="zstandard is not installed")
+    def test_zstd() -> None:
+        import zstandard
+
+        compressed_body = compress(BODY, Encoding.ZSTD, 100)
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+        assert decompressor.decompress(compressed_body) == BODY
+
+
+class DecompressionSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_gzip_body() -> None:
+        middleware = CompressionMiddleware(1024, 6, 0)
+        request = gzip_request(gzip.compress(BODY))
+
+        response = await middleware(request, read_body)
+
+        assert await response.read() == BODY
+        assert request.get_first_header(b"Content-Encoding") is None
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_streamed_gzip_body() -> None:
+        middleware = CompressionMiddleware(1024, 6, 0)
+        body = bytes(range(256)) * (DECOMPRESSION_CHUNK_SIZE // 64)
+        request, received = streamed_gzip_request(body, 1000)
+
+        async def check_not_read(request: Request) -> Response:
+            assert not received
+            return await read_body(request)
+
+        response = await middleware(request, check_not_read)
+
+        assert await response.read() == body
+        assert len(received) > 1
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    @pytest.mark.raises(exception=TooLargeRequestBodyError)
+    async def test_streamed_too_large_body() -> None:
+        middleware = CompressionMiddleware(1024, 6, DECOMPRESSION_CHUNK_SIZE)
+        request, _received = streamed_gzip_request(
+            bytes(4 * DECOMPRESSION_CHUNK_SIZE),
+            100,
+        )
+
+        await middleware(request, read_body)
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_multi_member_gzip_body() -> None:
+        middleware = CompressionMiddleware(1024, 6, 0)
+        request = gzip_request(gzip.compress(b"Hello ") + gzip.compress(b"World"))
+
+        response = await middleware(request, read_body)
+
+        assert await response.read() == b"Hello World"
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_member_at_chunk_end() -> None:
+        middleware = CompressionMiddleware(1024, 6, 0)
+        first_member = gzip.compress(b"Hello ")
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield first_member
+            yield gzip.compress(b"World")
+
+        request = Request("POST", b"/", [(b"Content-Encoding", b"gzip")])
+        request.with_content(StreamedContent(b"text/plain", chunks))
+
+        response = await middleware(request, read_body)
+
+        assert await response.read() == b"Hello World"
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_identity_body() -> None:
+        middleware = CompressionMiddleware(1024, 6, 0)
+        request = Request("POST", b"/", [(b"Content-Encoding", b"identity")])
+        request.with_content(Content(b"text/plain", b"body"))
+
+        response = await middleware(request, read_body)
+
+        assert await response.read() == b"body"
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    @pytest.mark.raises(exception=TooLargeRequestBodyError)
+    async def test_too_large_body() -> None:
+        middleware = CompressionMiddleware(1024, 6, len(BODY) - 1)
+
+        await middleware(gzip_request(gzip.compress(BODY)), read_body)
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    @pytest.mark.raises(exception=CorruptedRequestBodyError)
+    async def test_corrupted_body() -> None:
+        middleware = CompressionMiddleware(1024, 6, 0)
+
+        await middleware(gzip_request(b"not gzip"), read_body)
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    @pytest.mark.raises(exception=CorruptedRequestBodyError)
+    async def test_truncated_body() -> None:
+        middleware = CompressionMiddleware(1024, 6, 0)
+
+        await middleware(gzip_request(gzip.compress(BODY)[:-8]), read_body)
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    @pytest.mark.raises(exception=UnsupportedContentEncodingError)
+    async def test_unsupported_encoding() -> None:
+        middleware = CompressionMiddleware(1024, 6, 0)
+        request = Request("POST", b"/", [(b"Content-Encoding", b"compress")])
+
+        await middleware(request, read_body)
+
+
+class CompressionSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_streamed_response() -> None:
+        middleware = CompressionMiddleware(1024, 6, 0)
+        request = Request("GET", b"/", [(b"Accept-Encoding", b"gzip")])
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield BODY
+            yield BODY
+
+        async def handler(_request: Request) -> Response:
+            return Response(200, None, StreamedContent(b"text/plain", chunks))
+
+        response = await middleware(request, handler)
+
+        assert response.get_first_header(b"Content-Encoding") == b"gzip"
+        assert gzip.decompress(await response.read()) == BODY + BODY
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_large_response_in_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+        executor = JobExecutor(1, thread_workers=1, process_workers=1)
+        monkeypatch.setattr(
+            "vigenere_api.api.helpers.compression.job_executor",
+            executor,
+        )
+        middleware = CompressionMiddleware(1024, 6, 0)
+        request = Request("GET", b"/", [(b"Accept-Encoding", b"gzip")])
+
+        async def handler(_request: Request) -> Response:
+            return Response(200, None, Content(b"text/plain", BODY))
+
+        response = await middleware(request, handler)
+
+        assert gzip.decompress(await response.read()) == BODY
+        assert executor.statistics.thread.completed == 1
+        assert executor.statistics.process.submitted == 0
+        executor.shutdown()
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_disabled_compression() -> None:
+        middleware = CompressionMiddleware(1024, 0, 0)
+        request = Request("GET", b"/", [(b"Accept-Encoding", b"gzip")])
+
+        async def handler(_request: Request) -> Response:
+            return Response(200, None, Content(b"text/plain", BODY))
+
+        response = await middleware(request, handler)
+
+        assert await response.read() == BODY
+        assert response.get_first_header(b"Vary") == b"Accept-Encoding"
@@ -0,0 +1,47 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+from vigenere_api.api.helpers import etag_matches, make_etag
+
+
+ETAG = make_etag(bytes(range(16)))
+
+
+def test_make_etag() -> None:
+    assert ETAG == b'"000102030405060708090a0b0c0d0e0f"'
+
+
+class EtagMatchesSuite:
+    @staticmethod
+    def test_same_etag() -> None:
+        assert etag_matches(ETAG, ETAG)
+
+    @staticmethod
+    def test_other_etag() -> None:
+        assert not etag_matches(b'"other"', ETAG)
+
+    @staticmethod
+    def test_any_etag() -> None:
+        assert etag_matches(b" * ", ETAG)
+
+    @staticmethod
+    def test_etag_in_list() -> None:
+        assert etag_matches(b'"other", ' + ETAG + b' , "last"', ETAG)
+
+    @staticmethod
+    def test_weak_etag() -> None:
+        assert etag_matches(b"W/" + ETAG, ETAG)
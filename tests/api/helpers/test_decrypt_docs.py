@@ -0,0 +1,66 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+from http import HTTPStatus
+
+import pytest
+
+from vigenere_api.api.helpers import Algorithm, DecryptControllerDocs
+from vigenere_api.api.helpers.errors import AlgorithmTypeError
+from vigenere_api.api.v2.controllers.caesar.docs import CAESAR_DECRYPT_DATA
+from vigenere_api.api.v2.controllers.vigenere.docs import VIGENERE_DECRYPT_DATA
+from vigenere_api.models import CaesarDecryptResult, VigenereDecryptResult
+
+
+class DecryptControllerDocsSuite:
+    @staticmethod
+    def test_caesar() -> None:
+        docs = DecryptControllerDocs(Algorithm.CAESAR, CAESAR_DECRYPT_DATA)
+
+        assert docs.summary == "Decrypt a content ciphered with the Caesar algorithm."
+        assert "Caesar" in docs.tags
+        assert docs.request_body is not None
+        assert docs.request_body.examples == {
+            "example 0": CAESAR_DECRYPT_DATA[0],
+            "example 1": CAESAR_DECRYPT_DATA[1],
+        }
+
+        ok_response = docs.responses[HTTPStatus.OK]
+        content = ok_response.content[0]
+        assert content.type is CaesarDecryptResult
+        assert [example.value.candidates[0].key for example in content.examples] == [
+            3,
+            3,
+        ]
+        assert docs.responses[HTTPStatus.BAD_REQUEST] == "Bad request."
+
+    @staticmethod
+    def test_vigenere() -> None:
+        docs = DecryptControllerDocs(Algorithm.VIGENERE, VIGENERE_DECRYPT_DATA)
+
+        assert docs.summary == "Decrypt a content ciphered with the Vigenere algorithm."
+        assert "index of coincidence" in docs.description
+        assert "'fr'" in docs.description
+
+        content = docs.responses[HTTPStatus.OK].content[0]
+        assert content.type is VigenereDecryptResult
+        assert content.examples[0].value.key_lengths[0].length == 5
+
+    @staticmethod
+    @pytest.mark.raises(exception=AlgorithmTypeError)
+    def test_bad_algorithm() -> None:
+        _ignored = DecryptControllerDocs("Caesar", CAESAR_DECRYPT_DATA)
@@ -0,0 +1,198 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import asyncio
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import pytest
+
+from vigenere_api.api.helpers import JobExecutor
+from vigenere_api.models import VigenereData
+
+
+PARALLEL_JOB = """
+import asyncio
+
+from vigenere_api.api.helpers import job_executor
+from vigenere_api.api.helpers.executor import PROCESS_THRESHOLD
+from vigenere_api.models.helpers import (
+    apply_shifts,
+    engine_timer,
+    shutdown_process_pool,
+)
+from vigenere_api.models.helpers.vigenere_engine import PARALLEL_THRESHOLD
+
+text = "Hello World! " * (max(PROCESS_THRESHOLD, PARALLEL_THRESHOLD) // 13 + 1)
+moved_text = asyncio.run(
+    job_executor.run(apply_shifts, text, (1, 2), size=len(text), parallel=PARALLEL),
+)
+print(moved_text == apply_shifts(text, (1, 2), nb_workers=1))
+print("parallel" in engine_timer.statistics)
+
+job_executor.shutdown()
+shutdown_process_pool()
+"""
+
+
+def get_pid() -> int:
+    return os.getpid()
+
+
+class JobExecutorSuite:
+    @staticmethod
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_parallel_job_exits(parallel: bool) -> None:
+        completed = subprocess.run(
+            [sys.executable, "-c", f"PARALLEL = {parallel}\n{PARALLEL_JOB}"],
+            env={
+                **os.environ,
+                "PYTHONPATH": os.pathsep.join(sys.path),
+                "VIGENERE_API_PROCESS_WORKERS": "2",
+                "VIGENERE_API_PARALLEL_WORKERS": "2",
+            },
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=False,
+        )
+
+        assert completed.returncode == 0, completed.stderr
+        # Only a job run in a thread uses the parallel engine of the main process.
+        assert completed.stdout == f"True\n{parallel}\n"
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_parallel_job_in_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "vigenere_api.api.helpers.executor.uses_parallel_engine",
+            lambda length: length >= 200,
+        )
+        executor = JobExecutor(100, thread_workers=2, process_workers=1)
+
+        assert await executor.run(get_pid, size=200, parallel=True) == os.getpid()
+        assert await executor.run(get_pid, size=199, parallel=True) != os.getpid()
+        assert await executor.run(get_pid, size=200) != os.getpid()
+        assert executor.statistics.thread.completed == 1
+        executor.shutdown()
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_small_job_in_thread() -> None:
+        executor = JobExecutor(100, thread_workers=2, process_workers=1)
+        data = VigenereData(content="Test", key="ct")
+
+        result = await executor.run(data.cipher, size=len(data.content))
+
+        assert result.content == "Vxum"
+        statistics = executor.statistics
+        assert statistics.thread.submitted == statistics.thread.completed == 1
+        assert statistics.thread.queue_depth == 0
+        assert statistics.process.submitted == 0
+        executor.shutdown()
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_large_job_in_process() -> None:
+        executor = JobExecutor(100, thread_workers=2, process_workers=1)
+
+        assert await executor.run(get_pid, size=100) != os.getpid()
+        assert await executor.run(get_pid, size=99) == os.getpid()
+        assert executor.statistics.process.completed == 1
+        executor.shutdown()
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_process_pool_is_not_forked(monkeypatch: pytest.MonkeyPatch) -> None:
+        start_methods = []
+
+        class Executor(ProcessPoolExecutor):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                start_methods.append(kwargs["mp_context"].get_start_method())
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(
+            "vigenere_api.api.helpers.executor.ProcessPoolExecutor",
+            Executor,
+        )
+        executor = JobExecutor(100, thread_workers=1, process_workers=1)
+
+        assert await executor.run(get_pid, size=100) != os.getpid()
+        assert start_methods == ["forkserver"]
+        executor.shutdown()
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_large_job_in_thread() -> None:
+        executor = JobExecutor(100, thread_workers=2, process_workers=1)
+
+        assert await executor.run_in_thread(get_pid) == os.getpid()
+        statistics = executor.statistics
+        assert statistics.thread.completed == 1
+        assert statistics.process.submitted == 0
+        executor.shutdown()
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_without_process_pool() -> None:
+        executor = JobExecutor(100, thread_workers=1, process_workers=0)
+
+        assert await executor.run(get_pid, size=1000) == os.getpid()
+        assert executor.statistics.thread.completed == 1
+        assert executor.statistics.process.completed == 0
+        executor.shutdown()
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_without_thread_pool() -> None:
+        executor = JobExecutor(100, thread_workers=0, process_workers=0)
+
+        assert await executor.run(sum, [1, 2], size=2) == 3
+        assert executor.statistics.thread.completed == 1
+        executor.shutdown()
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_wait_time() -> None:
+        executor = JobExecutor(100, thread_workers=1, process_workers=0)
+
+        await asyncio.gather(
+            executor.run(asyncio.run, asyncio.sleep(0.05), size=0),
+            executor.run(sum, [1], size=0),
+        )
+
+        statistics = executor.statistics.thread
+        assert statistics.completed == 2
+        assert statistics.max_wait_time > 0.0
+        assert 0.0 < statistics.mean_wait_time <= statistics.max_wait_time
+        assert statistics.total_run_time >= 0.05
+        executor.shutdown()
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_failed_job() -> None:
+        executor = JobExecutor(100, thread_workers=1, process_workers=0)
+
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(divmod, 1, 0, size=0)
+
+        statistics = executor.statistics.thread
+        assert statistics.queue_depth == statistics.completed == 0
+        assert statistics.mean_wait_time == 0.0
+        executor.shutdown()
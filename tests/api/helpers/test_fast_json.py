@@ -0,0 +1,79 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from collections.abc import Generator
+from json import JSONDecodeError
+
+import pytest
+from blacksheep import Content
+from blacksheep.plugins import json as json_plugin
+from blacksheep.testing import TestClient
+
+from vigenere_api.api.helpers import use_default_json, use_fast_json
+from vigenere_api.api.helpers.fast_json import HAS_ORJSON
+from vigenere_api.models import VigenereData
+
+
+pytestmark = pytest.mark.skipif(not HAS_ORJSON, reason="orjson is not installed.")
+
+
+@pytest.fixture()
+def fast_json() -> Generator[None, None, None]:
+    assert use_fast_json()
+    yield
+    use_default_json()
+
+
+@pytest.mark.usefixtures("fast_json")
+class FastJSONSuite:
+    @staticmethod
+    def test_dumps_pydantic_model() -> None:
+        data = VigenereData(content="Çà", key="ab")
+
+        assert json_plugin.dumps(data) == '{"content":"Çà","key":"ab"}'
+
+    @staticmethod
+    def test_dumps_fallback() -> None:
+        assert json_plugin.dumps({"content": "\udc80", "bytes": b"ab"}) == (
+            '{"content":"\udc80","bytes":"YWI="}'
+        )
+
+    @staticmethod
+    def test_loads() -> None:
+        assert json_plugin.loads('{"content": "Test", "key": 1}') == {
+            "content": "Test",
+            "key": 1,
+        }
+
+    @staticmethod
+    def test_loads_fallback() -> None:
+        assert json_plugin.loads('"\\udc80"') == "\udc80"
+
+    @staticmethod
+    def test_loads_invalid() -> None:
+        with pytest.raises(JSONDecodeError):
+            json_plugin.loads("{")
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_cipher(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher",
+            content=Content(b"application/json", b'{"content":"Test","key":"ct"}'),
+        )
+
+        assert response is not None
+        assert await response.json() == {"content": "Vxum", "key": "ct"}
@@ -0,0 +1,269 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+import pytest
+from blacksheep import Request, Response
+from blacksheep.exceptions import BadRequest
+from blacksheep.server.routing import Router
+
+from vigenere_api.api.helpers import (
+    Histogram,
+    MetricsMiddleware,
+    MetricsRegistry,
+    render_metrics,
+)
+from vigenere_api.api.helpers.metrics import (
+    get_error_name,
+    get_registered_labels,
+    get_route_labels,
+    OTHER_ROUTE_LABELS,
+)
+from vigenere_api.models.helpers import engine_timer
+
+
+LABELS = ("v2", "vigenere", "cipher")
+
+
+async def ok_handler(_request: Request) -> Response:
+    return Response(200, None, None)
+
+
+def make_router() -> Router:
+    router = Router()
+    router.add_post("/api/v2/vigenere/cipher", ok_handler)
+    router.add_post("/api/v2/vigenere/cipher/stream", ok_handler)
+    router.add_get("/api/v2/openapi.json", ok_handler)
+    router.add_get("/api/v2/{name}", ok_handler)
+    return router
+
+
+class HistogramSuite:
+    @staticmethod
+    def test_empty() -> None:
+        histogram = Histogram((1, 10))
+
+        assert histogram.buckets == (1, 10)
+        assert histogram.cumulative_counts == (0, 0, 0)
+        assert histogram.total == 0
+
+    @staticmethod
+    def test_upper_bound_is_inclusive() -> None:
+        histogram = Histogram((1, 10))
+
+        histogram.observe(1)
+        histogram.observe(10)
+        histogram.observe(11)
+
+        assert histogram.cumulative_counts == (1, 2, 3)
+        assert histogram.total == 22
+
+
+class RouteLabelsSuite:
+    @staticmethod
+    def test_route() -> None:
+        assert get_route_labels("/api/v2/vigenere/cipher") == LABELS
+
+    @staticmethod
+    def test_stream_route() -> None:
+        assert get_route_labels("/api/v2/vigenere/cipher/stream") == (
+            "v2",
+            "vigenere",
+            "cipher/stream",
+        )
+
+    @staticmethod
+    def test_docs_route() -> None:
+        assert get_route_labels("/api/v2/openapi.json") is None
+
+    @staticmethod
+    def test_other_route() -> None:
+        assert get_route_labels("/static/v2/vigenere/cipher") is None
+
+
+class RegisteredLabelsSuite:
+    @staticmethod
+    def test_routes() -> None:
+        assert get_registered_labels(make_router()) == {
+            "/api/v2/vigenere/cipher": LABELS,
+            "/api/v2/vigenere/cipher/stream": ("v2", "vigenere", "cipher/stream"),
+            "/api/v2/openapi.json": None,
+        }
+
+
+class ErrorNameSuite:
+    @staticmethod
+    def test_status() -> None:
+        assert get_error_name(400) == "BadRequest"
+        assert get_error_name(415) == "UnsupportedMediaType"
+
+    @staticmethod
+    def test_unknown_status() -> None:
+        assert get_error_name(499) == "499"
+
+
+class RegistrySuite:
+    @staticmethod
+    def test_observe() -> None:
+        registry = MetricsRegistry()
+
+        registry.observe(LABELS, 0.002, 30, None, None)
+        registry.observe(LABELS, 0.2, None, 10, "BadRequest")
+
+        route_metrics = registry.get(LABELS)
+        assert route_metrics is not None
+        assert route_metrics.requests == 2
+        assert route_metrics.errors == {"BadRequest": 1}
+        assert route_metrics.latency.cumulative_counts[-1] == 2
+        assert route_metrics.request_size.cumulative_counts[-1] == 1
+        assert route_metrics.response_size.cumulative_counts[-1] == 1
+
+    @staticmethod
+    def test_clear() -> None:
+        registry = MetricsRegistry()
+        registry.observe(LABELS, 0.002, None, None, None)
+
+        registry.clear()
+
+        assert registry.get(LABELS) is None
+
+    @staticmethod
+    def test_render() -> None:
+        registry = MetricsRegistry()
+        registry.observe(LABELS, 0.002, None, None, "BadRequest")
+
+        text = render_metrics(registry).decode()
+
+        labels = 'version="v2",algorithm="vigenere",operation="cipher"'
+        assert "# TYPE vigenere_api_requests_total counter" in text
+        assert f"vigenere_api_requests_total{{{labels}}} 1\n" in text
+        assert f'vigenere_api_errors_total{{{labels},error="BadRequest"}} 1\n' in text
+        assert (
+            f'vigenere_api_request_duration_seconds_bucket{{{labels},le="0.001"}} 0\n'
+            in text
+        )
+        assert (
+            f'vigenere_api_request_duration_seconds_bucket{{{labels},le="0.0025"}} 1\n'
+            in text
+        )
+        assert f"vigenere_api_request_duration_seconds_count{{{labels}}} 1\n" in text
+        assert 'vigenere_api_jobs_submitted_total{pool="process"}' in text
+        assert "# TYPE vigenere_api_engine_seconds_total counter" in text
+        assert text.endswith("\n")
+
+
+def make_request(path: str) -> Request:
+    return Request("POST", path.encode(), [(b"Content-Length", b"12")])
+
+
+class MiddlewareSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_response() -> None:
+        registry = MetricsRegistry()
+        middleware = MetricsMiddleware(registry, make_router())
+
+        async def handler(_request: Request) -> Response:
+            return Response(415, None, None)
+
+        response = await middleware(make_request("/api/v2/vigenere/cipher"), handler)
+
+        assert response.status == 415
+        route_metrics = registry.get(LABELS)
+        assert route_metrics is not None
+        assert route_metrics.errors == {"UnsupportedMediaType": 1}
+        assert route_metrics.request_size.total == 12
+        assert route_metrics.response_size.cumulative_counts[-1] == 0
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    @pytest.mark.raises(exception=BadRequest)
+    async def test_exception() -> None:
+        registry = MetricsRegistry()
+        middleware = MetricsMiddleware(registry, make_router())
+
+        async def handler(_request: Request) -> Response:
+            raise BadRequest
+
+        try:
+            await middleware(make_request("/api/v2/vigenere/cipher"), handler)
+        finally:
+            route_metrics = registry.get(LABELS)
+            assert route_metrics is not None
+            assert route_metrics.errors == {"BadRequest": 1}
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_not_measured_route() -> None:
+        registry = MetricsRegistry()
+        middleware = MetricsMiddleware(registry, make_router())
+
+        await middleware(make_request("/api/v2/openapi.json"), ok_handler)
+
+        assert registry.get(LABELS) is None
+        assert registry.get(OTHER_ROUTE_LABELS) is None
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_trailing_slash() -> None:
+        registry = MetricsRegistry()
+        middleware = MetricsMiddleware(registry, make_router())
+
+        await middleware(make_request("/api/v2/vigenere/cipher/"), ok_handler)
+
+        route_metrics = registry.get(LABELS)
+        assert route_metrics is not None
+        assert route_metrics.requests == 1
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_unknown_paths_share_labels() -> None:
+        registry = MetricsRegistry()
+        middleware = MetricsMiddleware(registry, make_router())
+
+        async def handler(_request: Request) -> Response:
+            return Response(404, None, None)
+
+        for index in range(100):
+            await middleware(make_request(f"/api/v1/x/y/{index}"), handler)
+        await middleware(make_request("/api/v2/parameter"), handler)
+
+        route_metrics = registry.get(OTHER_ROUTE_LABELS)
+        assert route_metrics is not None
+        assert route_metrics.requests == 101
+        assert route_metrics.errors == {"NotFound": 101}
+        assert registry.get(("v1", "x", "y/0")) is None
+        lines: list[str] = []
+        registry.render(lines)
+        assert (
+            sum(line.startswith("vigenere_api_requests_total") for line in lines) == 1
+        )
+
+
+class EngineMetricsSuite:
+    @staticmethod
+    def test_render() -> None:
+        engine_timer.observe("test_engine", 2048, 0.5)
+        try:
+            text = render_metrics(MetricsRegistry()).decode()
+        finally:
+            engine_timer.clear()
+
+        assert 'vigenere_api_engine_calls_total{engine="test_engine"} 1\n' in text
+        assert (
+            'vigenere_api_engine_characters_total{engine="test_engine"} 2048\n' in text
+        )
+        assert 'vigenere_api_engine_seconds_total{engine="test_engine"} 0.5\n' in text
@@ -87,3 +87,9 @@ def test_filter_route_not_excluded() -> None:
     version = Version(major=1, minor=1, patch=10)
     route_filter = get_route_filter(["/api"], version)
     assert route_filter(f"/api/v{version.major}/test", Route("http", {}))
+
+
+def test_filter_metrics_route() -> None:
+    version = Version(major=2, minor=0, patch=0)
+    route_filter = get_route_filter([], version)
+    assert not route_filter("/metrics", Route("/metrics", {}))
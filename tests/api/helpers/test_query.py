@@ -0,0 +1,90 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+import pytest
+from blacksheep.exceptions import BadRequest
+
+from vigenere_api.api.helpers import (
+    Algorithm,
+    get_query_data,
+    Operation,
+    QueryControllerDocs,
+)
+from vigenere_api.api.helpers.errors import TooLongQueryContentError
+from vigenere_api.api.helpers.query import MAX_KEY_DIGITS, MAX_QUERY_CONTENT
+from vigenere_api.api.v1.controllers.caesar.docs import CAESAR_DATA1, CAESAR_DATA2
+from vigenere_api.models import CaesarData, VigenereData
+
+
+class GetQueryDataSuite:
+    @staticmethod
+    @pytest.mark.parametrize("key", ["3", "+3", "-3"])
+    def test_caesar_int_key(key: str) -> None:
+        data = get_query_data(CaesarData, "Test", key)
+
+        assert data == CaesarData(content="Test", key=int(key))
+
+    @staticmethod
+    def test_caesar_str_key() -> None:
+        data = get_query_data(CaesarData, "Test", "d")
+
+        assert data == CaesarData(content="Test", key="d")
+
+    @staticmethod
+    def test_vigenere_key() -> None:
+        data = get_query_data(VigenereData, "Test", "ct")
+
+        assert data == VigenereData(content="Test", key="ct")
+
+    @staticmethod
+    @pytest.mark.raises(exception=BadRequest)
+    def test_bad_key() -> None:
+        _ignored_data = get_query_data(VigenereData, "Test", "c")
+
+    @staticmethod
+    def test_caesar_longest_int_key() -> None:
+        key = "1" * MAX_KEY_DIGITS
+        data = get_query_data(CaesarData, "Test", key)
+
+        assert data == CaesarData(content="Test", key=int(key))
+
+    @staticmethod
+    @pytest.mark.raises(exception=BadRequest)
+    def test_caesar_too_long_int_key() -> None:
+        _ignored_data = get_query_data(CaesarData, "Test", "1" * 5000)
+
+    @staticmethod
+    @pytest.mark.raises(exception=TooLongQueryContentError)
+    def test_too_long_content() -> None:
+        _ignored_data = get_query_data(CaesarData, "T" * (MAX_QUERY_CONTENT + 1), "d")
+
+
+def test_query_docs() -> None:
+    docs = QueryControllerDocs(
+        Operation.CIPHER,
+        Algorithm.CAESAR,
+        CAESAR_DATA1,
+        CAESAR_DATA2,
+    )
+
+    assert docs.request_body is None
+    assert docs.parameters is not None
+    assert list(docs.parameters) == ["content", "key", "If-None-Match"]
+    assert docs.parameters["content"].example == CAESAR_DATA2[0].content
+    assert docs.parameters["key"].example == str(CAESAR_DATA2[0].key)
+    assert docs.responses is not None
+    assert set(docs.responses) == {200, 304, 400}
@@ -14,9 +14,13 @@
 #  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+import gzip
+
 import pytest
 from blacksheep.testing import TestClient
 
+from vigenere_api.api.helpers.metrics import METRICS_CONTENT_TYPE
+
 
 @pytest.mark.asyncio()
 async def test_get_index(test_client: TestClient) -> None:
@@ -44,3 +48,29 @@ async def test_bad_path(test_client: TestClient) -> None:
     assert response.reason.upper() == "OK"
 
     assert await response.text() == "OOPS! Nothing was found here!"
+
+
+@pytest.mark.asyncio()
+async def test_get_metrics(test_client: TestClient) -> None:
+    await test_client.get(
+        "/api/v2/caesar/cipher",
+        query={"content": "Test", "key": "3"},
+    )
+
+    response = await test_client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+
+    assert response is not None
+    assert response.status == 200
+    assert response.content is not None
+    assert response.content.type == METRICS_CONTENT_TYPE
+
+    assert response.get_first_header(b"Content-Encoding") == b"gzip"
+
+    body = await response.read()
+    assert body is not None
+
+    text = gzip.decompress(body).decode()
+    assert '{version="v2",algorithm="caesar",operation="cipher"}' in text
+    assert "vigenere_api_jobs_run_seconds_total" in text
+    assert "vigenere_api_response_cache_hits_total" in text
+    assert "vigenere_api_key_cache_hits_total" in text
@@ -19,6 +19,9 @@ from http import HTTPStatus
 import pytest
 from blacksheep.server.openapi.common import (
     ContentInfo,
+    HeaderInfo,
+    ParameterInfo,
+    ParameterSource,
     RequestBodyInfo,
     ResponseExample,
     ResponseInfo,
@@ -30,10 +33,32 @@ from vigenere_api.api.v2.controllers.vigenere.docs import (
     VIGENERE_DATA1,
     VIGENERE_DATA2,
     VigenereControllerDocs,
+    VigenereStreamControllerDocs,
 )
 from vigenere_api.models import VigenereData
 
 
+ETAG_HEADERS = {
+    "ETag": HeaderInfo(
+        type=str,
+        description="Strong ETag of the algorithm, the operation,"
+        + " the key and the content.",
+    ),
+    "Cache-Control": HeaderInfo(
+        type=str,
+        description="Lifetime of the response in the caches.",
+    ),
+}
+IF_NONE_MATCH_PARAMETERS = {
+    "If-None-Match": ParameterInfo(
+        description="ETags of the responses already known by the client.",
+        value_type=str,
+        source=ParameterSource.HEADER,
+        required=False,
+    ),
+}
+
+
 def test_operation_cipher() -> None:
     docs = VigenereControllerDocs(Operation.CIPHER)
 
@@ -55,6 +80,7 @@ def test_operation_cipher() -> None:
     assert docs.responses == {
         HTTPStatus.OK: ResponseInfo(
             description="Success cipher with Vigenere algorithm.",
+            headers=ETAG_HEADERS,
             content=[
                 ContentInfo(
                     type=VigenereData,
@@ -68,7 +94,9 @@ def test_operation_cipher() -> None:
             ],
         ),
         HTTPStatus.BAD_REQUEST: "Bad request.",
+        HTTPStatus.NOT_MODIFIED: "The client already has the response.",
     }
+    assert docs.parameters == IF_NONE_MATCH_PARAMETERS
 
 
 def test_operation_decipher() -> None:
@@ -92,6 +120,7 @@ def test_operation_decipher() -> None:
     assert docs.responses == {
         HTTPStatus.OK: ResponseInfo(
             description="Success decipher with Vigenere algorithm.",
+            headers=ETAG_HEADERS,
             content=[
                 ContentInfo(
                     type=VigenereData,
@@ -105,9 +134,38 @@ def test_operation_decipher() -> None:
             ],
         ),
         HTTPStatus.BAD_REQUEST: "Bad request.",
+        HTTPStatus.NOT_MODIFIED: "The client already has the response.",
     }
+    assert docs.parameters == IF_NONE_MATCH_PARAMETERS
 
 
 @pytest.mark.raises(exception=OperationTypeError)
 def test_bad_type_operation() -> None:
     VigenereControllerDocs("betet")
+
+
+def test_stream_operation_cipher() -> None:
+    docs = VigenereStreamControllerDocs(Operation.CIPHER)
+
+    assert docs.summary == "Apply the Vigenere algorithm to cipher a streamed text."
+    assert "Vigenere" in docs.tags
+    assert docs.parameters["key"].example == VIGENERE_DATA2[0].key
+    assert docs.request_body == RequestBodyInfo(
+        description="The text in UTF-8.",
+        examples={"example 0": VIGENERE_DATA2[0].content},
+    )
+
+
+def test_stream_operation_decipher() -> None:
+    docs = VigenereStreamControllerDocs(Operation.DECIPHER)
+
+    assert docs.summary == "Apply the Vigenere algorithm to decipher a streamed text."
+    assert docs.request_body == RequestBodyInfo(
+        description="The text in UTF-8.",
+        examples={"example 0": VIGENERE_DATA1[0].content},
+    )
+
+
+@pytest.mark.raises(exception=OperationTypeError)
+def test_stream_bad_operation() -> None:
+    _ignored = VigenereStreamControllerDocs("cipher")
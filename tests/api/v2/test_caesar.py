@@ -721,3 +721,198 @@ class DecipherSuite:
                     "type": "value_error.badkey",
                 },
             ]
+
+
+class BatchSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_cipher_and_decipher(test_client: TestClient) -> None:
+        items = [
+            {"operation": "cipher", "content": "Test", "key": 2},
+            {"operation": "decipher", "content": "Vguv", "key": "c"},
+        ]
+
+        response = await test_client.post(
+            "/api/v2/caesar/batch",
+            content=Content(b"application/json", dumps(items).encode("utf8")),
+        )
+
+        assert response is not None
+        assert response.status == 200
+
+        data = await response.json()
+        assert data == [
+            {"content": "Vguv", "key": 2},
+            {"content": "Test", "key": "c"},
+        ]
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_errors_by_item(test_client: TestClient) -> None:
+        items = [
+            {"operation": "cipher", "content": "Test", "key": "ab"},
+            {"operation": "cipher", "content": "Test", "key": 2},
+        ]
+
+        response = await test_client.post(
+            "/api/v2/caesar/batch",
+            content=Content(b"application/json", dumps(items).encode("utf8")),
+        )
+
+        assert response is not None
+        assert response.status == 200
+
+        data = await response.json()
+        assert data == [
+            {
+                "errors": [
+                    {
+                        "loc": ["key"],
+                        "msg": "The key is too long. Please give a one character"
+                        " string or an integer.",
+                        "type": "value_error.toolongkey",
+                    },
+                ],
+            },
+            {"content": "Vguv", "key": 2},
+        ]
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_bad_item_type(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/caesar/batch",
+            content=Content(b"application/json", b"[1]"),
+        )
+
+        assert response is not None
+        assert response.status == 400
+
+
+class ConditionalSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_not_modified(test_client: TestClient) -> None:
+        caesar_input = CaesarData(content="Test", key=1)
+        first_response = await test_client.post(
+            "/api/v2/caesar/cipher",
+            content=json_content(caesar_input),
+        )
+        etag = first_response.get_first_header(b"ETag")
+        assert etag is not None
+
+        response = await test_client.post(
+            "/api/v2/caesar/cipher",
+            headers=[(b"If-None-Match", etag)],
+            content=json_content(caesar_input),
+        )
+
+        assert first_response.status == 200
+        assert response.status == 304
+        assert response.get_first_header(b"ETag") == etag
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_no_etag_in_v1(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v1/caesar/cipher",
+            content=json_content(CaesarData(content="Test", key=1)),
+        )
+
+        assert response.status == 200
+        assert response.get_first_header(b"ETag") is None
+
+
+class QuerySuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_cipher_with_int_key(test_client: TestClient) -> None:
+        response = await test_client.get(
+            "/api/v2/caesar/cipher",
+            query={"content": "Test", "key": "1"},
+        )
+
+        assert response.status == 200
+        assert await response.json() == {"content": "Uftu", "key": 1}
+        assert response.get_first_header(b"ETag") is not None
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_decipher_with_str_key(test_client: TestClient) -> None:
+        response = await test_client.get(
+            "/api/v2/caesar/decipher",
+            query={"content": "Uftu", "key": "b"},
+        )
+
+        assert response.status == 200
+        assert await response.json() == {"content": "Test", "key": "b"}
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_bad_key(test_client: TestClient) -> None:
+        response = await test_client.get(
+            "/api/v2/caesar/cipher",
+            query={"content": "Test", "key": "$"},
+        )
+
+        assert response.status == 400
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_too_long_int_key(test_client: TestClient) -> None:
+        response = await test_client.get(
+            "/api/v2/caesar/cipher",
+            query={"content": "Test", "key": "1" * 5000},
+        )
+
+        assert response.status == 400
+
+
+class DecryptSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_decrypt(test_client: TestClient) -> None:
+        content = CaesarData(content="Attack at dawn, the enemy is not ready.", key=7)
+
+        response = await test_client.post(
+            "/api/v2/caesar/decrypt",
+            content=Content(
+                b"application/json",
+                dumps({"content": content.cipher().content}).encode("utf8"),
+            ),
+        )
+
+        assert response is not None
+        assert response.status == 200
+
+        data = await response.json()
+        candidates = data["candidates"]
+        assert len(candidates) == 26
+        assert candidates[0]["key"] == 7
+        scores = [candidate["score"] for candidate in candidates]
+        assert scores == sorted(scores)
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_without_letter(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/caesar/decrypt",
+            content=Content(b"application/json", b'{"content": "1234"}'),
+        )
+
+        assert response is not None
+        assert response.status == 400
+
+        data = await response.json()
+        assert data[0]["type"] == "value_error.nolettercontent"
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_with_key(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/caesar/decrypt",
+            content=json_content(CaesarData(content="Test", key=1)),
+        )
+
+        assert response is not None
+        assert response.status == 400
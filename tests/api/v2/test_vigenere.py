@@ -14,15 +14,31 @@
 #  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+import gzip
+import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 import pytest
-from blacksheep import Content
+from blacksheep import Content, Response, StreamedContent
 from blacksheep.testing import TestClient
 from essentials.json import dumps
 from pydantic import BaseModel
 
+from vigenere_api.api.helpers import (
+    Algorithm,
+    get_request_digest,
+    job_executor,
+    make_etag,
+    Operation,
+    response_cache,
+)
+from vigenere_api.api.helpers.conditional import CACHE_CONTROL
+from vigenere_api.api.helpers.executor import PROCESS_THRESHOLD, PROCESS_WORKERS
+from vigenere_api.api.helpers.query import MAX_QUERY_CONTENT
+from vigenere_api.api.v2.controllers.vigenere.docs import VIGENERE_DECRYPT_DATA
 from vigenere_api.models import VigenereData
+from vigenere_api.models.cryptanalysis import MAX_KEY_LENGTH
 
 
 def json_content(data: BaseModel) -> Content:
@@ -45,6 +61,23 @@ def bad_content(content: Any, key: Any) -> Content:
     )
 
 
+def streamed_content(*chunks: bytes) -> StreamedContent:
+    async def data_provider() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    return StreamedContent(b"text/plain", data_provider)
+
+
+async def read_body(response: Response) -> bytes:
+    body = await response.read()
+    assert body is not None
+    if response.get_first_header(b"Content-Encoding") == b"gzip":
+        return gzip.decompress(body)
+
+    return body
+
+
 class CipherSuite:
     @staticmethod
     @pytest.mark.asyncio()
@@ -69,6 +102,42 @@ class CipherSuite:
         assert ciphered_vigenere.key == vigenere_input.key
         assert ciphered_vigenere.content == "Vxum"
 
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_large_content_in_process_pool(test_client: TestClient) -> None:
+        vigenere_input = VigenereData(content="Test " * PROCESS_THRESHOLD, key="ct")
+        completed = job_executor.statistics.process.completed
+
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher",
+            content=json_content(vigenere_input),
+        )
+
+        assert response is not None
+        data = json.loads(await read_body(response))
+        assert data["content"] == vigenere_input.cipher().content
+        if PROCESS_WORKERS > 0:
+            assert job_executor.statistics.process.completed > completed
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_same_request_from_cache(test_client: TestClient) -> None:
+        vigenere_input = VigenereData(content="Cached test", key="ct")
+        hits = response_cache.statistics.hits
+
+        first_response = await test_client.post(
+            "/api/v2/vigenere/cipher",
+            content=json_content(vigenere_input),
+        )
+        second_response = await test_client.post(
+            "/api/v2/vigenere/cipher",
+            content=json_content(vigenere_input),
+        )
+
+        assert await first_response.read() == await second_response.read()
+        assert second_response.content_type() == b"application/json"
+        assert response_cache.statistics.hits == hits + 1
+
     @staticmethod
     @pytest.mark.asyncio()
     async def test_with_str_upper_key(test_client: TestClient) -> None:
@@ -673,3 +742,369 @@ class DecipherSuite:
                     "type": "value_error.badkey",
                 },
             ]
+
+
+class ConditionalSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_etag_and_cache_control(test_client: TestClient) -> None:
+        vigenere_input = VigenereData(content="Test", key="ct")
+
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher",
+            content=json_content(vigenere_input),
+        )
+
+        assert response.status == 200
+        assert response.get_first_header(b"ETag") == make_etag(
+            get_request_digest(Algorithm.VIGENERE, Operation.CIPHER, "ct", "Test"),
+        )
+        assert response.get_first_header(b"Cache-Control") == CACHE_CONTROL
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_not_modified(test_client: TestClient) -> None:
+        vigenere_input = VigenereData(content="Test", key="ct")
+        first_response = await test_client.post(
+            "/api/v2/vigenere/decipher",
+            content=json_content(vigenere_input),
+        )
+        etag = first_response.get_first_header(b"ETag")
+        assert etag is not None
+        thread_submitted = job_executor.statistics.thread.submitted
+
+        response = await test_client.post(
+            "/api/v2/vigenere/decipher",
+            headers=[(b"If-None-Match", etag)],
+            content=json_content(vigenere_input),
+        )
+
+        assert response.status == 304
+        assert await response.read() is None
+        assert response.get_first_header(b"ETag") == etag
+        assert job_executor.statistics.thread.submitted == thread_submitted
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_other_etag(test_client: TestClient) -> None:
+        vigenere_input = VigenereData(content="Test", key="ct")
+
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher",
+            headers=[(b"If-None-Match", b'"other"')],
+            content=json_content(vigenere_input),
+        )
+
+        assert response.status == 200
+        data = await response.json()
+        assert data["content"] == "Vxum"
+
+
+class QuerySuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_cipher(test_client: TestClient) -> None:
+        response = await test_client.get(
+            "/api/v2/vigenere/cipher",
+            query={"content": "Test", "key": "ct"},
+        )
+
+        assert response.status == 200
+        assert await response.json() == {"content": "Vxum", "key": "ct"}
+        assert response.get_first_header(b"Cache-Control") == CACHE_CONTROL
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_decipher_not_modified(test_client: TestClient) -> None:
+        query = {"content": "Vxum", "key": "ct"}
+        first_response = await test_client.get(
+            "/api/v2/vigenere/decipher",
+            query=query,
+        )
+        etag = first_response.get_first_header(b"ETag")
+        assert etag is not None
+
+        response = await test_client.get(
+            "/api/v2/vigenere/decipher",
+            headers=[(b"If-None-Match", etag)],
+            query=query,
+        )
+
+        assert await first_response.json() == {"content": "Test", "key": "ct"}
+        assert response.status == 304
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_bad_key(test_client: TestClient) -> None:
+        response = await test_client.get(
+            "/api/v2/vigenere/cipher",
+            query={"content": "Test", "key": "c"},
+        )
+
+        assert response.status == 400
+        errors = await response.json()
+        assert errors[0]["loc"] == ["key"]
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_too_long_content(test_client: TestClient) -> None:
+        response = await test_client.get(
+            "/api/v2/vigenere/cipher",
+            query={"content": "T" * (MAX_QUERY_CONTENT + 1), "key": "ct"},
+        )
+
+        assert response.status == 400
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_missing_content(test_client: TestClient) -> None:
+        response = await test_client.get(
+            "/api/v2/vigenere/cipher",
+            query={"key": "ct"},
+        )
+
+        assert response.status == 400
+
+
+class CompressionSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_gzip_request_and_response(test_client: TestClient) -> None:
+        vigenere_input = VigenereData(content="Test " * 1000, key="ct")
+
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher",
+            headers=[(b"Accept-Encoding", b"gzip"), (b"Content-Encoding", b"gzip")],
+            content=Content(
+                b"application/json",
+                gzip.compress(dumps(vigenere_input).encode()),
+            ),
+        )
+
+        assert response.status == 200
+        assert response.get_first_header(b"Content-Encoding") == b"gzip"
+        assert response.get_first_header(b"Vary") == b"Accept-Encoding"
+        etag = response.get_first_header(b"ETag")
+        assert etag is not None
+        assert etag.startswith(b'W/"')
+        data = json.loads(await read_body(response))
+        assert data == vigenere_input.cipher().dict()
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_small_response(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher",
+            headers=[(b"Accept-Encoding", b"gzip")],
+            content=json_content(VigenereData(content="Test", key="ct")),
+        )
+
+        assert response.status == 200
+        assert response.get_first_header(b"Content-Encoding") is None
+        assert await response.json() == {"content": "Vxum", "key": "ct"}
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_unsupported_request_encoding(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher",
+            headers=[(b"Content-Encoding", b"br")],
+            content=json_content(VigenereData(content="Test", key="ct")),
+        )
+
+        assert response.status == 415
+
+
+class BatchSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_cipher_and_decipher(test_client: TestClient) -> None:
+        items = [
+            {"operation": "cipher", "content": "Test", "key": "ct"},
+            {"operation": "decipher", "content": "Vxum", "key": "CT"},
+        ]
+
+        response = await test_client.post(
+            "/api/v2/vigenere/batch",
+            content=Content(b"application/json", dumps(items).encode("utf8")),
+        )
+
+        assert response is not None
+        assert response.status == 200
+
+        data = await response.json()
+        assert data == [
+            {"content": "Vxum", "key": "ct"},
+            {"content": "Test", "key": "CT"},
+        ]
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_errors_by_item(test_client: TestClient) -> None:
+        items = [
+            {"operation": "encrypt", "content": "Test", "key": "ct"},
+            {"operation": "cipher", "content": "Test", "key": "ct"},
+        ]
+
+        response = await test_client.post(
+            "/api/v2/vigenere/batch",
+            content=Content(b"application/json", dumps(items).encode("utf8")),
+        )
+
+        assert response is not None
+        assert response.status == 200
+
+        data = await response.json()
+        assert data[0]["errors"][0]["loc"] == ["operation"]
+        assert data[1] == {"content": "Vxum", "key": "ct"}
+
+
+class StreamSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_cipher(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher/stream",
+            query={"key": "PIERRE"},
+            content=streamed_content(b"CA VA E", b"TRE TOUT", b" NOIR"),
+        )
+
+        assert response is not None
+        assert response.status == 200
+
+        data = await read_body(response)
+        assert data == b"RI ZR VXGM XFLX CWMI"
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_decipher(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/vigenere/decipher/stream",
+            query={"key": "PIERRE"},
+            content=streamed_content(b"RI ZR VXGM XFLX CWMI"),
+        )
+
+        assert response is not None
+        assert response.status == 200
+
+        data = await read_body(response)
+        assert data == b"CA VA ETRE TOUT NOIR"
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_multi_bytes_char_between_chunks(test_client: TestClient) -> None:
+        text = "Ça va être l'été\xff".encode("utf8")
+
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher/stream",
+            query={"key": "ab"},
+            content=streamed_content(*(text[i : i + 1] for i in range(len(text)))),
+        )
+
+        assert response is not None
+        assert response.status == 200
+
+        data = await read_body(response)
+        expected = VigenereData(content="Ça va être l'été\xff", key="ab").cipher()
+        assert data == expected.content.encode("utf8")
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_bad_key(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher/stream",
+            query={"key": "a"},
+            content=streamed_content(b"Test"),
+        )
+
+        assert response is not None
+        assert response.status == 400
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_missing_key(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/vigenere/cipher/stream",
+            content=streamed_content(b"Test"),
+        )
+
+        assert response is not None
+        assert response.status == 400
+
+
+class DecryptSuite:
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_decrypt(test_client: TestClient) -> None:
+        content = VIGENERE_DECRYPT_DATA[0].content
+
+        response = await test_client.post(
+            "/api/v2/vigenere/decrypt",
+            content=Content(
+                b"application/json",
+                dumps({"content": content}).encode("utf8"),
+            ),
+        )
+
+        assert response is not None
+        assert response.status == 200
+
+        data = json.loads(await read_body(response))
+        key_lengths = data["key_lengths"]
+        assert key_lengths[0]["length"] == 5
+        assert key_lengths[0]["repeats"] > 0
+        assert data["candidates"][0]["key"] == "lemon"
+        assert data["content"].startswith("Four score and seven years ago")
+        assert sorted(item["length"] for item in key_lengths) == list(
+            range(2, MAX_KEY_LENGTH + 1),
+        )
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_language(test_client: TestClient) -> None:
+        text = (
+            "Les hommes naissent et demeurent libres et egaux en droits."
+            + " Les distinctions sociales ne peuvent etre fondees que sur"
+            + " l'utilite commune."
+        ) * 2
+        content = VigenereData(content=text, key="lemon").cipher().content
+
+        response = await test_client.post(
+            "/api/v2/vigenere/decrypt",
+            content=Content(
+                b"application/json",
+                dumps({"content": content, "language": "fr"}).encode("utf8"),
+            ),
+        )
+
+        assert response is not None
+        assert response.status == 200
+
+        data = json.loads(await read_body(response))
+        assert data["candidates"][0]["key"] == "lemon"
+        assert data["content"] == text
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_unknown_language(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/vigenere/decrypt",
+            content=Content(
+                b"application/json",
+                b'{"content": "Test", "language": "es"}',
+            ),
+        )
+
+        assert response is not None
+        assert response.status == 400
+
+    @staticmethod
+    @pytest.mark.asyncio()
+    async def test_without_letter(test_client: TestClient) -> None:
+        response = await test_client.post(
+            "/api/v2/vigenere/decrypt",
+            content=Content(b"application/json", b'{"content": "1234"}'),
+        )
+
+        assert response is not None
+        assert response.status == 400
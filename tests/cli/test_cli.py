@@ -0,0 +1,116 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from pathlib import Path
+
+import pytest
+
+from vigenere_api.cli import main
+from vigenere_api.server import ServerOptions
+
+
+def test_cipher_then_decipher(tmp_path: Path) -> None:
+    input_path = tmp_path / "input.txt"
+    ciphered_path = tmp_path / "ciphered.txt"
+    deciphered_path = tmp_path / "deciphered.txt"
+    input_path.write_text("Hello World!", "utf-8")
+
+    assert (
+        main(
+            ["file", "cipher", "--algo", "vigenere", "--key", "test"]
+            + [str(input_path), str(ciphered_path)],
+        )
+        == 0
+    )
+    assert ciphered_path.read_text("utf-8") == "Aideh Agkeh!"
+
+    assert (
+        main(
+            ["file", "decipher", "--algo", "vigenere", "--key", "test"]
+            + [str(ciphered_path), str(deciphered_path)],
+        )
+        == 0
+    )
+    assert deciphered_path.read_text("utf-8") == "Hello World!"
+
+
+@pytest.mark.parametrize("key", ["3", "d", "-23"])
+def test_caesar_keys(tmp_path: Path, key: str) -> None:
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.txt"
+    input_path.write_text("Hello World!", "utf-8")
+
+    main(
+        ["file", "cipher", "--algo", "Caesar", "--key", key]
+        + [str(input_path), str(output_path)],
+    )
+
+    assert output_path.read_text("utf-8") == "Khoor Zruog!"
+
+
+def test_bad_key(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("Hello World!", "utf-8")
+
+    with pytest.raises(SystemExit) as error:
+        main(
+            ["file", "cipher", "--algo", "vigenere", "--key", "a"]
+            + [str(input_path), str(tmp_path / "output.txt")],
+        )
+
+    assert error.value.code == 2
+    assert "The key is too short." in capsys.readouterr().err
+
+
+def test_missing_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as error:
+        main(
+            ["file", "cipher", "--algo", "caesar", "--key", "1"]
+            + [str(tmp_path / "input.txt"), str(tmp_path / "output.txt")],
+        )
+
+    assert error.value.code == 1
+    assert "No such file or directory" in capsys.readouterr().err
+
+
+def test_serve_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    options = []
+    monkeypatch.setattr("vigenere_api.cli.cli.run", options.append)
+
+    assert main([]) == 0
+    assert options == [ServerOptions()]
+
+
+def test_serve_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    options = []
+    monkeypatch.setattr("vigenere_api.cli.cli.run", options.append)
+
+    arguments = ["serve", "--host", "0.0.0.0", "--port", "80", "--workers", "32"]
+    arguments += ["--backlog", "4096", "--keep-alive", "10"]
+    arguments += ["--limit-concurrency", "100", "--performance"]
+    assert main(arguments) == 0
+
+    assert options == [
+        ServerOptions(
+            host="0.0.0.0",
+            port=80,
+            workers=32,
+            backlog=4096,
+            keep_alive=10,
+            limit_concurrency=100,
+            performance=True,
+        ),
+    ]
@@ -0,0 +1,84 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from pathlib import Path
+
+import pytest
+
+from vigenere_api.cli import cipher_file
+from vigenere_api.cli.errors import BadBlockSizeError, SameFileError, StreamTypeError
+from vigenere_api.models import CaesarStream, VigenereData, VigenereStream
+
+
+TEXT = "Hello World! Ça va être l'été. 中文 1234 " * 20
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 64, 1_000_000])
+def test_cipher_file(tmp_path: Path, block_size: int) -> None:
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.txt"
+    input_path.write_text(TEXT, "utf-8")
+
+    written_size = cipher_file(
+        input_path,
+        output_path,
+        VigenereStream("AbCd"),
+        block_size,
+    )
+
+    expected = VigenereData(content=TEXT, key="AbCd").cipher().content.encode()
+    assert output_path.read_bytes() == expected
+    assert written_size == len(expected)
+
+
+def test_invalid_utf8_is_kept(tmp_path: Path) -> None:
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.txt"
+    input_path.write_bytes(b"abc\xff\xc3")
+
+    cipher_file(input_path, output_path, CaesarStream(1), 2)
+
+    assert output_path.read_bytes() == b"bcd\xff\xc3"
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.txt"
+    input_path.write_bytes(b"")
+    output_path.write_bytes(b"old content")
+
+    assert cipher_file(input_path, output_path, CaesarStream(1)) == 0
+    assert output_path.read_bytes() == b""
+
+
+def test_same_file(tmp_path: Path) -> None:
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(TEXT, "utf-8")
+
+    with pytest.raises(SameFileError):
+        cipher_file(input_path, input_path, CaesarStream(1))
+
+    assert input_path.read_text("utf-8") == TEXT
+
+
+def test_bad_stream(tmp_path: Path) -> None:
+    with pytest.raises(StreamTypeError):
+        cipher_file(tmp_path / "input.txt", tmp_path / "output.txt", "stream")
+
+
+def test_bad_block_size(tmp_path: Path) -> None:
+    with pytest.raises(BadBlockSizeError):
+        cipher_file(tmp_path / "input.txt", tmp_path / "output.txt", CaesarStream(1), 0)
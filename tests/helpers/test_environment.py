@@ -0,0 +1,48 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+from vigenere_api.helpers import EnvironmentVariableValueError, get_int_env
+
+
+ENV_NAME = "VIGENERE_API_TEST_VARIABLE"
+
+
+def test_default_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(ENV_NAME, raising=False)
+
+    assert get_int_env(ENV_NAME, 12) == 12
+
+
+def test_defined_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ENV_NAME, "42")
+
+    assert get_int_env(ENV_NAME, 12) == 42
+
+
+@pytest.mark.raises(exception=EnvironmentVariableValueError)
+def test_not_integer_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ENV_NAME, "ten")
+
+    _ignored = get_int_env(ENV_NAME, 12)
+
+
+@pytest.mark.raises(exception=EnvironmentVariableValueError)
+def test_negative_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ENV_NAME, "-1")
+
+    _ignored = get_int_env(ENV_NAME, 12)
@@ -0,0 +1,168 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from array import array
+
+import pytest
+
+from vigenere_api.models.helpers import (
+    apply_shifts,
+    cipher_bytes,
+    count_bytes_letters,
+    is_ascii_bytes,
+)
+from vigenere_api.models.helpers.bytes_engine import _python_bytes_engine
+from vigenere_api.models.helpers.errors import BufferTypeError, TooSmallBufferError
+from vigenere_api.models.helpers.vigenere_engine import HAS_NUMPY
+
+
+TEXT = "Hello World! AbCdEfGhIjKlMnOpQrStUvWxYz 0123456789 +-*/ end"
+SHIFTS = ([1], [27], [0, 1], [3, 1, 4, 1, 5], [-1, 27, 13])
+
+needs_numpy = pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed.")
+
+
+@pytest.mark.parametrize("shifts", SHIFTS)
+@pytest.mark.parametrize("offset", [0, 2])
+def test_same_as_apply_shifts(shifts: list[int], offset: int) -> None:
+    expected = apply_shifts(TEXT, shifts, offset=offset).encode()
+
+    assert cipher_bytes(TEXT.encode(), shifts, offset=offset) == expected
+
+
+@pytest.mark.parametrize("shifts", SHIFTS)
+def test_python_engine(shifts: list[int]) -> None:
+    text = TEXT * 10
+    out = bytearray(len(text))
+    _python_bytes_engine(text.encode(), shifts, out)
+
+    assert out == apply_shifts(text, shifts).encode()
+
+
+@needs_numpy
+@pytest.mark.parametrize("shifts", SHIFTS)
+def test_numpy_engine_with_large_buffer(shifts: list[int]) -> None:
+    text = TEXT * 1000
+
+    assert cipher_bytes(text.encode(), shifts) == apply_shifts(text, shifts).encode()
+
+
+@pytest.mark.parametrize("size", [1, 10_000])
+def test_in_place(size: int) -> None:
+    text = TEXT * size
+    buffer = bytearray(text.encode())
+
+    assert cipher_bytes(buffer, [3, 1, 4], buffer) is buffer
+    assert buffer == apply_shifts(text, [3, 1, 4]).encode()
+
+
+def test_memoryview_output() -> None:
+    data = bytearray(len(TEXT) + 10)
+    view = memoryview(data)[5:]
+
+    assert cipher_bytes(memoryview(TEXT.encode()), [0, 1], view) is view
+    assert data[5 : 5 + len(TEXT)] == apply_shifts(TEXT, [0, 1]).encode()
+    assert data[:5] == data[5 + len(TEXT) :] == bytes(5)
+
+
+@pytest.mark.parametrize("shifts", SHIFTS)
+def test_memoryview_input(shifts: list[int]) -> None:
+    data = bytearray(TEXT.encode())
+    view = memoryview(data)
+
+    assert cipher_bytes(view, shifts) == apply_shifts(TEXT, shifts).encode()
+    assert count_bytes_letters(view) == count_bytes_letters(data)
+
+
+@pytest.mark.parametrize("shifts", SHIFTS)
+def test_python_engine_with_memoryview(shifts: list[int]) -> None:
+    out = bytearray(len(TEXT))
+    _python_bytes_engine(memoryview(TEXT.encode()), shifts, out)
+
+    assert out == apply_shifts(TEXT, shifts).encode()
+
+
+def test_memoryview_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("vigenere_api.models.helpers.bytes_engine.HAS_NUMPY", False)
+    view = memoryview(TEXT.encode())
+
+    assert cipher_bytes(view, [3, 1, 4]) == apply_shifts(TEXT, [3, 1, 4]).encode()
+    assert count_bytes_letters(view) == sum(char.isalpha() for char in TEXT)
+
+
+def test_memoryview_is_not_copied() -> None:
+    data = bytearray(TEXT.encode())
+    view = memoryview(data)
+
+    cipher_bytes(view, [3, 1, 4], view)
+
+    assert data == apply_shifts(TEXT, [3, 1, 4]).encode()
+
+
+def test_signed_memoryview_is_cast() -> None:
+    view = memoryview(bytearray(TEXT.encode())).cast("b")
+
+    assert cipher_bytes(view, [0, 1]) == apply_shifts(TEXT, [0, 1]).encode()
+
+
+def test_is_ascii_bytes() -> None:
+    assert is_ascii_bytes(TEXT.encode())
+    assert is_ascii_bytes(memoryview(TEXT.encode()))
+    assert not is_ascii_bytes("aé b".encode())
+    assert not is_ascii_bytes(memoryview("aé b".encode()))
+
+
+def test_non_ascii_bytes_are_unchanged() -> None:
+    assert cipher_bytes("aé b".encode(), [1, 2]) == "bé d".encode()
+
+
+def test_count_bytes_letters() -> None:
+    assert count_bytes_letters(TEXT.encode()) == sum(char.isalpha() for char in TEXT)
+
+
+def test_bad_buffer_type() -> None:
+    with pytest.raises(BufferTypeError, match="The buffer is 'str'."):
+        cipher_bytes("abc", [1])
+
+
+def test_read_only_output() -> None:
+    with pytest.raises(BufferTypeError, match="The output buffer is 'memoryview'."):
+        cipher_bytes(b"abc", [1], memoryview(b"def"))
+
+
+def test_not_byte_memoryview() -> None:
+    with pytest.raises(BufferTypeError, match="The buffer is 'memoryview'."):
+        cipher_bytes(memoryview(array("i", [65, 66])), [1])
+
+
+def test_not_contiguous_memoryview() -> None:
+    with pytest.raises(BufferTypeError, match="The buffer is 'memoryview'."):
+        cipher_bytes(memoryview(b"abcd")[::2], [1])
+
+
+def test_not_byte_output() -> None:
+    with pytest.raises(BufferTypeError, match="The output buffer is 'memoryview'."):
+        cipher_bytes(b"abc", [1], memoryview(array("i", [0, 0, 0])))
+
+
+def test_not_contiguous_output() -> None:
+    with pytest.raises(BufferTypeError, match="The output buffer is 'memoryview'."):
+        cipher_bytes(b"abc", [1], memoryview(bytearray(6))[::2])
+
+
+def test_too_small_output() -> None:
+    with pytest.raises(TooSmallBufferError, match="at least '3' bytes"):
+        cipher_bytes(b"abc", [1], bytearray(2))
@@ -17,7 +17,7 @@
 """Caesar model tests."""
 
 import pytest
-from pydantic import ValidationError
+from pydantic import validate_model, ValidationError
 
 from vigenere_api.models.caesar import CaesarData
 from vigenere_api.models.errors import AlgorithmKeyTypeError, AlgorithmTextTypeError
@@ -96,6 +96,31 @@ class CtorSuite:
         key = "$"
         _ignored_data = CaesarData(content=text, key=key)
 
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_bad_bool_key() -> None:
+        text = "Test"
+        key = True
+        _ignored_data = CaesarData(content=text, key=key)
+
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_extra_field() -> None:
+        _ignored_data = CaesarData(content="Test", key=1, other=2)
+
+    @staticmethod
+    def test_fast_path_same_as_validation() -> None:
+        data = CaesarData(key="z", content="Test")
+        values, fields_set, error = validate_model(
+            CaesarData,
+            {"key": "z", "content": "Test"},
+        )
+
+        assert error is None
+        assert data.dict() == values
+        assert list(data.dict()) == ["content", "key"]
+        assert data.__fields_set__ == fields_set
+
 
 class OperationSuite:
     class CipherSuite:
@@ -249,6 +274,15 @@ class OperationSuite:
             assert decipher.key == key
 
 
+class ResultSuite:
+    @staticmethod
+    def test_result_equals_validated_model() -> None:
+        data = CaesarData(content="Test", key="b")
+
+        assert data.cipher() == CaesarData(content="Uftu", key="b")
+        assert data.decipher() == CaesarData(content="Sdrs", key="b")
+
+
 class InternalSuite:
     class AlgorithmSuite:
         algo_func = CaesarData._CaesarData__algorithm
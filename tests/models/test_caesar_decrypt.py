@@ -0,0 +1,151 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Caesar decrypt model tests."""
+
+from typing import Any
+
+import pytest
+from pydantic import validate_model, ValidationError
+
+from vigenere_api.helpers import Model
+from vigenere_api.models import CaesarData, CaesarDecryptData, Language
+
+
+PLAIN_TEXT = (
+    "It was the best of times, it was the worst of times, it was the age of wisdom,"
+    " it was the age of foolishness."
+)
+
+
+class CtorSuite:
+    @staticmethod
+    def test_content() -> None:
+        data = CaesarDecryptData(content="Test")
+
+        assert data.content == "Test"
+
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_without_letter() -> None:
+        _ignored_data = CaesarDecryptData(content="éà 123")
+
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_empty_content() -> None:
+        _ignored_data = CaesarDecryptData(content="")
+
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_with_key() -> None:
+        _ignored_data = CaesarDecryptData(content="Test", key=1)
+
+
+class FastPathSuite:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "body",
+        [{"content": "Test", "language": "fr"}, {"content": "Test"}],
+    )
+    def test_json_body_skips_validation(
+        body: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        values, fields_set, error = validate_model(CaesarDecryptData, body)
+
+        def fail(*_args: Any, **_kwargs: Any) -> None:
+            pytest.fail("The valid data went through the pydantic validation.")
+
+        monkeypatch.setattr(Model, "__init__", fail)
+        data = CaesarDecryptData(**body)
+
+        assert error is None
+        assert data.dict() == values
+        assert type(data.language) is Language
+        assert data.__fields_set__ == fields_set
+
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_bad_language_type() -> None:
+        _ignored_data = CaesarDecryptData(content="Test", language=["en"])
+
+
+class LanguageSuite:
+    @staticmethod
+    def test_language() -> None:
+        data = CaesarDecryptData(content="Test", language="de")
+
+        assert data.language == Language.DE
+
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_unknown_language() -> None:
+        _ignored_data = CaesarDecryptData(content="Test", language="english")
+
+    @staticmethod
+    def test_each_key_in_german() -> None:
+        text = "Die Wuerde des Menschen ist unantastbar."
+
+        for key in range(26):
+            content = CaesarData(content=text, key=key).cipher().content
+
+            result = CaesarDecryptData(content=content, language=Language.DE).decrypt()
+
+            assert result.candidates[0].key == key
+
+
+class DecryptSuite:
+    @staticmethod
+    def test_each_key() -> None:
+        for key in range(26):
+            content = CaesarData(content=PLAIN_TEXT, key=key).cipher().content
+
+            result = CaesarDecryptData(content=content).decrypt()
+
+            assert result.candidates[0].key == key
+
+    @staticmethod
+    def test_ranked_candidates() -> None:
+        content = CaesarData(content=PLAIN_TEXT, key=4).cipher().content
+
+        candidates = CaesarDecryptData(content=content).decrypt().candidates
+
+        assert sorted(candidate.key for candidate in candidates) == list(range(26))
+        scores = [candidate.score for candidate in candidates]
+        assert scores == sorted(scores)
+
+    @staticmethod
+    def test_large_content_on_sample() -> None:
+        content = CaesarData(content=PLAIN_TEXT * 10_000, key=9).cipher().content
+
+        result = CaesarDecryptData(content=content).decrypt(sample_size=4096)
+
+        assert result.candidates[0].key == 9
+
+    @staticmethod
+    def test_content_shorter_than_sample_blocks() -> None:
+        result = CaesarDecryptData(content="Hello world").decrypt(sample_size=5)
+
+        assert len(result.candidates) == 26
+
+    @staticmethod
+    def test_sample_without_letter() -> None:
+        content = "1" * 10_000 + "Khoor Zruog, wklv lv d vhfuhw phvvdjh." + "2" * 10_000
+
+        result = CaesarDecryptData(content=content).decrypt(sample_size=32)
+
+        assert result.candidates[0].key == 3
@@ -13,10 +13,17 @@
 #  You should have received a copy of the GNU General Public License along with        +
 #  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+from typing import Union
+
 import pytest
 
-from vigenere_api.models.helpers.check_key import check_key
-from vigenere_api.models.helpers.errors import BadKeyError, EmptyKeyError, KeyTypeError
+from vigenere_api.models.helpers.check_key import check_caesar_key, check_key
+from vigenere_api.models.helpers.errors import (
+    BadKeyError,
+    EmptyKeyError,
+    KeyTypeError,
+    TooLongKeyError,
+)
 
 
 def test_with_key() -> None:
@@ -40,3 +47,23 @@ def test_bad_empty_key() -> None:
 def test_bad_not_alpha_str_key() -> None:
     key = "$z"
     check_key(key)
+
+
+@pytest.mark.parametrize("key", [3, -30, "z", "é"])
+def test_with_caesar_key(key: Union[int, str]) -> None:
+    check_caesar_key(key)
+
+
+@pytest.mark.parametrize(
+    ("key", "error"),
+    [
+        (b"z", KeyTypeError),
+        (3.0, KeyTypeError),
+        ("", EmptyKeyError),
+        ("zz", TooLongKeyError),
+        ("$", BadKeyError),
+    ],
+)
+def test_bad_caesar_key(key: object, error: type[Exception]) -> None:
+    with pytest.raises(error):
+        check_caesar_key(key)
@@ -0,0 +1,68 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from vigenere_api.models.helpers import (
+    apply_shifts,
+    cipher_bytes,
+    engine_timer,
+    EngineStatistics,
+    EngineTimer,
+)
+
+
+class EngineTimerSuite:
+    @staticmethod
+    def test_observe() -> None:
+        timer = EngineTimer()
+
+        timer.observe("python", 10, 0.25)
+        timer.observe("python", 5, 0.5)
+        timer.observe("numpy", 2048, 0.125)
+
+        assert timer.statistics == {
+            "python": EngineStatistics(calls=2, characters=15, total_time=0.75),
+            "numpy": EngineStatistics(calls=1, characters=2048, total_time=0.125),
+        }
+
+    @staticmethod
+    def test_clear() -> None:
+        timer = EngineTimer()
+        timer.observe("python", 10, 0.25)
+
+        timer.clear()
+
+        assert timer.statistics == {}
+
+
+class EnginesSuite:
+    @staticmethod
+    def test_apply_shifts() -> None:
+        engine_timer.clear()
+
+        apply_shifts("Hello World!", [1, 2], numpy_threshold=10_000)
+
+        statistics = engine_timer.statistics["python"]
+        assert statistics.calls == 1
+        assert statistics.characters == 12
+        assert statistics.total_time >= 0
+
+    @staticmethod
+    def test_cipher_bytes() -> None:
+        engine_timer.clear()
+
+        cipher_bytes(b"Hello World!", [1])
+
+        assert engine_timer.statistics["bytes_translate"].characters == 12
@@ -0,0 +1,125 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from random import Random
+from typing import Final
+
+import pytest
+
+from vigenere_api.models import VigenereData
+from vigenere_api.models.cryptanalysis import (
+    get_language_model,
+    get_letter_codes,
+    Language,
+    QuadgramScorer,
+    remove_accents,
+)
+
+from .test_key_length import TEXT
+
+
+KEY: Final = [11, 4, 12, 14, 13]
+
+PLAINTEXTS: Final = {
+    Language.EN: TEXT,
+    Language.FR: (
+        "Chaque matin, la boulangère ouvre sa boutique avant le lever du soleil. "
+        "Les voisins viennent acheter leur pain encore chaud et discutent des "
+        "nouvelles du quartier pendant que les enfants attendent devant la "
+        "vitrine remplie de gâteaux et de croissants dorés."
+    ),
+    Language.DE: (
+        "Jeden Morgen öffnet die Bäckerin ihren Laden, bevor die Sonne aufgeht. "
+        "Die Nachbarn kaufen ihr warmes Brot und sprechen über die Neuigkeiten "
+        "aus der Stadt, während die Kinder vor dem Schaufenster mit den Kuchen "
+        "und den goldenen Brezeln warten."
+    ),
+}
+
+
+def get_scorer(numpy_threshold: int) -> QuadgramScorer:
+    content = VigenereData(content=TEXT, key="lemon").cipher().content
+    return QuadgramScorer(
+        get_letter_codes(content),
+        get_language_model(Language.EN),
+        numpy_threshold,
+    )
+
+
+class QuadgramScorerSuite:
+    @staticmethod
+    @pytest.mark.parametrize("numpy_threshold", [0, 10_000])
+    def test_best_key(numpy_threshold: int) -> None:
+        scorer = get_scorer(numpy_threshold)
+
+        assert scorer.score(KEY) > scorer.score([11, 4, 12, 14, 14])
+        assert scorer.score(KEY) > scorer.score([0, 0, 0, 0, 0])
+
+    @staticmethod
+    @pytest.mark.parametrize("language", list(Language))
+    @pytest.mark.parametrize("numpy_threshold", [0, 10_000])
+    def test_plaintext_above_shuffled(language: Language, numpy_threshold: int) -> None:
+        model = get_language_model(language)
+        letter_codes = get_letter_codes(remove_accents(PLAINTEXTS[language]))
+        letters = list(letter_codes)
+        Random(language).shuffle(letters)
+
+        plaintext = QuadgramScorer(letter_codes, model, numpy_threshold)
+        shuffled = QuadgramScorer(bytes(letters), model, numpy_threshold)
+
+        assert plaintext.score([0]) > shuffled.score([0]) + 100
+
+    @staticmethod
+    def test_same_result_with_numpy() -> None:
+        with_numpy = get_scorer(0)
+        without_numpy = get_scorer(10_000)
+
+        for shifts in (KEY, [1, 2, 3], [25]):
+            assert with_numpy.score(shifts) == pytest.approx(
+                without_numpy.score(shifts)
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize("numpy_threshold", [0, 10_000])
+    def test_other_letters_skipped(numpy_threshold: int) -> None:
+        scorer = QuadgramScorer(
+            get_letter_codes("abcé abé"),
+            get_language_model(Language.EN),
+            numpy_threshold,
+        )
+
+        assert scorer.score([0]) == 0.0
+
+    @staticmethod
+    def test_hill_climbing() -> None:
+        scorer = get_scorer(0)
+        shifts = [*KEY[:2], 0, *KEY[3:]]
+
+        improved = True
+        while improved:
+            improved = False
+            for position in range(len(shifts)):
+                best = max(
+                    range(26),
+                    key=lambda shift: scorer.score(
+                        shifts[:position] + [shift] + shifts[position + 1 :],
+                    ),
+                )
+                if best != shifts[position]:
+                    shifts[position] = best
+                    improved = True
+
+        assert shifts == KEY
@@ -0,0 +1,154 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+import pytest
+
+from vigenere_api.models.cryptanalysis import (
+    get_analysed_length,
+    get_chi_squared_scores,
+    get_column_chi_squared_scores,
+    get_letter_histogram,
+    get_sample,
+)
+from vigenere_api.models.cryptanalysis.frequencies import (
+    ENGLISH_FREQUENCIES,
+    SAMPLE_BLOCKS,
+)
+
+
+class SampleSuite:
+    @staticmethod
+    def test_short_text() -> None:
+        assert get_sample("Test", 32) == "Test"
+
+    @staticmethod
+    def test_without_limit() -> None:
+        text = "a" * 1000
+        assert get_sample(text, 0) is text
+
+    @staticmethod
+    @pytest.mark.parametrize("length", [6, SAMPLE_BLOCKS, SAMPLE_BLOCKS * 4])
+    @pytest.mark.parametrize("sample_size", [1, 5, SAMPLE_BLOCKS + 1])
+    def test_sample_smaller_than_blocks(length: int, sample_size: int) -> None:
+        text = "".join(chr(0x100 + index) for index in range(length))
+
+        sample = get_sample(text, sample_size)
+
+        if length <= sample_size:
+            assert sample == text
+        else:
+            assert len(sample) <= sample_size
+            assert sample[0] == text[0]
+            assert len(set(sample)) == len(sample)
+
+    @staticmethod
+    def test_blocks_spread_over_text() -> None:
+        text = "a" * 1000 + "b" * 1000 + "c" * 1000
+
+        sample = get_sample(text, SAMPLE_BLOCKS * 4)
+
+        assert len(sample) == SAMPLE_BLOCKS * 4
+        assert sample.startswith("aaaa")
+        assert "b" in sample
+        assert sample.endswith("cccc")
+
+    @staticmethod
+    def test_analysed_length() -> None:
+        assert get_analysed_length(1000, 32) == 32
+        assert get_analysed_length(10, 32) == 10
+        assert get_analysed_length(1000, 0) == 1000
+
+
+class LetterHistogramSuite:
+    @staticmethod
+    def test_case_insensitive() -> None:
+        histogram = get_letter_histogram("AbBa zZ")
+
+        assert len(histogram) == 26
+        assert histogram[0] == histogram[1] == histogram[25] == 2
+        assert sum(histogram) == 6
+
+    @staticmethod
+    def test_ignore_other_characters() -> None:
+        assert sum(get_letter_histogram("Éé 12 ß\ud800!")) == 0
+
+    @staticmethod
+    def test_same_result_with_numpy() -> None:
+        text = "The Quick Brown Fox jumps over the lazy dog, éàù." * 10
+
+        assert get_letter_histogram(text, numpy_threshold=0) == get_letter_histogram(
+            text,
+            numpy_threshold=len(text) * 4,
+        )
+
+
+class ChiSquaredSuite:
+    @staticmethod
+    def test_best_shift() -> None:
+        histogram = get_letter_histogram("Hello World, this is a secret message")
+        rotated = histogram[-5:] + histogram[:-5]
+
+        scores = get_chi_squared_scores(rotated, ENGLISH_FREQUENCIES)
+
+        assert len(scores) == 26
+        assert scores.index(min(scores)) == 5
+
+    @staticmethod
+    def test_perfect_match() -> None:
+        histogram = [round(frequency * 100_000) for frequency in ENGLISH_FREQUENCIES]
+
+        scores = get_chi_squared_scores(histogram, ENGLISH_FREQUENCIES)
+
+        assert scores[0] < 1.0
+
+
+class ColumnChiSquaredSuite:
+    @staticmethod
+    def test_same_as_chi_squared() -> None:
+        histogram = get_letter_histogram("Hello World, this is a secret message")
+
+        scores = get_column_chi_squared_scores([histogram], ENGLISH_FREQUENCIES)
+
+        assert scores == [get_chi_squared_scores(histogram, ENGLISH_FREQUENCIES)]
+
+    @staticmethod
+    def test_empty_column() -> None:
+        scores = get_column_chi_squared_scores([[0] * 26], ENGLISH_FREQUENCIES)
+
+        assert scores == [[0.0] * 26]
+
+    @staticmethod
+    def test_same_result_with_numpy() -> None:
+        histograms = [
+            get_letter_histogram("Hello World, this is a secret message"),
+            get_letter_histogram("Another column"),
+            [0] * 26,
+        ]
+
+        with_numpy = get_column_chi_squared_scores(
+            histograms,
+            ENGLISH_FREQUENCIES,
+            numpy_threshold=0,
+        )
+        without_numpy = get_column_chi_squared_scores(
+            histograms,
+            ENGLISH_FREQUENCIES,
+            numpy_threshold=1_000,
+        )
+
+        for numpy_scores, scores in zip(with_numpy, without_numpy):
+            assert numpy_scores == pytest.approx(scores)
@@ -0,0 +1,104 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from collections import Counter
+
+from vigenere_api.models import VigenereData
+from vigenere_api.models.cryptanalysis import (
+    count_period_repeats,
+    get_kasiski_distances,
+    get_letter_codes,
+    get_repeat_distances,
+)
+
+from .test_key_length import TEXT
+
+
+class RepeatDistancesSuite:
+    @staticmethod
+    def test_distances() -> None:
+        letter_codes = get_letter_codes("abc xy abc xx abc")
+
+        assert get_repeat_distances(letter_codes, 3) == Counter({5: 3})
+
+    @staticmethod
+    def test_without_repeat() -> None:
+        assert get_repeat_distances(get_letter_codes("abcdef"), 3) == Counter()
+
+    @staticmethod
+    def test_too_short() -> None:
+        assert get_repeat_distances(get_letter_codes("ab"), 3, numpy_threshold=0) == (
+            Counter()
+        )
+
+    @staticmethod
+    def test_other_letter_breaks_sequence() -> None:
+        letter_codes = get_letter_codes("abécd abécd")
+
+        assert get_repeat_distances(letter_codes, 3) == Counter()
+
+    @staticmethod
+    def test_max_occurrences() -> None:
+        letter_codes = get_letter_codes("abc" * 10)
+
+        # abc, bca and cab keep four occurrences each.
+        assert get_repeat_distances(letter_codes, 3, max_occurrences=4) == Counter(
+            {3: 9},
+        )
+
+    @staticmethod
+    def test_same_result_with_numpy() -> None:
+        content = VigenereData(content=TEXT * 5 + " é abc", key="lemon").cipher()
+        letter_codes = get_letter_codes(content.content)
+
+        for ngram_size in (3, 4):
+            for max_occurrences in (1, 2, 16):
+                assert get_repeat_distances(
+                    letter_codes,
+                    ngram_size,
+                    max_occurrences,
+                    numpy_threshold=0,
+                ) == get_repeat_distances(
+                    letter_codes,
+                    ngram_size,
+                    max_occurrences,
+                    numpy_threshold=len(letter_codes) + 1,
+                )
+
+
+class KasiskiDistancesSuite:
+    @staticmethod
+    def test_trigrams_and_tetragrams() -> None:
+        letter_codes = get_letter_codes("abcd xy abcd xx")
+
+        assert get_kasiski_distances(letter_codes) == Counter({6: 5})
+
+
+class PeriodRepeatsSuite:
+    @staticmethod
+    def test_multiples() -> None:
+        distances = Counter({6: 5, 8: 1, 7: 2})
+
+        assert count_period_repeats(distances, range(2, 8)) == [6, 5, 1, 0, 5, 2]
+
+    @staticmethod
+    def test_key_length_supported() -> None:
+        content = VigenereData(content=TEXT * 3, key="lemon").cipher().content
+        distances = get_kasiski_distances(get_letter_codes(content))
+
+        repeats = count_period_repeats(distances, range(2, 7))
+
+        assert repeats[3] == max(repeats)
@@ -0,0 +1,141 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+from vigenere_api.models.helpers import (
+    get_vigenere_key,
+    KeyCacheStatistics,
+    vigenere_key_cache,
+    VigenereKeyCache,
+)
+from vigenere_api.models.helpers.errors import (
+    BadCacheSizeError,
+    BadKeyError,
+    CacheSizeTypeError,
+    KeyTypeError,
+)
+
+
+class CtorSuite:
+    @staticmethod
+    def test_empty_cache() -> None:
+        cache = VigenereKeyCache(max_size=2)
+
+        assert cache.statistics == KeyCacheStatistics(
+            hits=0,
+            misses=0,
+            evictions=0,
+            size=0,
+            max_size=2,
+        )
+
+    @staticmethod
+    @pytest.mark.raises(exception=CacheSizeTypeError)
+    def test_bad_type_max_size() -> None:
+        _ignored = VigenereKeyCache(max_size="2")
+
+    @staticmethod
+    @pytest.mark.raises(exception=BadCacheSizeError)
+    def test_negative_max_size() -> None:
+        _ignored = VigenereKeyCache(max_size=-1)
+
+    @staticmethod
+    @pytest.mark.raises(exception=CacheSizeTypeError)
+    def test_bad_type_max_key_length() -> None:
+        _ignored = VigenereKeyCache(max_size=2, max_key_length=2.5)
+
+    @staticmethod
+    @pytest.mark.raises(exception=BadCacheSizeError)
+    def test_negative_max_key_length() -> None:
+        _ignored = VigenereKeyCache(max_size=2, max_key_length=-1)
+
+
+class GetSuite:
+    @staticmethod
+    def test_hit() -> None:
+        cache = VigenereKeyCache(max_size=2)
+
+        key = cache.get("abc")
+
+        assert cache.get("abc") is key
+        assert cache.statistics.hits == 1
+        assert cache.statistics.misses == 1
+
+    @staticmethod
+    def test_eviction_of_least_recently_used() -> None:
+        cache = VigenereKeyCache(max_size=2)
+
+        key_abc = cache.get("abc")
+        _ignored = cache.get("def")
+        assert cache.get("abc") is key_abc
+
+        _ignored = cache.get("ghi")
+        statistics = cache.statistics
+        assert statistics.evictions == 1
+        assert statistics.size == 2
+
+        assert cache.get("abc") is key_abc
+        assert cache.statistics.misses == 3
+
+    @staticmethod
+    def test_disabled_cache() -> None:
+        cache = VigenereKeyCache(max_size=0)
+
+        assert cache.get("abc") is not cache.get("abc")
+        assert cache.statistics.size == 0
+
+    @staticmethod
+    def test_long_key_is_not_cached() -> None:
+        cache = VigenereKeyCache(max_size=2, max_key_length=8)
+        long_key = "abcdefghi"
+
+        key = cache.get(long_key)
+
+        assert cache.get(long_key) is not key
+        assert cache.statistics.size == 0
+        assert cache.get("abcdefgh") is cache.get("abcdefgh")
+
+    @staticmethod
+    def test_clear() -> None:
+        cache = VigenereKeyCache(max_size=2)
+        _ignored = cache.get("abc")
+
+        cache.clear()
+
+        assert cache.statistics.size == 0
+        assert cache.statistics.misses == 0
+
+    @staticmethod
+    @pytest.mark.raises(exception=BadKeyError)
+    def test_invalid_key_is_not_cached() -> None:
+        cache = VigenereKeyCache(max_size=2)
+        try:
+            _ignored = cache.get("a$")
+        finally:
+            assert cache.statistics.size == 0
+
+    @staticmethod
+    @pytest.mark.raises(exception=KeyTypeError)
+    def test_bad_type_key() -> None:
+        cache = VigenereKeyCache(max_size=2)
+        _ignored = cache.get(["abc"])
+
+
+def test_shared_cache() -> None:
+    key = get_vigenere_key("sharedkey")
+
+    assert vigenere_key_cache.get("sharedkey") is key
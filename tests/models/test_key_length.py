@@ -0,0 +1,123 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+from vigenere_api.models import VigenereData
+from vigenere_api.models.cryptanalysis import (
+    estimate_key_lengths,
+    get_column_histograms,
+    get_index_of_coincidence,
+    get_letter_codes,
+)
+
+
+TEXT = (
+    "Four score and seven years ago our fathers brought forth on this continent"
+    " a new nation, conceived in Liberty, and dedicated to the proposition that all"
+    " men are created equal. Now we are engaged in a great civil war, testing"
+    " whether that nation, or any nation so conceived and so dedicated,"
+    " can long endure."
+)
+
+
+class LetterCodesSuite:
+    @staticmethod
+    def test_ascii_text() -> None:
+        assert list(get_letter_codes("Hello, World!")) == [
+            7,
+            4,
+            11,
+            11,
+            14,
+            22,
+            14,
+            17,
+            11,
+            3,
+        ]
+
+    @staticmethod
+    def test_other_letters_keep_positions() -> None:
+        assert list(get_letter_codes("aé bßc 1")) == [0, 26, 1, 26, 2]
+
+
+class ColumnHistogramsSuite:
+    @staticmethod
+    def test_columns() -> None:
+        histograms = get_column_histograms(get_letter_codes("abcabd"), 3)
+
+        assert len(histograms) == 3
+        assert histograms[0][0] == 2
+        assert histograms[1][1] == 2
+        assert histograms[2][2] == histograms[2][3] == 1
+
+    @staticmethod
+    def test_other_letters_not_counted() -> None:
+        histograms = get_column_histograms(get_letter_codes("aébé"), 2)
+
+        assert sum(histograms[1]) == 0
+
+    @staticmethod
+    def test_same_result_with_numpy() -> None:
+        letter_codes = get_letter_codes(TEXT + "é")
+
+        for period in range(1, 12):
+            assert get_column_histograms(
+                letter_codes,
+                period,
+                numpy_threshold=0,
+            ) == get_column_histograms(
+                letter_codes,
+                period,
+                numpy_threshold=len(letter_codes) + 1,
+            )
+
+
+class IndexOfCoincidenceSuite:
+    @staticmethod
+    def test_same_letters() -> None:
+        assert get_index_of_coincidence([[3, 0, 0]]) == 1.0
+
+    @staticmethod
+    def test_different_letters() -> None:
+        assert get_index_of_coincidence([[1, 1, 1]]) == 0.0
+
+    @staticmethod
+    def test_without_pair() -> None:
+        assert get_index_of_coincidence([[1, 0], [0, 0]]) == 0.0
+
+
+class EstimateKeyLengthsSuite:
+    @staticmethod
+    def test_key_length_first() -> None:
+        for key in ("lemon", "crypto", "ab", "abcdefgh"):
+            content = VigenereData(content=TEXT, key=key).cipher().content
+
+            candidates = estimate_key_lengths(get_letter_codes(content))
+
+            assert candidates[0].length == len(key)
+
+    @staticmethod
+    def test_all_lengths() -> None:
+        candidates = estimate_key_lengths(get_letter_codes(TEXT), max_length=6)
+
+        assert sorted(candidate.length for candidate in candidates) == [2, 3, 4, 5, 6]
+
+    @staticmethod
+    def test_too_small_max_length() -> None:
+        candidates = estimate_key_lengths(get_letter_codes(TEXT), max_length=1)
+
+        assert [candidate.length for candidate in candidates] == [2]
@@ -0,0 +1,116 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+from vigenere_api.models import VigenereData
+from vigenere_api.models.cryptanalysis import (
+    get_column_histograms,
+    get_deciphered_histogram,
+    get_key_period,
+    get_key_shifts,
+    get_letter_codes,
+    get_letter_histogram,
+    search_keys,
+)
+
+from .test_key_length import TEXT
+
+
+class KeyShiftsSuite:
+    @staticmethod
+    def test_shifts() -> None:
+        content = VigenereData(content=TEXT, key="key").cipher().content
+        histograms = get_column_histograms(get_letter_codes(content), 3)
+
+        assert get_key_shifts(histograms) == [10, 4, 24]
+
+    @staticmethod
+    def test_same_result_with_numpy() -> None:
+        content = VigenereData(content=TEXT, key="key").cipher().content
+        histograms = get_column_histograms(get_letter_codes(content), 6)
+
+        assert get_key_shifts(histograms, numpy_threshold=0) == get_key_shifts(
+            histograms,
+            numpy_threshold=len(content),
+        )
+
+
+class KeyPeriodSuite:
+    @staticmethod
+    def test_repeated_key() -> None:
+        assert get_key_period([1, 2, 3, 1, 2, 3]) == 3
+
+    @staticmethod
+    def test_same_shifts() -> None:
+        assert get_key_period([4, 4]) == 1
+
+    @staticmethod
+    def test_not_repeated_key() -> None:
+        assert get_key_period([1, 2, 3, 1, 2]) == 5
+
+
+class DecipheredHistogramSuite:
+    @staticmethod
+    def test_deciphered_letters() -> None:
+        content = VigenereData(content=TEXT, key="key").cipher().content
+        histograms = get_column_histograms(get_letter_codes(content), 3)
+
+        histogram = get_deciphered_histogram(histograms, [10, 4, 24])
+
+        assert histogram == get_letter_histogram(TEXT)
+
+    @staticmethod
+    def test_without_column() -> None:
+        assert get_deciphered_histogram([], []) == []
+
+
+class SearchKeysSuite:
+    @staticmethod
+    def test_best_key() -> None:
+        content = VigenereData(content=TEXT, key="lemon").cipher().content
+
+        candidates = search_keys(get_letter_codes(content), range(2, 11))
+
+        assert candidates[0].key == "lemon"
+        assert candidates[0].confidence > 0.99
+        assert [candidate.score for candidate in candidates] == sorted(
+            candidate.score for candidate in candidates
+        )
+
+    @staticmethod
+    def test_multiples_merged() -> None:
+        content = VigenereData(content=TEXT, key="lemon").cipher().content
+
+        candidates = search_keys(get_letter_codes(content), [5, 10])
+
+        assert [candidate.key for candidate in candidates] == ["lemon"]
+        assert candidates[0].confidence == 1.0
+
+    @staticmethod
+    def test_key_count() -> None:
+        content = VigenereData(content=TEXT, key="lemon").cipher().content
+
+        candidates = search_keys(get_letter_codes(content), range(2, 11), key_count=2)
+
+        assert len(candidates) == 2
+        assert sum(candidate.confidence for candidate in candidates) == pytest.approx(
+            1.0,
+        )
+
+    @staticmethod
+    def test_without_length() -> None:
+        assert search_keys(get_letter_codes(TEXT), []) == []
@@ -0,0 +1,198 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from math import fsum
+
+import pytest
+
+from vigenere_api.models.cryptanalysis import (
+    count_ngrams,
+    ENGLISH_FREQUENCIES,
+    FRENCH_FREQUENCIES,
+    get_language_model,
+    get_ngram_table,
+    Language,
+    LanguageModel,
+    load_reference_model,
+    read_ngram_counts,
+    register_language_model,
+    remove_accents,
+)
+from vigenere_api.models.cryptanalysis.language import MISSING_NGRAM_COUNT
+from vigenere_api.models.errors import LanguageTypeError
+
+
+def get_total_probability(table: list[float], floor: float) -> float:
+    return fsum(10**value for value in table if value > floor)
+
+
+class RemoveAccentsSuite:
+    @staticmethod
+    def test_accents() -> None:
+        assert remove_accents("Élève, naïf, über") == "Eleve, naif, uber"
+
+    @staticmethod
+    def test_ligatures() -> None:
+        assert remove_accents("Straße, Œuvre, ex æquo") == "Strasse, OEuvre, ex aequo"
+
+
+class CountNgramsSuite:
+    @staticmethod
+    def test_cross_words() -> None:
+        assert count_ngrams("ab ab", 2) == {"AB": 2, "BA": 1}
+
+    @staticmethod
+    def test_accents_removed() -> None:
+        assert count_ngrams("été", 2) == {"ET": 1, "TE": 1}
+
+    @staticmethod
+    def test_other_letter_breaks_ngram() -> None:
+        assert count_ngrams("abψab", 2) == {"AB": 2}
+
+    @staticmethod
+    def test_short_text() -> None:
+        assert count_ngrams("abc", 4) == {}
+
+
+class NgramTableSuite:
+    @staticmethod
+    def test_size() -> None:
+        assert len(get_ngram_table({"ABC": 1}, 3)) == 26**3
+
+    @staticmethod
+    def test_probabilities() -> None:
+        table = get_ngram_table({"AB": 2, "BA": 1}, 2)
+
+        assert table[1] == pytest.approx(-0.176, abs=1e-3)
+        assert table[26] == pytest.approx(-0.477, abs=1e-3)
+        assert table[0] == pytest.approx(-2.477, abs=1e-3)
+
+    @staticmethod
+    def test_normalised() -> None:
+        table = get_ngram_table(count_ngrams("The quick brown fox", 2), 2)
+
+        assert get_total_probability(table, min(table)) == pytest.approx(1.0)
+
+    @staticmethod
+    def test_other_keys_ignored() -> None:
+        table = get_ngram_table({"ab": 1, "ABC": 5, "A1": 5, "éa": 5}, 2)
+
+        assert table[1] == pytest.approx(0.0, abs=1e-6)
+
+    @staticmethod
+    def test_empty() -> None:
+        table = get_ngram_table({}, 2)
+
+        assert min(table) == max(table) == pytest.approx(-2.0)
+
+
+class LanguageModelSuite:
+    @staticmethod
+    def test_frequencies_normalised() -> None:
+        model = LanguageModel(
+            Language.FR,
+            tuple(2 * frequency for frequency in FRENCH_FREQUENCIES),
+            {"BONJ": 1},
+        )
+
+        assert model.language == Language.FR
+        assert sum(model.frequencies) == pytest.approx(1.0)
+        assert model.unigrams[4] == pytest.approx(-0.82, abs=0.01)
+
+    @staticmethod
+    def test_tables() -> None:
+        model = LanguageModel(Language.EN, ENGLISH_FREQUENCIES, {"ET": 1, "ETET": 3})
+
+        assert model.bigrams[4 * 26 + 19] == pytest.approx(0.0, abs=1e-6)
+        assert model.quadgrams[((4 * 26 + 19) * 26 + 4) * 26 + 19] == pytest.approx(
+            0.0,
+            abs=1e-6,
+        )
+
+    @staticmethod
+    def test_repr() -> None:
+        model = LanguageModel(Language.EN, ENGLISH_FREQUENCIES, {})
+
+        assert repr(model) == "LanguageModel(<Language.EN: 'en'>)"
+
+    @staticmethod
+    @pytest.mark.raises(exception=LanguageTypeError)
+    def test_bad_language() -> None:
+        _ignored = LanguageModel("en", ENGLISH_FREQUENCIES, {})
+
+
+class RegistrySuite:
+    @staticmethod
+    @pytest.mark.parametrize("language", list(Language))
+    def test_reference_models(language: Language) -> None:
+        model = get_language_model(language)
+
+        assert model.language == language
+        assert model is get_language_model(language)
+        assert len(model.unigrams) == 26
+        assert len(model.bigrams) == 26**2
+        assert len(model.quadgrams) == 26**4
+        assert model.quadgrams.typecode == "f"
+
+    @staticmethod
+    @pytest.mark.parametrize("language", list(Language))
+    def test_reference_models_normalised(language: Language) -> None:
+        model = get_language_model(language)
+        counts = read_ngram_counts(language)
+
+        assert fsum(10**value for value in model.unigrams) == pytest.approx(1.0)
+        for table, size in ((model.bigrams, 2), (model.quadgrams, 4)):
+            total = sum(count for ngram, count in counts.items() if len(ngram) == size)
+            floor = MISSING_NGRAM_COUNT / total
+
+            assert get_total_probability(table, min(table)) == pytest.approx(
+                1.0,
+                abs=1e-4,
+            )
+            assert 10 ** min(table) == pytest.approx(floor, rel=1e-3)
+
+    @staticmethod
+    def test_common_quadgram() -> None:
+        model = get_language_model(Language.EN)
+        that = ((19 * 26 + 7) * 26 + 0) * 26 + 19
+        missing = ((25 * 26 + 16) * 26 + 23) * 26 + 9
+
+        assert model.quadgrams[that] > model.quadgrams[missing]
+
+    @staticmethod
+    def test_register() -> None:
+        model = LanguageModel(Language.DE, ENGLISH_FREQUENCIES, {"HALL": 1})
+
+        register_language_model(Language.DE, lambda: model)
+        try:
+            assert get_language_model(Language.DE) is model
+        finally:
+            register_language_model(
+                Language.DE,
+                lambda: load_reference_model(Language.DE),
+            )
+
+        assert get_language_model(Language.DE) is not model
+
+    @staticmethod
+    @pytest.mark.raises(exception=LanguageTypeError)
+    def test_get_bad_language() -> None:
+        get_language_model("en")
+
+    @staticmethod
+    @pytest.mark.raises(exception=LanguageTypeError)
+    def test_register_bad_language() -> None:
+        register_language_model("en", lambda: load_reference_model(Language.EN))
@@ -0,0 +1,67 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+from vigenere_api.models.helpers import get_shift_table, move_char
+from vigenere_api.models.helpers.errors import HelperKeyTypeError
+
+
+def _move_text(text: str, key: int) -> str:
+    result = ""
+    for char in text:
+        if char.isalpha():
+            result += move_char(char, key, "A" if char.isupper() else "a")
+        else:
+            result += char
+
+    return result
+
+
+def test_ascii_text() -> None:
+    text = "Hello World! 0123456789 _-+*/"
+
+    assert text.translate(get_shift_table(1)) == "Ifmmp Xpsme! 0123456789 _-+*/"
+
+
+def test_same_table_for_equivalent_keys() -> None:
+    assert get_shift_table(1) is get_shift_table(27)
+    assert get_shift_table(-1) is get_shift_table(25)
+
+
+@pytest.mark.parametrize("key", [0, 1, 13, 25, 26, -1, -27, 1000])
+def test_same_result_as_move_char(key: int) -> None:
+    text = "AbCdEfGhIjKlMnOpQrStUvWxYz, éàÉß ǅ ª 中文 ١٢٣ 𝔸𝔹!"
+
+    assert text.translate(get_shift_table(key)) == _move_text(text, key)
+
+
+def test_not_letters_not_kept() -> None:
+    table = get_shift_table(3)
+    text = "".join(map(chr, range(0x2000, 0x2100))) + "\U0001f600"
+    size = len(table)
+
+    moved_text = text.translate(table)
+
+    assert moved_text == _move_text(text, 3)
+    assert len(table) == size + sum(map(str.isalpha, text))
+    assert 0x2000 not in table
+    assert 0x1F600 not in table
+
+
+@pytest.mark.raises(exception=HelperKeyTypeError)
+def test_bad_type_key() -> None:
+    _ignored = get_shift_table("a")
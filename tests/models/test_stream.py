@@ -0,0 +1,203 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+from vigenere_api.models import (
+    BaseStream,
+    CaesarData,
+    CaesarStream,
+    VigenereData,
+    VigenereStream,
+)
+from vigenere_api.models.errors import ChunkTypeError, FinalizedStreamError
+from vigenere_api.models.helpers.errors import (
+    BadKeyError,
+    BufferTypeError,
+    KeyTypeError,
+    TooLongKeyError,
+)
+
+
+TEXT = "Ça va être l'été, Hello World! 1234 中文"
+
+
+def split(text: str, size: int) -> list[str]:
+    return [text[index : index + size] for index in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 100])
+def test_vigenere_stream_same_as_data(size: int) -> None:
+    stream = VigenereStream("AbCd")
+    moved = "".join(stream.update(chunk) for chunk in split(TEXT, size))
+
+    assert (
+        moved + stream.finalize()
+        == VigenereData(content=TEXT, key="AbCd").cipher().content
+    )
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 100])
+def test_vigenere_stream_decipher(size: int) -> None:
+    stream = VigenereStream("AbCd", decipher=True)
+    moved = "".join(stream.update(chunk) for chunk in split(TEXT, size))
+
+    expected = VigenereData(content=TEXT, key="AbCd").decipher().content
+    assert moved + stream.finalize() == expected
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 100])
+def test_caesar_stream_same_as_data(size: int) -> None:
+    stream = CaesarStream(3)
+    moved = "".join(stream.update(chunk) for chunk in split(TEXT, size))
+
+    assert moved + stream.finalize() == CaesarData(content=TEXT, key=3).cipher().content
+
+
+def test_caesar_stream_decipher() -> None:
+    stream = CaesarStream("d", decipher=True)
+
+    assert stream.update("Khoor") + stream.finalize() == "Hello"
+
+
+def test_vigenere_stream_offset() -> None:
+    stream = VigenereStream("abc")
+    stream.update("ab, c")
+
+    assert stream.offset == 0
+    stream.update("d")
+    assert stream.offset == 1
+
+
+def test_bytes_split_inside_character() -> None:
+    data = TEXT.encode()
+    stream = VigenereStream("AbCd")
+    moved = "".join(
+        stream.update(data[index : index + 1]) for index in range(len(data))
+    )
+
+    assert (
+        moved + stream.finalize()
+        == VigenereData(content=TEXT, key="AbCd").cipher().content
+    )
+
+
+def test_invalid_bytes_are_kept() -> None:
+    stream = CaesarStream(1)
+    moved = stream.update(b"ab\xff") + stream.finalize()
+
+    assert moved.encode("utf-8", "surrogateescape") == b"bc\xff"
+
+
+def test_finalize_returns_incomplete_character() -> None:
+    stream = VigenereStream("abc")
+
+    assert stream.update(b"ab\xc3") == "ac"
+    assert stream.finalize().encode("utf-8", "surrogateescape") == b"\xc3"
+
+
+def test_update_after_finalize() -> None:
+    stream = VigenereStream("abc")
+    stream.finalize()
+
+    assert stream.finalized
+    with pytest.raises(FinalizedStreamError, match="The stream is finalized."):
+        stream.update("abc")
+
+    with pytest.raises(FinalizedStreamError):
+        stream.finalize()
+
+
+def test_bad_chunk_type() -> None:
+    stream = CaesarStream(1)
+
+    with pytest.raises(ChunkTypeError, match="The chunk is 'int'."):
+        stream.update(1)
+
+
+def test_bad_keys() -> None:
+    with pytest.raises(BadKeyError):
+        CaesarStream("1")
+
+    with pytest.raises(TooLongKeyError):
+        CaesarStream("ab")
+
+    with pytest.raises(KeyTypeError):
+        CaesarStream(1.0)
+
+    with pytest.raises(KeyTypeError):
+        VigenereStream(1)
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 100])
+def test_update_bytes_same_as_update(size: int) -> None:
+    data = TEXT.encode() + b"\xff Hello"
+    stream = VigenereStream("AbCd")
+    moved = b"".join(
+        stream.update_bytes(data[index : index + size])
+        for index in range(0, len(data), size)
+    )
+
+    expected = VigenereStream("AbCd")
+    assert moved + stream.finalize_bytes() == (
+        expected.update(data) + expected.finalize()
+    ).encode("utf-8", "surrogateescape")
+
+
+def test_update_bytes_ascii() -> None:
+    stream = CaesarStream("b", decipher=True)
+
+    assert stream.update_bytes(memoryview(b"Ifmmp ")) == b"Hello "
+    assert stream.update_bytes(bytearray(b"Xpsme")) == b"World"
+    assert stream.finalize_bytes() == b""
+
+
+def test_update_bytes_after_finalize() -> None:
+    stream = CaesarStream(1)
+    stream.finalize_bytes()
+
+    with pytest.raises(FinalizedStreamError):
+        stream.update_bytes(b"abc")
+
+
+def test_update_bytes_bad_chunk_type() -> None:
+    with pytest.raises(ChunkTypeError):
+        VigenereStream("abc").update_bytes("abc")
+
+
+def test_update_bytes_memoryview_non_ascii() -> None:
+    stream = VigenereStream("AbCd")
+    text = "Héllo Wörld"
+
+    assert stream.update_bytes(memoryview(text.encode())) == (
+        VigenereData(content=text, key="AbCd").cipher().content.encode()
+    )
+
+
+def test_update_bytes_not_contiguous_memoryview() -> None:
+    with pytest.raises(BufferTypeError):
+        VigenereStream("abc").update_bytes(memoryview(b"abcd")[::2])
+
+
+def test_base_stream_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        BaseStream()
+
+
+def test_update_bytes_single_copy() -> None:
+    stream = CaesarStream(1)
+
+    assert stream.update_bytes(b"Hello") == bytearray(b"Ifmmp")
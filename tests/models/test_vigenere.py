@@ -17,7 +17,7 @@
 """Vigenere model tests."""
 
 import pytest
-from pydantic import ValidationError
+from pydantic import validate_model, ValidationError
 
 from vigenere_api.models import VigenereData
 from vigenere_api.models.errors import (
@@ -25,6 +25,7 @@ from vigenere_api.models.errors import (
     AlgorithmOperationTypeError,
     AlgorithmTextTypeError,
 )
+from vigenere_api.models.helpers import vigenere_key_cache
 from vigenere_api.models.vigenere import VigenereKey, VigenereOperation
 
 
@@ -92,6 +93,24 @@ class CtorSuite:
         key = "$z"
         _ignored_data = VigenereData(content=text, key=key)
 
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_extra_field() -> None:
+        _ignored_data = VigenereData(content="Test", key="zz", other=2)
+
+    @staticmethod
+    def test_fast_path_same_as_validation() -> None:
+        data = VigenereData(key="éz", content="Test")
+        values, fields_set, error = validate_model(
+            VigenereData,
+            {"key": "éz", "content": "Test"},
+        )
+
+        assert error is None
+        assert data.dict() == values
+        assert list(data.dict()) == ["content", "key"]
+        assert data.__fields_set__ == fields_set
+
 
 class OperationSuite:
     class CipherSuite:
@@ -337,6 +356,26 @@ class OperationSuite:
                 assert deciphered1.content == deciphered2.content == deciphered3.content
 
 
+class ResultSuite:
+    @staticmethod
+    def test_result_equals_validated_model() -> None:
+        data = VigenereData(content="Test", key="bb")
+
+        assert data.cipher() == VigenereData(content="Uftu", key="bb")
+        assert data.cipher().__fields_set__ == {"content", "key"}
+
+    @staticmethod
+    def test_key_compiled_once() -> None:
+        data = VigenereData(content="Test", key="ResultSuiteKey")
+        statistics = vigenere_key_cache.statistics
+
+        _ignored = data.cipher()
+
+        new_statistics = vigenere_key_cache.statistics
+        lookups = statistics.hits + statistics.misses
+        assert new_statistics.hits + new_statistics.misses == lookups + 1
+
+
 class InternalSuite:
     class AlgorithmSuite:
         algo_func = VigenereData._VigenereData__algorithm
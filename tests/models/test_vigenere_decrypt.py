@@ -0,0 +1,137 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+"""Vigenere decrypt model tests."""
+
+import pytest
+from pydantic import ValidationError
+
+from vigenere_api.models import CaesarData, Language, VigenereData, VigenereDecryptData
+
+from .test_key_length import TEXT
+
+
+FRENCH_TEXT = (
+    "Les hommes naissent et demeurent libres et egaux en droits."
+    " Les distinctions sociales ne peuvent etre fondees que sur l'utilite commune."
+) * 2
+
+
+class CtorSuite:
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_without_letter() -> None:
+        _ignored_data = VigenereDecryptData(content="éà 123")
+
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_with_key() -> None:
+        _ignored_data = VigenereDecryptData(content="Test", key="ab")
+
+
+class LanguageSuite:
+    @staticmethod
+    def test_english_by_default() -> None:
+        assert VigenereDecryptData(content="Test").language == Language.EN
+
+    @staticmethod
+    def test_language_code() -> None:
+        data = VigenereDecryptData(content="Test", language="fr")
+
+        assert data.language == Language.FR
+
+    @staticmethod
+    def test_language_object() -> None:
+        data = VigenereDecryptData(content="Test", language=Language.DE)
+
+        assert data.language == Language.DE
+
+    @staticmethod
+    @pytest.mark.raises(exception=ValidationError)
+    def test_unknown_language() -> None:
+        _ignored_data = VigenereDecryptData(content="Test", language="es")
+
+    @staticmethod
+    def test_french_frequencies() -> None:
+        content = VigenereData(content=FRENCH_TEXT, key="lemon").cipher().content
+
+        english_result = VigenereDecryptData(content=content).decrypt()
+        french_result = VigenereDecryptData(
+            content=content,
+            language=Language.FR,
+        ).decrypt()
+
+        assert english_result.candidates[0].key != "lemon"
+        assert french_result.candidates[0].key == "lemon"
+        assert french_result.content == FRENCH_TEXT
+
+
+class DecryptSuite:
+    @staticmethod
+    def test_key_length() -> None:
+        content = VigenereData(content=TEXT, key="lemon").cipher().content
+
+        result = VigenereDecryptData(content=content).decrypt()
+
+        assert result.key_lengths[0].length == 5
+        assert result.candidates[0].key == "lemon"
+        assert result.content == TEXT
+
+    @staticmethod
+    def test_caesar_content() -> None:
+        content = CaesarData(content=TEXT, key=3).cipher().content
+
+        result = VigenereDecryptData(content=content).decrypt()
+
+        assert result.candidates[0].key == "dd"
+        assert result.content == TEXT
+
+    @staticmethod
+    def test_key_count() -> None:
+        content = VigenereData(content=TEXT, key="lemon").cipher().content
+
+        result = VigenereDecryptData(content=content).decrypt(key_count=3)
+
+        assert len(result.candidates) == 3
+        assert sum(candidate.confidence for candidate in result.candidates) == (
+            pytest.approx(1.0)
+        )
+
+    @staticmethod
+    def test_letters_after_sample() -> None:
+        content = (
+            "1234 " * 10 + VigenereData(content=TEXT, key="lemon").cipher().content
+        )
+
+        result = VigenereDecryptData(content=content).decrypt(sample_size=10)
+
+        assert result.candidates[0].key == "lemon"
+        assert result.content == "1234 " * 10 + TEXT
+
+    @staticmethod
+    def test_beginning_of_large_content() -> None:
+        content = VigenereData(content=TEXT * 100, key="lemon").cipher().content
+
+        result = VigenereDecryptData(content=content).decrypt(
+            sample_size=len(TEXT) * 4,
+            max_key_length=8,
+        )
+
+        assert result.key_lengths[0].length == 5
+        assert len(result.key_lengths) == 7
+        assert result.candidates[0].key == "lemon"
+        assert result.content == TEXT * 100
@@ -0,0 +1,198 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from vigenere_api.models.helpers import (
+    apply_shifts,
+    count_letters,
+    disable_parallel_engine,
+    shutdown_process_pool,
+)
+from vigenere_api.models.helpers.vigenere_engine import (
+    _numpy_engine,
+    _ProcessPool,
+    _python_engine,
+    HAS_NUMPY,
+)
+
+
+TEXTS = (
+    "Hello World!",
+    "AbCdEfGhIjKlMnOpQrStUvWxYz 0123456789 +-*/",
+    "Ça va être l'été, ß ǅ ª 中文 ١٢٣ 𝔸𝔹!",
+    "1234 !?",
+)
+SHIFTS = ([0, 1], [3, 1, 4, 1, 5], [-1, 27, 13], [25])
+
+needs_numpy = pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed.")
+
+
+def test_python_engine() -> None:
+    assert _python_engine("teSt uio", [19, 4, 18, 19]) == "miKm nmg"
+
+
+def test_non_alpha_does_not_consume_shift() -> None:
+    assert _python_engine("a, a. a", [0, 1]) == "a, b. a"
+
+
+@needs_numpy
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("shifts", SHIFTS)
+def test_numpy_engine_same_as_python(text: str, shifts: list[int]) -> None:
+    assert _numpy_engine(text, shifts) == _python_engine(text, shifts)
+
+
+@needs_numpy
+def test_numpy_engine_with_large_text() -> None:
+    text = "".join(TEXTS) * 1000
+
+    assert _numpy_engine(text, [3, 1, 4]) == _python_engine(text, [3, 1, 4])
+
+
+@pytest.mark.parametrize("threshold", [0, 1, 10_000])
+def test_apply_shifts_with_threshold(threshold: int) -> None:
+    assert apply_shifts("teSt uio", [19, 4, 18, 19], threshold) == "miKm nmg"
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_count_letters(text: str) -> None:
+    assert count_letters(text) == sum(char.isalpha() for char in text)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("threshold", [0, 10_000])
+def test_apply_shifts_with_offset(text: str, threshold: int) -> None:
+    shifts = [3, 1, 4, 1, 5]
+    middle = len(text) // 2
+    first_part = apply_shifts(text[:middle], shifts, threshold)
+    second_part = apply_shifts(
+        text[middle:],
+        shifts,
+        threshold,
+        offset=count_letters(text[:middle]),
+    )
+
+    assert first_part + second_part == apply_shifts(text, shifts, threshold)
+
+
+@pytest.mark.parametrize("nb_workers", [2, 3])
+@pytest.mark.parametrize("threshold", [0, 10_000])
+@pytest.mark.parametrize("offset", [0, 3])
+def test_parallel_engine_same_as_serial(
+    nb_workers: int,
+    threshold: int,
+    offset: int,
+) -> None:
+    text = "".join(TEXTS) * 100
+    shifts = [3, 1, 4, 1, 5]
+
+    try:
+        parallel_text = apply_shifts(
+            text,
+            shifts,
+            threshold,
+            offset,
+            parallel_threshold=0,
+            nb_workers=nb_workers,
+        )
+    finally:
+        shutdown_process_pool()
+
+    assert parallel_text == apply_shifts(text, shifts, threshold, offset, nb_workers=1)
+
+
+def test_other_number_of_workers() -> None:
+    text = "".join(TEXTS)
+    expected = apply_shifts(text, [1, 2], nb_workers=1)
+    try:
+        assert apply_shifts(text, [1, 2], parallel_threshold=0, nb_workers=2) == (
+            expected
+        )
+        assert apply_shifts(text, [1, 2], parallel_threshold=0, nb_workers=3) == (
+            expected
+        )
+        assert apply_shifts(text, [1, 2], parallel_threshold=0, nb_workers=2) == (
+            expected
+        )
+    finally:
+        shutdown_process_pool()
+
+
+def test_other_number_of_workers_in_threads() -> None:
+    text = "".join(TEXTS)
+    expected = apply_shifts(text, [1, 2], nb_workers=1)
+    try:
+        with ThreadPoolExecutor(4) as executor:
+            results = list(
+                executor.map(
+                    lambda nb_workers: apply_shifts(
+                        text,
+                        [1, 2],
+                        parallel_threshold=0,
+                        nb_workers=nb_workers,
+                    ),
+                    [2, 3, 2, 3, 2, 3],
+                ),
+            )
+    finally:
+        shutdown_process_pool()
+
+    assert results == [expected] * 6
+
+
+def test_disabled_parallel_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    process_pool = _ProcessPool()
+    monkeypatch.setattr(
+        "vigenere_api.models.helpers.vigenere_engine._process_pool",
+        process_pool,
+    )
+
+    def fail(nb_workers: int, *_args: Any) -> None:
+        pytest.fail(f"A pool of {nb_workers} processes was started.")
+
+    monkeypatch.setattr(process_pool, "submit_map", fail)
+    disable_parallel_engine()
+    text = "".join(TEXTS)
+
+    assert apply_shifts(text, [1, 2], parallel_threshold=0, nb_workers=2) == (
+        apply_shifts(text, [1, 2], nb_workers=1)
+    )
+
+
+def test_process_pool_is_not_forked(monkeypatch: pytest.MonkeyPatch) -> None:
+    start_methods = []
+
+    class Executor(ProcessPoolExecutor):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            start_methods.append(kwargs["mp_context"].get_start_method())
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(
+        "vigenere_api.models.helpers.vigenere_engine.ProcessPoolExecutor",
+        Executor,
+    )
+    process_pool = _ProcessPool()
+    try:
+        results = process_pool.submit_map(2, str.upper, ["a"])
+
+        assert list(results) == ["A"]
+        assert start_methods == ["forkserver"]
+    finally:
+        process_pool.shutdown()
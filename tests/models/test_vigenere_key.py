@@ -14,8 +14,11 @@
 #  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+from string import ascii_letters
+
 import pytest
 
+from vigenere_api.models.helpers import convert_key
 from vigenere_api.models.helpers.errors import (
     BadKeyError,
     EmptyKeyError,
@@ -59,31 +62,40 @@ class CtorSuite:
         _ignored_data = VigenereKey(key)
 
 
-def test_next() -> None:
-    key = "abcd"
+def test_shifts() -> None:
+    key = "abcZ"
     data = VigenereKey(key)
 
-    assert data._VigenereKey__key == key
-    assert len(data) == len(key)
+    assert data.cipher_shifts == (0, 1, 2, 25)
+    assert data.decipher_shifts == (0, 25, 24, 1)
 
-    for char in key:
-        assert next(data) == char
 
-    assert next(data) == key[0]
+@pytest.mark.parametrize("key", [ascii_letters, "ÇaÉtéÀß", "Straße中文"])
+def test_shifts_same_as_convert_key(key: str) -> None:
+    data = VigenereKey(key)
 
+    cipher_shifts = tuple(convert_key(char) % 26 for char in key)
+    assert data.cipher_shifts == cipher_shifts
+    assert data.decipher_shifts == tuple(-shift % 26 for shift in cipher_shifts)
+
+
+def test_equality_between_keys() -> None:
+    key1 = VigenereKey("abcd")
+    key2 = VigenereKey("ABcD")
+    key3 = VigenereKey("abce")
+
+    assert key1 == key2
+    assert hash(key1) == hash(key2)
+    assert key1 != key3
+    assert key1 != "abcd"
 
-def test_increase_index() -> None:
-    key = "abcd"
-    data = VigenereKey(key)
 
-    assert data._VigenereKey__key == key
-    assert len(data) == len(key)
+def test_shared_key() -> None:
+    data = VigenereKey("abcd")
 
-    assert data._VigenereKey__index == 0
-    data._VigenereKey__increase_index()
-    assert data._VigenereKey__index == 1
+    assert data.cipher_shifts is data.cipher_shifts
+    assert {data: 1}[VigenereKey("abcd")] == 1
 
-    for _ in range(len(data)):
-        data._VigenereKey__increase_index()
 
-    assert data._VigenereKey__index == 1
+def test_repr() -> None:
+    assert repr(VigenereKey("abcd")) == "VigenereKey('abcd')"
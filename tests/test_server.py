@@ -0,0 +1,83 @@
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#  Vigenere-API                                                                        +
+#  Copyright (C) 2023 Axel DAVID                                                       +
+#                                                                                      +
+#  This program is free software: you can redistribute it and/or modify it under       +
+#  the terms of the GNU General Public License as published by the Free Software       +
+#  Foundation, either version 3 of the License, or (at your option) any later version. +
+#                                                                                      +
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY     +
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR       +
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.          +
+#                                                                                      +
+#  You should have received a copy of the GNU General Public License along with        +
+#  this program.  If not, see <https://www.gnu.org/licenses/>.                         +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import socket
+
+import pytest
+
+from vigenere_api.api import application
+from vigenere_api.server import (
+    _create_config,
+    _create_reuse_port_socket,
+    HAS_REUSE_PORT,
+    HAS_UVLOOP,
+    ServerOptions,
+)
+
+
+def test_default_options() -> None:
+    options = ServerOptions()
+
+    assert options.host == "127.0.0.1"
+    assert options.port == 8080
+    assert options.workers == 1
+
+
+def test_config_of_one_worker() -> None:
+    config = _create_config(ServerOptions(limit_concurrency=0))
+
+    assert config.app is application
+    assert config.workers == 1
+    assert config.limit_concurrency is None
+
+
+def test_config_of_several_workers() -> None:
+    options = ServerOptions(
+        host="0.0.0.0",
+        port=80,
+        workers=4,
+        backlog=4096,
+        keep_alive=10,
+        limit_concurrency=100,
+    )
+    config = _create_config(options)
+
+    assert config.app == "vigenere_api.api:application"
+    assert (config.host, config.port) == ("0.0.0.0", 80)
+    assert config.workers == 4
+    assert config.backlog == 4096
+    assert config.timeout_keep_alive == 10
+    assert config.limit_concurrency == 100
+
+
+@pytest.mark.skipif(not HAS_REUSE_PORT, reason="SO_REUSEPORT is not supported.")
+def test_reuse_port_sockets_share_the_port() -> None:
+    first_socket = _create_reuse_port_socket(ServerOptions(port=0))
+    port = first_socket.getsockname()[1]
+    second_socket = _create_reuse_port_socket(ServerOptions(port=port))
+
+    try:
+        assert second_socket.getsockname()[1] == port
+        assert second_socket.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+    finally:
+        first_socket.close()
+        second_socket.close()
+
+
+@pytest.mark.skipif(not HAS_UVLOOP, reason="uvloop is not installed.")
+def test_config_with_performance() -> None:
+    assert _create_config(ServerOptions(performance=True)).loop == "uvloop"
+    assert _create_config(ServerOptions(performance=False)).loop == "asyncio"